@@ -0,0 +1,104 @@
+"""
+Fine Use Benchmark - PyQt Button Grid Construction
+==================================================
+
+Builds a 50x50 FineUseButtonGrid in a shown window three ways:
+
+- legacy: one add_button() per button, stretch updated on every call
+- add_buttons(): one call, layout activation and repaints suspended
+- set_layout(): re-lays out the existing 2,500 buttons as 25x100
+
+Reports build time (until the event loop is idle) and how many
+geometry passes the grid layout ran. Uses the offscreen Qt platform
+when no display is available.
+
+Run with: python benchmarks/bench_button_grid.py
+"""
+
+import sys
+import os
+import time
+
+# Add parent directory for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+if not os.environ.get('DISPLAY') and sys.platform not in ('win32', 'darwin'):
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from fine_use_pyqt import FineUseApp, FineUseButton, FineUseButtonGrid, QEvent
+
+ROWS = COLS = 50
+VARIANTS = ('primary', 'secondary', 'success', 'warning', 'error', 'info')
+
+
+class LegacyButtonGrid(FineUseButtonGrid):
+    """The previous add_button: position, addWidget and stretch per call"""
+
+    def add_button(self, text, variant="secondary", callback=None):
+        button = FineUseButton(text, variant, parent=self)
+        if callback:
+            button.clicked.connect(callback)
+        row = len(self.buttons) // self.cols
+        col = len(self.buttons) % self.cols
+        self.grid_layout.addWidget(button, row, col)
+        self.grid_layout.setRowStretch(row, 1)
+        self.grid_layout.setColumnStretch(col, 1)
+        self.buttons.append(button)
+        return button
+
+
+def specs():
+    return [(f"B{i}", VARIANTS[i % len(VARIANTS)]) for i in range(ROWS * COLS)]
+
+
+def new_grid(app, grid_class):
+    grid = grid_class()
+    grid.set_layout(None, COLS)
+    grid.resize(2400, 1600)
+    grid.show()
+    app.processEvents()
+    grid.grid_layout.relayouts = 0
+    return grid
+
+
+def timed(app, grid, action):
+    start = time.perf_counter()
+    action()
+    app.processEvents()
+    return time.perf_counter() - start, grid.relayouts
+
+
+def dispose(app, grid):
+    grid.close()
+    grid.deleteLater()
+    app.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+
+
+def main():
+    app = FineUseApp()
+
+    print("Fine Use Button Grid Benchmark")
+    print("=" * 60)
+    print(f"Grid: {ROWS}x{COLS} ({ROWS * COLS:,} buttons)")
+
+    grid = new_grid(app, LegacyButtonGrid)
+    legacy = timed(app, grid, lambda: [grid.add_button(text, variant) for text, variant in specs()])
+    dispose(app, grid)
+
+    grid = new_grid(app, FineUseButtonGrid)
+    bulk = timed(app, grid, lambda: grid.add_buttons(specs()))
+    grid.grid_layout.relayouts = 0
+    relayout = timed(app, grid, lambda: grid.set_layout(25, 100))
+    dispose(app, grid)
+
+    for label, (elapsed, relayouts) in (
+        ("add_button x2500", legacy),
+        ("add_buttons", bulk),
+        ("set_layout 25x100", relayout),
+    ):
+        print(f"{label:<20} {elapsed * 1000:8.1f} ms   {relayouts:5d} relayouts")
+    print(f"add_buttons speedup: {legacy[0] / bulk[0]:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Fine Use Benchmark - PyQt Button Size Styling
+=============================================
+
+Builds 5,000 FineUseButtons in a shown window and times construction
+and a full theme switch (github-dark -> amber) with:
+
+- per-button stylesheets (the previous setStyleSheet padding rule)
+- size dynamic properties matched by the app stylesheet (current)
+
+Runs on the offscreen Qt platform when no display is available.
+
+Run with: python benchmarks/bench_button_styles.py
+"""
+
+import sys
+import os
+import time
+
+# Add parent directory for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+if not os.environ.get('DISPLAY') and sys.platform not in ('win32', 'darwin'):
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from fine_use_core import fine_use, FineUseTheme, get_spacing
+from fine_use_pyqt import FineUseApp, FineUseButton, QWidget, QGridLayout, QScrollArea, QEvent
+
+BUTTONS = 5000
+COLUMNS = 50
+VARIANTS = ('primary', 'secondary', 'success', 'warning', 'error', 'info')
+PADDING = {'sm': 'xs', 'md': 'md', 'lg': 'lg', 'xl': 'xl'}
+
+
+class LegacyButton(FineUseButton):
+    """FineUseButton plus the per-instance padding stylesheet it used to set"""
+
+    def __init__(self, text, variant, size):
+        super().__init__(text, variant, size)
+        padding = get_spacing(PADDING[size])
+        self.setStyleSheet(f"padding: {padding}px {padding * 2}px;")
+
+
+def run(app, button_class):
+    fine_use.set_theme(FineUseTheme.GITHUB_DARK)
+    scroll = QScrollArea()
+    container = QWidget()
+    grid = QGridLayout(container)
+
+    start = time.perf_counter()
+    for i in range(BUTTONS):
+        size = FineUseButton.SIZES[i % len(FineUseButton.SIZES)]
+        grid.addWidget(button_class(f"B{i}", VARIANTS[i % len(VARIANTS)], size), i // COLUMNS, i % COLUMNS)
+    scroll.setWidget(container)
+    scroll.show()
+    app.processEvents()
+    construct = time.perf_counter() - start
+
+    start = time.perf_counter()
+    fine_use.set_theme(FineUseTheme.AMBER)
+    app.processEvents()
+    switch = time.perf_counter() - start
+
+    scroll.close()
+    scroll.deleteLater()
+    app.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+    return construct, switch
+
+
+def main():
+    app = FineUseApp()
+
+    print("Fine Use PyQt Button Styling Benchmark")
+    print("=" * 60)
+    print(f"Buttons: {BUTTONS:,}")
+    legacy = run(app, LegacyButton)
+    current = run(app, FineUseButton)
+    for label, (construct, switch) in (("per-button stylesheet", legacy), ("size property", current)):
+        print(f"{label:<22} construct {construct * 1000:8.1f} ms   theme switch {switch * 1000:8.1f} ms")
+    print(f"speedup                construct {legacy[0] / current[0]:8.1f}x     theme switch {legacy[1] / current[1]:8.1f}x")
+
+    fine_use.set_theme(FineUseTheme.GITHUB_DARK)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Fine Use Benchmark - Batch Color Math
+=====================================
+
+Compares per-color Python loops (FineUse.hex_to_rgb + manual math)
+against the vectorized fine_use_colormath engine on a large batch of
+theme tokens.
+
+Run with: python benchmarks/bench_colormath.py
+"""
+
+import sys
+import os
+import time
+
+# Add parent directory for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fine_use_core import fine_use, THEME_PALETTES, TOKEN_NAMES
+from fine_use_colormath import hex_to_rgb, rgb_to_hex, blend, contrast_ratio, derive_state_colors
+
+REPEAT = 1000  # every token of every theme, repeated -> 110,000 colors
+
+
+def _linear(channel):
+    c = channel / 255.0
+    return c / 12.92 if c <= 0.04045 else ((c + 0.055) / 1.055) ** 2.4
+
+
+def _luminance(rgb):
+    r, g, b = (_linear(c) for c in rgb)
+    return 0.2126 * r + 0.7152 * g + 0.0722 * b
+
+
+def loop_pipeline(hexes, backgrounds):
+    """Blend 50% over background and contrast-check, one color at a time"""
+    out = []
+    for fg_hex, bg_hex in zip(hexes, backgrounds):
+        fg = fine_use.hex_to_rgb(fg_hex)
+        bg = fine_use.hex_to_rgb(bg_hex)
+        mixed = tuple(round(f * 0.5 + b * 0.5) for f, b in zip(fg, bg))
+        la, lb = _luminance(mixed), _luminance(bg)
+        ratio = (max(la, lb) + 0.05) / (min(la, lb) + 0.05)
+        out.append(('#%02x%02x%02x' % mixed, ratio))
+    return out
+
+
+def batch_pipeline(hexes, backgrounds):
+    """The same pipeline on whole arrays"""
+    fg = hex_to_rgb(hexes)
+    bg = hex_to_rgb(backgrounds)
+    mixed = blend(fg, bg, 0.5)
+    return rgb_to_hex(mixed), contrast_ratio(mixed, bg)
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    hexes = [p[token] for p in THEME_PALETTES.values() for token in TOKEN_NAMES] * REPEAT
+    backgrounds = [p['bg'] for p in THEME_PALETTES.values() for _ in TOKEN_NAMES] * REPEAT
+
+    print("Fine Use Batch Color Math Benchmark")
+    print("=" * 56)
+    print(f"Colors per run: {len(hexes):,}")
+
+    loop = timed(loop_pipeline, hexes, backgrounds)
+    batch = timed(batch_pipeline, hexes, backgrounds)
+    print(f"blend + contrast (loop):   {loop * 1000:9.1f} ms")
+    print(f"blend + contrast (batch):  {batch * 1000:9.1f} ms  ({loop / batch:.1f}x)")
+
+    start = time.perf_counter()
+    table = derive_state_colors()
+    elapsed = time.perf_counter() - start
+    print(
+        f"hover/disabled for {len(table.themes)} themes x {len(table.variants)} variants: "
+        f"{elapsed * 1000:.2f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
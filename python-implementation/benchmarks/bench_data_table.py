@@ -0,0 +1,109 @@
+"""
+Fine Use Benchmark - Virtualized Data Table
+===========================================
+
+Opens a service table (id, name, status, cpu, memory) and scrolls
+through it, comparing QTableWidget (one item object per cell) with
+FineUseDataTable (columnar QAbstractTableModel + status delegate).
+
+Reports open time (constructed and first paint), time for 100 scroll
+jumps with repaint, and resident memory growth. Each case runs in its
+own process on the offscreen Qt platform when no display is available.
+
+Run with: python benchmarks/bench_data_table.py
+"""
+
+import sys
+import os
+import subprocess
+import time
+from array import array
+
+# Add parent directory for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+CASES = [
+    ('QTableWidget', 100_000),
+    ('FineUseDataTable', 100_000),
+    ('FineUseDataTable', 1_000_000),
+]
+SCROLL_JUMPS = 100
+STATUSES = ('online', 'degraded', 'offline', 'pending', 'operational')
+
+
+def rss_kib():
+    """Current resident set size in KiB (Linux), else peak RSS"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') // 1024
+    except OSError:
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def make_columns(rows):
+    return {
+        'service_id': range(rows),
+        'name': [f"svc-{i:07d}" for i in range(rows)],
+        'status': [STATUSES[i % len(STATUSES)] for i in range(rows)],
+        'cpu': array('d', (float(i * 7 % 100) for i in range(rows))),
+        'memory': array('d', (float(i * 13 % 100) for i in range(rows))),
+    }
+
+
+def run_case(kind, rows):
+    """Measure one case in this process, print 'open scroll rss_mib'"""
+    from fine_use_pyqt import FineUseApp, FineUseDataTable, QTableWidget, QTableWidgetItem
+
+    app = FineUseApp()
+    columns = make_columns(rows)
+    app.processEvents()
+    base_rss = rss_kib()
+
+    start = time.perf_counter()
+    if kind == 'QTableWidget':
+        table = QTableWidget(rows, len(columns))
+        table.setHorizontalHeaderLabels([name.upper() for name in columns])
+        for col, values in enumerate(columns.values()):
+            for row in range(rows):
+                table.setItem(row, col, QTableWidgetItem(str(values[row])))
+    else:
+        table = FineUseDataTable(columns, color_coded_columns=('cpu', 'memory'))
+    table.resize(1200, 800)
+    table.show()
+    app.processEvents()
+    opened = time.perf_counter() - start
+
+    scrollbar = table.verticalScrollBar()
+    start = time.perf_counter()
+    for i in range(SCROLL_JUMPS):
+        scrollbar.setValue(scrollbar.maximum() * i // SCROLL_JUMPS)
+        table.viewport().repaint()
+    scrolled = time.perf_counter() - start
+
+    print(f"{opened * 1000:.1f} {scrolled * 1000:.1f} {(rss_kib() - base_rss) / 1024:.1f}")
+
+
+def main():
+    if len(sys.argv) == 4 and sys.argv[1] == '--case':
+        run_case(sys.argv[2], int(sys.argv[3]))
+        return
+
+    env = dict(os.environ)
+    if not env.get('DISPLAY') and sys.platform not in ('win32', 'darwin'):
+        env.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+    print("Fine Use Data Table Benchmark")
+    print("=" * 70)
+    print(f"{'table':<18} {'rows':>10} {'open':>12} {f'{SCROLL_JUMPS} scrolls':>14} {'memory':>11}")
+    for kind, rows in CASES:
+        output = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), '--case', kind, str(rows)],
+            env=env, capture_output=True, text=True, check=True
+        ).stdout.split()
+        opened, scrolled, memory = (float(value) for value in output[-3:])
+        print(f"{kind:<18} {rows:>10,} {opened:9.1f} ms {scrolled:11.1f} ms {memory:7.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
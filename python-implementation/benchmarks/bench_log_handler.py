@@ -0,0 +1,126 @@
+"""
+Fine Use Benchmark - Logging Handler
+====================================
+
+Streams logging records through FineUseLogHandler to a no-op sink that
+a simulated UI thread drains every 16 ms:
+
+- emit cost: one thread logging 200,000 records, compared with the
+  standard library QueueHandler on an unbounded SimpleQueue
+- flood: 4 producer threads logging 200,000 records each as fast as
+  they can, per drop policy - records/s accepted, records dropped, the
+  most records ever waiting (the memory bound) and the UI thread's
+  time per drain
+
+Run with: python benchmarks/bench_log_handler.py
+"""
+
+import sys
+import os
+import logging
+import logging.handlers
+import queue
+import statistics
+import threading
+import time
+
+# Add parent directory for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fine_use_logging import FineUseLogHandler, DROP_POLICIES
+
+RECORDS = 200_000
+PRODUCERS = 4
+FRAME = 0.016
+
+
+def make_logger(name, handler):
+    logger = logging.getLogger(name)
+    logger.propagate = False
+    logger.setLevel(logging.DEBUG)
+    logger.handlers[:] = [handler]
+    return logger
+
+
+def ui_loop(drain, stop, frame_times):
+    """Drain once per frame until stopped, recording the time each drain takes"""
+    while not stop.is_set():
+        start = time.perf_counter()
+        if drain():
+            frame_times.append((time.perf_counter() - start) * 1000)
+        time.sleep(FRAME)
+
+
+def emit_cost(handler, drain):
+    logger = make_logger(f"bench.emit.{id(handler)}", handler)
+    stop, frame_times = threading.Event(), []
+    ui = threading.Thread(target=ui_loop, args=(drain, stop, frame_times))
+    ui.start()
+    start = time.perf_counter()
+    for i in range(RECORDS):
+        logger.info("request %d served in %d ms", i, i % 97)
+    elapsed = time.perf_counter() - start
+    stop.set()
+    ui.join()
+    while drain():
+        pass
+    return elapsed / RECORDS * 1e6
+
+
+def flood(policy):
+    handler = FineUseLogHandler(lambda entries: None, drop_policy=policy)
+    logger = make_logger(f"bench.flood.{policy}", handler)
+    stop, frame_times = threading.Event(), []
+    ui = threading.Thread(target=ui_loop, args=(handler.drain, stop, frame_times))
+
+    def produce(n):
+        for i in range(RECORDS):
+            logger.warning("worker %d line %d", n, i)
+
+    producers = [threading.Thread(target=produce, args=(n,)) for n in range(PRODUCERS)]
+    ui.start()
+    start = time.perf_counter()
+    for producer in producers:
+        producer.start()
+    for producer in producers:
+        producer.join()
+    elapsed = time.perf_counter() - start
+    stop.set()
+    ui.join()
+    frame_times.sort()
+    return (handler.emitted / elapsed, handler.dropped, handler.high_water,
+            statistics.median(frame_times), frame_times[-1])
+
+
+def main():
+    print("Fine Use Logging Handler Benchmark")
+    print("=" * 72)
+
+    fine_use = FineUseLogHandler(lambda entries: None)
+    simple_queue = queue.SimpleQueue()
+
+    def drain_queue():
+        count = 0
+        try:
+            while count < 5000:
+                simple_queue.get_nowait()
+                count += 1
+        except queue.Empty:
+            pass
+        return count
+
+    print(f"emit cost, {RECORDS:,} records from one thread")
+    print(f"  FineUseLogHandler          {emit_cost(fine_use, fine_use.drain):6.2f} us/record")
+    queue_handler = logging.handlers.QueueHandler(simple_queue)
+    print(f"  QueueHandler(SimpleQueue)  {emit_cost(queue_handler, drain_queue):6.2f} us/record")
+    print()
+
+    print(f"flood, {PRODUCERS} threads x {RECORDS:,} records, capacity {fine_use.capacity:,}, batch {fine_use.batch_size:,}")
+    print(f"  {'policy':<12} {'records/s':>10} {'dropped':>9} {'max waiting':>12} {'drain median':>13} {'max':>9}")
+    for policy in DROP_POLICIES:
+        rate, dropped, high_water, median, worst = flood(policy)
+        print(f"  {policy:<12} {rate:10,.0f} {dropped:9,} {high_water:12,} {median:10.2f} ms {worst:6.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
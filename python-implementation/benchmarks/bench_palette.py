@@ -0,0 +1,88 @@
+"""
+Fine Use Benchmark - Theme Palette Lookup
+=========================================
+
+Compares the legacy dict path (rebuild theme_map per lookup, parse hex
+at use time) against the frozen Palette registry.
+
+Run with: python benchmarks/bench_palette.py
+"""
+
+import sys
+import os
+import timeit
+
+# Add parent directory for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fine_use_core import FineUse, FineUseTheme, FineUseColors, THEME_PALETTES
+
+ITERATIONS = 200_000
+
+
+def legacy_get_theme_colors(theme):
+    """The original per-call theme_map implementation"""
+    theme_map = {
+        FineUseTheme.GITHUB_DARK: FineUseColors.GITHUB_DARK,
+        FineUseTheme.GITHUB_LIGHT: FineUseColors.GITHUB_LIGHT,
+        FineUseTheme.AMBER: FineUseColors.AMBER,
+        FineUseTheme.GRUVBOX: FineUseColors.GRUVBOX,
+        FineUseTheme.MONOCHROME: FineUseColors.MONOCHROME,
+        FineUseTheme.MONOKAI: FineUseColors.MONOKAI,
+        FineUseTheme.NEWSPAPER: FineUseColors.NEWSPAPER,
+        FineUseTheme.SAKURA: FineUseColors.SAKURA,
+        FineUseTheme.SYNTHWAVE: FineUseColors.SYNTHWAVE,
+        FineUseTheme.VT220: FineUseColors.VT220
+    }
+    return theme_map[theme]
+
+
+def legacy_hex_to_rgb(hex_color):
+    """The original generator-based hex parser"""
+    hex_color = hex_color.lstrip('#')
+    return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+
+
+def report(name, legacy, current):
+    """Print one benchmark row"""
+    legacy_ns = legacy / ITERATIONS * 1e9
+    current_ns = current / ITERATIONS * 1e9
+    print(f"{name:<28} {legacy_ns:>10.1f} ns {current_ns:>10.1f} ns {legacy / current:>8.1f}x")
+
+
+def main():
+    theme = FineUseTheme.SYNTHWAVE
+    fine_use = FineUse()
+
+    print("Fine Use Palette Benchmark")
+    print("=" * 64)
+    print(f"{'operation':<28} {'legacy':>13} {'palette':>13} {'speedup':>9}")
+
+    legacy = timeit.timeit(lambda: legacy_get_theme_colors(theme), number=ITERATIONS)
+    current = timeit.timeit(lambda: fine_use.get_theme_colors(theme), number=ITERATIONS)
+    report("theme lookup", legacy, current)
+
+    legacy_colors = legacy_get_theme_colors(theme)
+    palette = THEME_PALETTES[theme]
+    legacy = timeit.timeit(lambda: legacy_hex_to_rgb(legacy_colors['accent']), number=ITERATIONS)
+    current = timeit.timeit(lambda: palette.rgb_of('accent'), number=ITERATIONS)
+    report("token -> rgb", legacy, current)
+
+    legacy = timeit.timeit(
+        lambda: int(legacy_colors['accent'].lstrip('#'), 16), number=ITERATIONS
+    )
+    current = timeit.timeit(lambda: palette.packed_of('accent'), number=ITERATIONS)
+    report("token -> packed int", legacy, current)
+
+    legacy = timeit.timeit(
+        lambda: legacy_hex_to_rgb(legacy_get_theme_colors(theme)['accent']),
+        number=ITERATIONS
+    )
+    current = timeit.timeit(
+        lambda: THEME_PALETTES[theme].rgb_of('accent'), number=ITERATIONS
+    )
+    report("theme + token -> rgb", legacy, current)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Fine Use Benchmark - Deferred Polish Scheduler
+==============================================
+
+A 2,000-widget form (buttons + labels) built and then restyled twice
+(variant/color change, then size/level change) with:
+
+- eager polish: style().unpolish()/polish() on every construction and
+  property change (the previous behaviour)
+- the coalesced polish_scheduler: one batched pass per event-loop turn
+
+Runs on the offscreen Qt platform when no display is available.
+
+Run with: python benchmarks/bench_polish.py
+"""
+
+import sys
+import os
+import time
+
+# Add parent directory for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+if not os.environ.get('DISPLAY') and sys.platform not in ('win32', 'darwin'):
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from fine_use_pyqt import (
+    FineUseApp, FineUseButton, FineUseLabel, polish_scheduler,
+    QWidget, QGridLayout, QScrollArea, QEvent
+)
+
+WIDGETS = 2000
+COLUMNS = 20
+
+
+def eager_polish(widget):
+    widget.style().unpolish(widget)
+    widget.style().polish(widget)
+
+
+def build(app, eager):
+    scroll = QScrollArea()
+    container = QWidget()
+    grid = QGridLayout(container)
+    widgets = []
+    for i in range(WIDGETS):
+        if i % 2:
+            widget = FineUseLabel(f"Status {i}", color='comment')
+        else:
+            widget = FineUseButton(f"Action {i}", 'secondary')
+        if eager:
+            eager_polish(widget)
+        grid.addWidget(widget, i // COLUMNS, i % COLUMNS)
+        widgets.append(widget)
+    scroll.setWidget(container)
+    scroll.show()
+    app.processEvents()
+    return scroll, widgets
+
+
+def restyle(app, widgets, eager, step):
+    for widget in widgets:
+        if isinstance(widget, FineUseButton):
+            changes = (('variant', 'primary'),) if step == 0 else (('size', 'lg'), ('variant', 'success'))
+            for name, value in changes:
+                if eager:
+                    widget.setProperty(name, value)
+                    eager_polish(widget)
+                elif name == 'variant':
+                    widget.set_variant(value)
+                else:
+                    widget.set_size(value)
+        else:
+            if eager:
+                widget.setProperty('color', 'accent' if step == 0 else 'success')
+                eager_polish(widget)
+            else:
+                widget.set_color('accent' if step == 0 else 'success')
+    app.processEvents()
+
+
+def run(app, eager):
+    polish_scheduler.reset_counters()
+    start = time.perf_counter()
+    scroll, widgets = build(app, eager)
+    construct = time.perf_counter() - start
+
+    start = time.perf_counter()
+    restyle(app, widgets, eager, 0)
+    restyle(app, widgets, eager, 1)
+    change = time.perf_counter() - start
+
+    counters = (polish_scheduler.requested, polish_scheduler.polished, polish_scheduler.saved)
+    scroll.close()
+    scroll.deleteLater()
+    app.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+    return construct, change, counters
+
+
+def main():
+    app = FineUseApp()
+
+    print("Fine Use Polish Scheduler Benchmark")
+    print("=" * 64)
+    print(f"Widgets: {WIDGETS:,}")
+    eager = run(app, eager=True)
+    deferred = run(app, eager=False)
+    print(f"eager polish   construct {eager[0] * 1000:8.1f} ms   2 restyles {eager[1] * 1000:8.1f} ms")
+    print(f"scheduler      construct {deferred[0] * 1000:8.1f} ms   2 restyles {deferred[1] * 1000:8.1f} ms")
+    requested, polished, saved = deferred[2]
+    print(f"polish requests {requested:,}, polished {polished:,}, saved {saved:,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+Fine Use Benchmark - PySide6 Memory-Mapped Log File
+===================================================
+
+Writes a log file (5 GB by default, kept in the temp directory and
+reused between runs) and opens it in the demos-pyside6 FineUseLogView:
+
+- tail shown: open_file() until the last lines are painted
+- full index: until the worker has indexed every line
+- frames: 200 jumps to random rows, viewport repainted
+- tail -f: 1,000 lines appended, until they are rows
+
+Process RSS is reported before opening, with the tail shown, and after
+indexing and scrolling. Uses the offscreen Qt platform when no display
+is available.
+
+Run with: python benchmarks/bench_pyside6_log_file.py [size in GB]
+"""
+
+import sys
+import os
+import random
+import statistics
+import tempfile
+import time
+
+# Add the PySide6 demo directory for imports
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'demos-pyside6'))
+
+if not os.environ.get('DISPLAY') and sys.platform not in ('win32', 'darwin'):
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PySide6.QtWidgets import QApplication
+from widgets.log_view import FineUseLogView
+
+LEVELS = ('INFO', 'WARNING', 'ERROR', 'DEBUG', 'SUCCESS')
+FRAMES = 200
+
+
+def rss_mb():
+    """Current resident set size in MB (Linux), 0 where /proc is unavailable"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 2 ** 20
+    except (OSError, ValueError):
+        return 0.0
+
+
+def write_log(path, size):
+    """Service-log lines ('2024-05-01 12:00:00,123 LEVEL message') up to size bytes"""
+    if os.path.exists(path) and os.path.getsize(path) >= size:
+        return
+    block = ''.join(
+        f"2024-05-01 12:{i // 60 % 60:02d}:{i % 60:02d},{i % 1000:03d} {LEVELS[i % 5]} "
+        f"worker-{i % 64} handled GET /api/v1/items/{i} in {i % 97} ms\n"
+        for i in range(100_000)
+    ).encode()
+    with open(path, 'wb') as f:
+        written = 0
+        while written < size:
+            f.write(block)
+            written += len(block)
+
+
+def main():
+    size = int(float(sys.argv[1] if len(sys.argv) > 1 else 5) * 2 ** 30)
+    path = os.path.join(tempfile.gettempdir(), f"fine_use_bench_{size >> 20}mb.log")
+    write_log(path, size)
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    view = FineUseLogView()
+    view.resize(900, 600)
+    view.show()
+    app.processEvents()
+    rss_before = rss_mb()
+
+    start = time.perf_counter()
+    model = view.open_file(path, poll_interval_ms=0)
+    app.processEvents()
+    view.viewport().repaint()
+    tail = time.perf_counter() - start
+    rss_tail = rss_mb()
+
+    while model.indexing:
+        app.processEvents()
+    indexed = time.perf_counter() - start
+
+    scroll_bar = view.verticalScrollBar()
+    frames = []
+    for row in random.Random(7).sample(range(model.rowCount()), FRAMES):
+        frame_start = time.perf_counter()
+        scroll_bar.setValue(row)
+        view.viewport().repaint()
+        app.processEvents()
+        frames.append((time.perf_counter() - frame_start) * 1000)
+    frames.sort()
+
+    view.scrollToBottom()
+    rows = model.rowCount()
+    original_size = os.path.getsize(path)
+    with open(path, 'ab') as f:
+        f.write(b''.join(b"2024-05-01 13:00:00,000 INFO appended line %d\n" % i for i in range(1000)))
+    start = time.perf_counter()
+    model.poll()
+    view.viewport().repaint()
+    follow = time.perf_counter() - start
+    assert model.rowCount() == rows + 1000 and scroll_bar.value() == scroll_bar.maximum()
+    rss_end = rss_mb()
+    model.close()
+    os.truncate(path, original_size)
+
+    print("Fine Use PySide6 Log File Benchmark")
+    print("=" * 60)
+    print(f"File: {os.path.getsize(path) / 2 ** 30:.2f} GB, {rows:,} lines")
+    print(f"tail shown          {tail * 1000:9.1f} ms")
+    print(f"full index          {indexed:9.2f} s   ({os.path.getsize(path) / indexed / 2 ** 20:,.0f} MB/s)")
+    print(f"frames              {statistics.median(frames):9.2f} ms median, {frames[int(FRAMES * 0.99) - 1]:.2f} ms p99")
+    print(f"tail -f, 1,000 rows {follow * 1000:9.2f} ms")
+    print(f"line index          {model.nbytes / 2 ** 20:9.2f} MB")
+    print(f"RSS                 {rss_before:6.0f} MB before, {rss_tail:.0f} MB tail shown, {rss_end:.0f} MB after index + scroll")
+
+
+if __name__ == "__main__":
+    main()
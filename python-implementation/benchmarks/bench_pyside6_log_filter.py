@@ -0,0 +1,102 @@
+"""
+Fine Use Benchmark - PySide6 Log Filter
+=======================================
+
+Fills the demos-pyside6 FineUseLogView with 1,000,000 lines, once with
+messages from 1,000 templates and once with unique messages, and times
+set_filter() for level filters and case-insensitive substring searches.
+A plain Python scan over the same lines is timed for comparison.
+
+Also reports the ingestion rate with indexing, the index size per line
+and the time to add a 1,000-line batch while a filter is active.
+
+Uses the offscreen Qt platform when no display is available.
+
+Run with: python benchmarks/bench_pyside6_log_filter.py
+"""
+
+import sys
+import os
+import time
+
+# Add the PySide6 demo directory for imports
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'demos-pyside6'))
+
+if not os.environ.get('DISPLAY') and sys.platform not in ('win32', 'darwin'):
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PySide6.QtWidgets import QApplication
+from widgets.log_view import FineUseLogView
+
+LINES = 1_000_000
+CHUNK = 100_000
+LEVELS = ('INFO', 'WARN', 'ERROR', 'SUCCESS', 'DEBUG')
+FILTERS = (
+    (('ERROR',), ''),
+    (('ERROR', 'WARN'), ''),
+    (None, 'timeout'),
+    (('ERROR',), 'worker 7 '),
+    (None, 'worker 7'),
+    (None, 'ms'),
+)
+
+
+def message(i, unique):
+    if unique:
+        text = f"request {i} served by worker {i % 64} in {i % 97} ms"
+    else:
+        text = f"request served by worker {i % 1000} in {i % 1000 % 97} ms"
+    return text + " after upstream timeout" if i % 5003 == 0 else text
+
+
+def main():
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    print("Fine Use PySide6 Log Filter Benchmark")
+    print("=" * 72)
+    for unique in (False, True):
+        entries = [(LEVELS[i % 5], message(i, unique)) for i in range(LINES)]
+        view = FineUseLogView()
+        view.resize(900, 600)
+        view.show()
+        app.processEvents()
+
+        start = time.perf_counter()
+        for first in range(0, LINES, CHUNK):
+            view.add_log_entries(entries[first:first + CHUNK])
+        ingest = time.perf_counter() - start
+        model = view.log_model
+
+        print(f"{LINES:,} {'unique' if unique else 'templated'} lines: {LINES / ingest:,.0f} lines/s with indexing, "
+              f"index {model.log_index.nbytes / LINES:.1f} B/line")
+        print(f"  {'levels':<16} {'text':<12} {'rows':>9} {'set_filter':>11} {'python scan':>12}")
+        for levels, text in FILTERS:
+            start = time.perf_counter()
+            view.set_filter(levels, text)
+            view.viewport().repaint()
+            elapsed = time.perf_counter() - start
+
+            start = time.perf_counter()
+            needle = text.lower()
+            expected = sum(1 for level, line in entries
+                           if (levels is None or level in levels) and needle in line.lower())
+            scan = time.perf_counter() - start
+            assert model.rowCount() == expected
+            label = '+'.join(levels) if levels else 'all'
+            print(f"  {label:<16} {text!r:<12} {expected:9,} {elapsed * 1000:8.1f} ms {scan * 1000:9.1f} ms")
+
+        view.set_filter(('ERROR',), 'timeout')
+        batches = []
+        for i in range(LINES, LINES + 20_000, 1000):
+            batch = [(LEVELS[j % 5], message(j, unique)) for j in range(i, i + 1000)]
+            start = time.perf_counter()
+            view.add_log_entries(batch)
+            batches.append(time.perf_counter() - start)
+        print(f"  1,000-line batch while filtered: {sum(batches) / len(batches) * 1000:.2f} ms")
+        print()
+        view.close()
+        view.deleteLater()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+"""
+Fine Use Benchmark - PySide6 Log Terminal Throughput
+====================================================
+
+Appends log lines to the demos-pyside6 FineUseLogTerminal (50-line
+limit, shown) and reports lines per second, document edits (relayouts)
+and flush latency:
+
+- legacy: the previous QTextEdit terminal (insertHtml per entry, line
+  limit checked with toPlainText() on every append)
+- flush per line: the ring buffer written after every add_log_entry
+- burst: 10,000 add_log_entry calls, then the event loop until the
+  frame flush has run
+- producer thread: a worker logging 50,000 lines/s for two seconds
+  while the GUI thread runs its event loop
+
+Uses the offscreen Qt platform when no display is available.
+
+Run with: python benchmarks/bench_pyside6_log_terminal.py
+"""
+
+import sys
+import os
+import threading
+import time
+
+# Add the PySide6 demo directory for imports
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'demos-pyside6'))
+
+if not os.environ.get('DISPLAY') and sys.platform not in ('win32', 'darwin'):
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PySide6.QtWidgets import QApplication, QTextEdit
+from PySide6.QtGui import QTextCursor
+from widgets.log_terminal import FineUseLogTerminal
+
+LEVELS = ('INFO', 'WARN', 'ERROR', 'SUCCESS', 'DEBUG')
+BATCH = 1000
+
+
+class LegacyLogTerminal(QTextEdit):
+    """The previous terminal: one insertHtml per entry, limit via toPlainText()"""
+
+    LOG_LEVELS = FineUseLogTerminal.LOG_LEVELS
+
+    def __init__(self):
+        super().__init__()
+        self.max_lines = 50
+        self.setReadOnly(True)
+
+    def add_log_entry(self, level, message):
+        time_str = time.strftime("%H:%M:%S")
+        level_style = self.LOG_LEVELS.get(level.upper(), self.LOG_LEVELS['INFO'])
+        cursor = self.textCursor()
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.insertHtml(
+            f'<div style="margin-bottom: 4px;"><span style="color: #7d8590;">[{time_str}]</span> '
+            f'<span style="color: {level_style["color"]}; font-weight: 700;">{level.upper()}</span> '
+            f'<span style="color: #f0f6fc;">{message}</span></div>'
+        )
+        self.setTextCursor(cursor)
+        self.ensureCursorVisible()
+        # The old limit check: the whole text on every append, split on a
+        # literal backslash-n, so the trim it guarded never ran
+        self.toPlainText().split('\\n')
+
+
+def messages(count):
+    return [(LEVELS[i % len(LEVELS)], f"request {i} served in {i % 97} ms") for i in range(count)]
+
+
+def show(app, terminal):
+    if isinstance(terminal, FineUseLogTerminal):
+        terminal.pause_auto_logging()
+    terminal.resize(800, 400)
+    terminal.show()
+    app.processEvents()
+
+
+def run_legacy(app, lines):
+    terminal = LegacyLogTerminal()
+    show(app, terminal)
+    start = time.perf_counter()
+    for level, message in messages(lines):
+        terminal.add_log_entry(level, message)
+    app.processEvents()
+    elapsed = time.perf_counter() - start
+    terminal.close()
+    return lines / elapsed, lines, 1.0, None
+
+
+def run_per_line(app, lines):
+    terminal = FineUseLogTerminal()
+    show(app, terminal)
+    start = time.perf_counter()
+    for level, message in messages(lines):
+        terminal.add_log_entry(level, message)
+        terminal.flush()
+    app.processEvents()
+    elapsed = time.perf_counter() - start
+    terminal.close()
+    return lines / elapsed, terminal.flushes, terminal.mean_batch, terminal.max_flush_latency
+
+
+def run_burst(app, lines):
+    terminal = FineUseLogTerminal()
+    show(app, terminal)
+    start = time.perf_counter()
+    for level, message in messages(lines):
+        terminal.add_log_entry(level, message)
+    while terminal.flushed < lines:
+        app.processEvents()
+    elapsed = time.perf_counter() - start
+    terminal.close()
+    return lines / elapsed, terminal.flushes, terminal.mean_batch, terminal.max_flush_latency
+
+
+def run_producer(app, rate, seconds):
+    terminal = FineUseLogTerminal()
+    show(app, terminal)
+    lines = rate * seconds
+    entries = messages(lines)
+    chunk = rate // 100
+
+    def produce():
+        # Paced in 10 ms slices, one add_log_entry per line
+        start = time.perf_counter()
+        for index in range(0, lines, chunk):
+            for level, message in entries[index:index + chunk]:
+                terminal.add_log_entry(level, message)
+            delay = start + (index + chunk) / rate - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+
+    worker = threading.Thread(target=produce)
+    start = time.perf_counter()
+    worker.start()
+    while worker.is_alive() or terminal.flushed < lines:
+        app.processEvents()
+        time.sleep(0.001)
+    elapsed = time.perf_counter() - start
+    terminal.close()
+    return lines / elapsed, terminal.flushes, terminal.mean_batch, terminal.max_flush_latency
+
+
+def main():
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    print("Fine Use PySide6 Log Terminal Benchmark")
+    print("=" * 78)
+    print(f"{'append path':<16} {'lines':>9} {'lines/s':>10} {'relayouts':>10} {'mean batch':>11} {'max latency':>12}")
+    for label, lines, run in (
+        ("legacy", 2_000, lambda: run_legacy(app, 2_000)),
+        ("flush per line", 20_000, lambda: run_per_line(app, 20_000)),
+        ("burst", 10_000, lambda: run_burst(app, 10_000)),
+        ("producer thread", 100_000, lambda: run_producer(app, 50_000, 2)),
+    ):
+        rate, relayouts, batch, latency = run()
+        latency = f"{latency:9.1f} ms" if latency is not None else f"{'-':>12}"
+        print(f"{label:<16} {lines:9,} {rate:10,.0f} {relayouts:10,} {batch:11.1f} {latency}")
+
+
+if __name__ == "__main__":
+    main()
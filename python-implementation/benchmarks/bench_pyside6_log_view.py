@@ -0,0 +1,96 @@
+"""
+Fine Use Benchmark - PySide6 Virtualized Log View
+=================================================
+
+Fills the demos-pyside6 FineUseLogView with 10,000,000 lines (messages
+from 1,000 templates) and 1,000,000 lines with unique messages, then
+reports ingestion rate, memory per line (columns + message pool, and
+process RSS growth) and frame times while jumping to 200 random scroll
+positions and repainting the 900x600 viewport.
+
+Uses the offscreen Qt platform when no display is available.
+
+Run with: python benchmarks/bench_pyside6_log_view.py
+"""
+
+import sys
+import os
+import random
+import statistics
+import time
+
+# Add the PySide6 demo directory for imports
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'demos-pyside6'))
+
+if not os.environ.get('DISPLAY') and sys.platform not in ('win32', 'darwin'):
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PySide6.QtWidgets import QApplication
+from widgets.log_view import FineUseLogView
+
+LEVELS = ('INFO', 'WARN', 'ERROR', 'SUCCESS', 'DEBUG')
+CHUNK = 100_000
+FRAMES = 200
+
+
+def rss_bytes():
+    """Current resident set size (Linux), 0 where /proc is unavailable"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError):
+        return 0
+
+
+def fill(view, lines, unique):
+    templates = [f"request served by worker {i} in {i % 97} ms" for i in range(1000)]
+    rss = rss_bytes()
+    start = time.perf_counter()
+    for first in range(0, lines, CHUNK):
+        if unique:
+            chunk = [(LEVELS[i % 5], f"request {i} served in {i % 97} ms") for i in range(first, first + CHUNK)]
+        else:
+            chunk = [(LEVELS[i % 5], templates[i % 1000]) for i in range(first, first + CHUNK)]
+        view.add_log_entries(chunk)
+    elapsed = time.perf_counter() - start
+    return lines / elapsed, view.log_model.nbytes / lines, (rss_bytes() - rss) / lines
+
+
+def scroll_frames(app, view):
+    scroll_bar = view.verticalScrollBar()
+    positions = random.Random(7).sample(range(scroll_bar.maximum()), FRAMES)
+    frames = []
+    for position in positions:
+        start = time.perf_counter()
+        scroll_bar.setValue(position)
+        view.viewport().repaint()
+        app.processEvents()
+        frames.append((time.perf_counter() - start) * 1000)
+    frames.sort()
+    return statistics.median(frames), frames[int(len(frames) * 0.99) - 1]
+
+
+def main():
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    print("Fine Use PySide6 Log View Benchmark")
+    print("=" * 78)
+    print(f"{'lines':<22} {'lines/s':>10} {'B/line':>8} {'RSS B/line':>11} {'median frame':>13} {'p99':>9}")
+    for label, lines, unique in (
+        ("10,000,000 templated", 10_000_000, False),
+        ("1,000,000 unique", 1_000_000, True),
+    ):
+        view = FineUseLogView()
+        view.resize(900, 600)
+        view.show()
+        app.processEvents()
+        rate, nbytes, rss = fill(view, lines, unique)
+        app.processEvents()
+        median, p99 = scroll_frames(app, view)
+        print(f"{label:<22} {rate:10,.0f} {nbytes:8.1f} {rss:11.1f} {median:10.2f} ms {p99:6.2f} ms")
+        view.close()
+        view.deleteLater()
+
+
+if __name__ == "__main__":
+    main()
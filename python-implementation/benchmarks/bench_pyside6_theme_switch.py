@@ -0,0 +1,159 @@
+"""
+Fine Use Benchmark - PySide6 Dashboard Theme Switch
+===================================================
+
+Frame time of a theme switch on a 2,000-widget DashboardLayout (the
+demos-pyside6 dashboard with its control section filled with extra
+panels): from the apply call until the event loop is idle and the
+window has been painted again.
+
+- setStyleSheet: the previous apply_theme (QSS regenerated, set on the
+  window, window re-polished)
+- ThemeApplier: cached QSS, theme-scoped rules, only widgets whose
+  matching rules changed are repolished
+
+Switches measured: github-dark to amber, where every colour differs
+(first visit and repeat), to a github-dark variant registered here that
+only changes the status colours, and to the theme already applied.
+
+Each case runs in its own process; the offscreen Qt platform is used
+when no display is available.
+
+Run with: python benchmarks/bench_pyside6_theme_switch.py
+"""
+
+import sys
+import os
+import statistics
+import subprocess
+import time
+
+# Add the PySide6 demo directory for imports
+DEMO_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'demos-pyside6')
+sys.path.insert(0, DEMO_DIR)
+# themes imports fine_use_cache from python-implementation/
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+PANELS = 132  # 15 widgets each, ~2,000 widgets with the rest of the dashboard
+ROUNDS = 5
+STEPS = ('full, first visit', 'full, repeat', 'status colours only', 'same theme')
+
+
+def register_themes():
+    from themes import THEMES
+
+    dark = THEMES['github-dark']
+    status = dark._replace(name="GitHub Dark Status", colors={
+        **dark.colors, 'success': '#2ea043', 'warning': '#bb8009', 'error': '#f85149'
+    })
+    THEMES.register('bench-status', status)
+
+
+def build_dashboard():
+    from PySide6.QtWidgets import QWidget, QGridLayout, QVBoxLayout, QLabel, QScrollArea
+    from layouts.dashboard_layout import DashboardLayout
+    from widgets.fine_use_button import FineUseButton
+    from widgets.metric_widget import FineUseStatusIndicator
+
+    class BenchDashboard(DashboardLayout):
+        """DashboardLayout whose control section is a grid of PANELS panels"""
+
+        def create_controls_section(self):
+            scroll = QScrollArea()
+            scroll.setWidgetResizable(True)
+            container = QWidget()
+            grid = QGridLayout(container)
+            variants = ('primary', 'default', 'info', 'success', 'danger')
+            for index in range(PANELS):
+                panel = QWidget()
+                panel.setObjectName("fine-use-component")
+                layout = QVBoxLayout(panel)
+                title = QLabel(f"PANEL {index}")
+                title.setObjectName("h3")
+                layout.addWidget(title)
+                for i in range(8):
+                    layout.addWidget(FineUseButton(f"ACTION {i}", variants[i % len(variants)]))
+                layout.addWidget(QLabel("plain status text"))
+                layout.addWidget(FineUseStatusIndicator(f"SVC {index}", ('operational', 'degraded')[index % 2]))
+                grid.addWidget(panel, index // 6, index % 6)
+            scroll.setWidget(container)
+            return scroll
+
+    return BenchDashboard()
+
+
+def run_case(case):
+    """Time each switch step in this process, print one median (ms) per step"""
+    from PySide6.QtCore import Qt
+    from PySide6.QtWidgets import QApplication, QWidget
+    from themes import build_theme_qss
+    from themes.applier import ThemeApplier
+
+    register_themes()
+    if case == 'applier':
+        QApplication.setAttribute(Qt.ApplicationAttribute.AA_UseStyleSheetPropagationInWidgetStyles, True)
+    app = QApplication.instance() or QApplication(sys.argv)
+    window = build_dashboard()
+    window.resize(1400, 900)
+
+    if case == 'applier':
+        applier = ThemeApplier(window)
+        apply = applier.apply
+    else:
+        def apply(theme_name):
+            window.setStyleSheet(build_theme_qss(theme_name))
+            window.style().unpolish(window)
+            window.style().polish(window)
+            window.update()
+
+    apply('github-dark')
+    window.show()
+    app.processEvents()
+
+    def frame(theme_name):
+        start = time.perf_counter()
+        apply(theme_name)
+        app.processEvents()
+        window.grab()
+        return (time.perf_counter() - start) * 1000
+
+    first = frame('amber')
+    frame('github-dark')
+    timings = {step: [] for step in STEPS[1:]}
+    for _ in range(ROUNDS):
+        timings['full, repeat'].append(frame('amber'))
+        frame('github-dark')
+        timings['status colours only'].append(frame('bench-status'))
+        frame('github-dark')
+        timings['same theme'].append(frame('github-dark'))
+    print(len(window.findChildren(QWidget)), f"{first:.1f}",
+          *(f"{statistics.median(values):.1f}" for values in timings.values()))
+
+
+def main():
+    if len(sys.argv) == 3 and sys.argv[1] == '--case':
+        run_case(sys.argv[2])
+        return
+
+    env = dict(os.environ)
+    if not env.get('DISPLAY') and sys.platform not in ('win32', 'darwin'):
+        env.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+    results = {}
+    for case in ('setStyleSheet', 'applier'):
+        output = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), '--case', case],
+            env=env, capture_output=True, text=True, check=True
+        ).stdout.split()
+        widgets, results[case] = int(output[-5]), [float(value) for value in output[-4:]]
+
+    print("Fine Use PySide6 Theme Switch Benchmark")
+    print("=" * 66)
+    print(f"DashboardLayout widgets: {widgets:,}")
+    print(f"{'switch':<22} {'setStyleSheet':>15} {'ThemeApplier':>14} {'speedup':>10}")
+    for step, legacy, current in zip(STEPS, results['setStyleSheet'], results['applier']):
+        print(f"{step:<22} {legacy:12.1f} ms {current:11.1f} ms {legacy / current:9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Fine Use Benchmark - QSS vs QPalette Rendering Mode
+===================================================
+
+Builds a 2,000-widget dashboard (buttons, labels, inputs, progress
+bars) in each FineUseApp render mode and times startup (app + widgets
+shown), a theme switch (github-dark -> amber, repainted) and a full
+paint of the window.
+
+Each mode runs in its own process; the offscreen Qt platform is used
+when no display is available.
+
+Run with: python benchmarks/bench_render_modes.py
+"""
+
+import sys
+import os
+import subprocess
+import time
+
+# Add parent directory for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+WIDGETS = 2000
+COLUMNS = 20
+ROUNDS = 3
+
+
+def run_mode(mode):
+    """Measure one render mode in this process, print 'startup switch paint' in ms"""
+    from fine_use_core import fine_use, FineUseTheme
+    from fine_use_pyqt import (
+        FineUseApp, FineUseButton, FineUseLabel, FineUseLineEdit,
+        QWidget, QGridLayout, QScrollArea, QProgressBar
+    )
+
+    start = time.perf_counter()
+    app = FineUseApp(render_mode=mode)
+    scroll = QScrollArea()
+    scroll.resize(1400, 900)
+    container = QWidget()
+    grid = QGridLayout(container)
+    for i in range(WIDGETS):
+        kind = i % 8
+        if kind < 4:
+            widget = FineUseButton(f"Action {i}", ('primary', 'secondary', 'success', 'error')[kind])
+        elif kind < 6:
+            widget = FineUseLabel(f"Status {i}", color=('comment', 'accent')[kind - 4])
+        elif kind == 6:
+            widget = FineUseLineEdit(placeholder="host")
+        else:
+            widget = QProgressBar()
+            widget.setValue(i % 100)
+        grid.addWidget(widget, i // COLUMNS, i % COLUMNS)
+    scroll.setWidget(container)
+    scroll.show()
+    app.processEvents()
+    startup = time.perf_counter() - start
+
+    switches = []
+    for _ in range(ROUNDS):
+        for theme in (FineUseTheme.AMBER, FineUseTheme.GITHUB_DARK):
+            start = time.perf_counter()
+            fine_use.set_theme(theme)
+            app.processEvents()
+            container.grab()
+            switches.append(time.perf_counter() - start)
+
+    paints = []
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        container.grab()
+        paints.append(time.perf_counter() - start)
+
+    print(f"{startup * 1000:.1f} {min(switches) * 1000:.1f} {min(paints) * 1000:.1f}")
+
+
+def main():
+    if len(sys.argv) == 3 and sys.argv[1] == '--mode':
+        run_mode(sys.argv[2])
+        return
+
+    env = dict(os.environ)
+    if not env.get('DISPLAY') and sys.platform not in ('win32', 'darwin'):
+        env.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+    print("Fine Use Render Mode Benchmark")
+    print("=" * 60)
+    print(f"Widgets: {WIDGETS:,}")
+    print(f"{'mode':<9} {'startup':>12} {'theme switch':>14} {'paint':>12}")
+    results = {}
+    for mode in ('qss', 'palette'):
+        output = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), '--mode', mode],
+            env=env, capture_output=True, text=True, check=True
+        ).stdout.split()
+        results[mode] = [float(value) for value in output[-3:]]
+        startup, switch, paint = results[mode]
+        print(f"{mode:<9} {startup:9.1f} ms {switch:11.1f} ms {paint:9.1f} ms")
+
+    speedups = [q / p for q, p in zip(results['qss'], results['palette'])]
+    print(f"{'speedup':<9} {speedups[0]:10.1f}x {speedups[1]:12.1f}x {speedups[2]:10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
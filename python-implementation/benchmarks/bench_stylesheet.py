@@ -0,0 +1,95 @@
+"""
+Fine Use Benchmark - QSS Compilation Cache
+==========================================
+
+Per theme: time to render the app stylesheet template, to fetch it
+from the in-memory cache and from the on-disk store, and the time Qt
+spends parsing it (QApplication.setStyleSheet on a small dashboard).
+
+Runs on the offscreen Qt platform when no display is available.
+
+Run with: python benchmarks/bench_stylesheet.py
+"""
+
+import sys
+import os
+import tempfile
+import time
+
+# Add parent directory for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+if not os.environ.get('DISPLAY') and sys.platform not in ('win32', 'darwin'):
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from fine_use_core import fine_use, FineUseTheme
+from fine_use_pyqt import (
+    QApplication, FineUseStyleSheet, StyleSheetCache, FineUseWindow, FineUseButton,
+    FineUseLabel, FineUseLineEdit, BACKEND_VERSION
+)
+
+ROUNDS = 200
+
+
+def best_of(func, rounds=ROUNDS):
+    """Best per-call time in microseconds"""
+    best = float('inf')
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1e6
+
+
+def build_dashboard():
+    window = FineUseWindow("Stylesheet Benchmark")
+    for i in range(50):
+        window.main_layout.addWidget(FineUseButton(f"ACTION {i}", ('primary', 'secondary', 'success')[i % 3]))
+        window.main_layout.addWidget(FineUseLabel(f"Status {i}", color='comment'))
+        window.main_layout.addWidget(FineUseLineEdit(placeholder="host"))
+    window.show()
+    return window
+
+
+def main():
+    app = QApplication.instance() or QApplication(sys.argv)
+    window = build_dashboard()
+
+    print("Fine Use QSS Cache Benchmark")
+    print("=" * 72)
+    print(f"Backend: {BACKEND_VERSION}, widgets: {len(window.central_widget.children()) - 1}")
+    print(f"{'theme':<13} {'compile':>10} {'LRU hit':>10} {'disk hit':>10} {'setStyleSheet':>15}")
+
+    with tempfile.TemporaryDirectory() as disk_dir:
+        for theme in FineUseTheme:
+            fine_use.set_theme(theme)
+            palette, tokens = fine_use.colors, fine_use.tokens
+
+            compile_us = best_of(lambda: FineUseStyleSheet.compile_stylesheet(palette, tokens))
+
+            memory = StyleSheetCache()
+            memory.get(palette, tokens)
+            hit_us = best_of(lambda: memory.get(palette, tokens))
+
+            StyleSheetCache(disk_dir=disk_dir).get(palette, tokens)
+            disk_us = best_of(lambda: StyleSheetCache(disk_dir=disk_dir).get(palette, tokens))
+
+            qss = memory.get(palette, tokens)
+
+            def apply():
+                app.setStyleSheet("")
+                app.setStyleSheet(qss)
+                app.processEvents()
+
+            parse_us = best_of(apply, rounds=5)
+            print(
+                f"{theme.value:<13} {compile_us:8.1f}us {hit_us:8.2f}us {disk_us:8.1f}us "
+                f"{parse_us / 1000:12.2f} ms"
+            )
+
+    fine_use.set_theme(FineUseTheme.GITHUB_DARK)
+    window.close()
+
+
+if __name__ == "__main__":
+    main()
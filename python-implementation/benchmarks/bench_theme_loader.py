@@ -0,0 +1,40 @@
+"""
+Fine Use Benchmark - Theme File Loading
+=======================================
+
+Times parsing themes/*.css + universal-config.json from scratch against
+a warm start from the compiled binary cache.
+
+Run with: python benchmarks/bench_theme_loader.py
+"""
+
+import sys
+import os
+import tempfile
+import timeit
+
+# Add parent directory for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fine_use_theme_loader import load_themes
+
+ITERATIONS = 500
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_path = os.path.join(tmp, 'themes.bin')
+        themes = load_themes(cache_path=cache_path)
+
+        parse = timeit.timeit(lambda: load_themes(cache_path=None), number=ITERATIONS)
+        cached = timeit.timeit(lambda: load_themes(cache_path=cache_path), number=ITERATIONS)
+
+        print("Fine Use Theme Loader Benchmark")
+        print("=" * 48)
+        print(f"Themes: {len(themes)}, cache size: {os.path.getsize(cache_path)} bytes")
+        print(f"parse sources:  {parse / ITERATIONS * 1e6:9.1f} us")
+        print(f"binary cache:   {cached / ITERATIONS * 1e6:9.1f} us  ({parse / cached:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Fine Use Benchmark - Theme Prewarming
+=====================================
+
+Starts a FineUseApp with a 1,000-widget form, lets the event loop go
+idle, then switches through every other theme once (first visits) and
+back to github-dark:
+
+- cold: prewarm=False, each first visit compiles its stylesheet on the
+  UI thread
+- prewarmed: the ThemePrewarmer compiled the other themes on a worker
+  thread after startup, so first visits only pay for Qt's parse
+
+Reports the median and worst switch (until the window is repainted),
+the stylesheet compile time left on the UI thread and the cache hit
+rate. Each case runs in its own process; the offscreen Qt platform is
+used when no display is available.
+
+Run with: python benchmarks/bench_theme_prewarm.py
+"""
+
+import sys
+import os
+import statistics
+import subprocess
+import time
+
+# Add parent directory for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+WIDGETS = 1000
+COLUMNS = 20
+
+
+def run_case(case):
+    """Switch through every theme in this process, print 'median worst compile hit_rate'"""
+    from fine_use_core import fine_use, FineUseTheme, THEME_PALETTES
+    from fine_use_pyqt import (
+        FineUseApp, FineUseButton, FineUseLabel, FineUseStyleSheet,
+        QWidget, QGridLayout, QScrollArea
+    )
+
+    app = FineUseApp(prewarm=(case == 'prewarmed'))
+    scroll = QScrollArea()
+    scroll.resize(1400, 900)
+    container = QWidget()
+    grid = QGridLayout(container)
+    for i in range(WIDGETS):
+        if i % 2:
+            widget = FineUseLabel(f"Status {i}", color='comment')
+        else:
+            widget = FineUseButton(f"Action {i}", ('primary', 'secondary', 'success', 'error')[i % 4])
+        grid.addWidget(widget, i // COLUMNS, i % COLUMNS)
+    scroll.setWidget(container)
+    scroll.show()
+    app.processEvents()
+    app.prewarmer.wait()
+
+    # Time spent compiling stylesheets on the UI thread during the switches
+    compile_stylesheet = FineUseStyleSheet.compile_stylesheet
+    compiled = []
+
+    def timed_compile(palette, tokens):
+        start = time.perf_counter()
+        qss = compile_stylesheet(palette, tokens)
+        compiled.append(time.perf_counter() - start)
+        return qss
+
+    FineUseStyleSheet.compile_stylesheet = staticmethod(timed_compile)
+    cache = FineUseStyleSheet.cache
+    cache.hits = cache.disk_hits = cache.misses = 0
+
+    switches = []
+    for theme in [theme for theme in THEME_PALETTES if theme != FineUseTheme.GITHUB_DARK] + [FineUseTheme.GITHUB_DARK]:
+        start = time.perf_counter()
+        fine_use.set_theme(theme)
+        app.processEvents()
+        container.grab()
+        switches.append(time.perf_counter() - start)
+
+    print(f"{statistics.median(switches) * 1000:.2f} {max(switches) * 1000:.2f} "
+          f"{sum(compiled) * 1000:.2f} {cache.hit_rate:.2f}")
+
+
+def main():
+    if len(sys.argv) == 3 and sys.argv[1] == '--case':
+        run_case(sys.argv[2])
+        return
+
+    env = dict(os.environ)
+    env.pop('FINE_USE_QSS_CACHE_DIR', None)
+    if not env.get('DISPLAY') and sys.platform not in ('win32', 'darwin'):
+        env.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+    print("Fine Use Theme Prewarm Benchmark")
+    print("=" * 66)
+    print(f"Widgets: {WIDGETS:,}")
+    print(f"{'case':<10} {'median switch':>14} {'worst':>11} {'UI compile':>12} {'hit rate':>9}")
+    for case in ('cold', 'prewarmed'):
+        output = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), '--case', case],
+            env=env, capture_output=True, text=True, check=True
+        ).stdout.split()
+        median, worst, compiled, hit_rate = (float(value) for value in output[-4:])
+        print(f"{case:<10} {median:11.1f} ms {worst:8.1f} ms {compiled:9.2f} ms {hit_rate:8.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Fine Use Benchmark - Theme Switch Fan-out
+=========================================
+
+Builds a 5,000-widget dashboard subscribed to fine_use theme changes
+and times set_theme() for a full switch (github-dark -> github-light)
+and a partial one (monochrome -> vt220).
+
+Uses real Tk widgets when a display is available, otherwise headless
+subscribers that record the same configure() calls.
+
+Run with: python benchmarks/bench_theme_switch.py
+"""
+
+import sys
+import os
+import time
+
+# Add parent directory for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fine_use_core import fine_use, FineUseTheme
+
+WIDGETS = 5000
+ROUNDS = 5
+SWITCHES = [
+    (FineUseTheme.GITHUB_DARK, FineUseTheme.GITHUB_LIGHT),
+    (FineUseTheme.MONOCHROME, FineUseTheme.VT220),
+]
+
+
+class HeadlessWidget:
+    """Stand-in widget that subscribes like the Tk components do"""
+
+    def __init__(self, tokens):
+        self.options = {}
+        self.tokens = tokens
+        fine_use.subscribe(self._on_theme_changed, tokens)
+
+    def _on_theme_changed(self, changes):
+        self.configure(**{token: fine_use.colors[token] for token in self.tokens})
+
+    def configure(self, **options):
+        self.options.update(options)
+
+
+def build_headless():
+    token_sets = [('accent', 'bg'), ('surface', 'text', 'border'), ('text', 'bg'), ('surface', 'border')]
+    return [HeadlessWidget(token_sets[i % len(token_sets)]) for i in range(WIDGETS)]
+
+
+def build_tk():
+    from fine_use_tkinter import FineUseApp, FineUseButton, FineUseLabel, FineUseFrame, FineUseEntry
+
+    app = FineUseApp(title="Theme Switch Benchmark")
+    app.root.withdraw()
+    widgets = []
+    frame = None
+    for i in range(WIDGETS):
+        kind = i % 4
+        if kind == 0:
+            frame = FineUseFrame(app.main_frame)
+            widgets.append(frame)
+        elif kind == 1:
+            widgets.append(FineUseButton(frame, text=f"B{i}", variant="primary"))
+        elif kind == 2:
+            widgets.append(FineUseLabel(frame, text=f"L{i}", color="comment"))
+        else:
+            widgets.append(FineUseEntry(frame))
+    return app, widgets
+
+
+def main():
+    app = None
+    if os.environ.get('DISPLAY') or sys.platform in ('win32', 'darwin'):
+        app, widgets = build_tk()
+        mode = "tk"
+    else:
+        widgets = build_headless()
+        mode = "headless"
+
+    print("Fine Use Theme Switch Benchmark")
+    print("=" * 56)
+    print(f"Mode: {mode}, subscribed widgets: {len(widgets):,}")
+
+    for start, target in SWITCHES:
+        fine_use.set_theme(start)
+        changed = len(fine_use.colors.diff(fine_use.get_theme_colors(target)))
+        timings = []
+        for _ in range(ROUNDS):
+            t0 = time.perf_counter()
+            fine_use.set_theme(target)
+            if app is not None:
+                app.root.update_idletasks()
+            timings.append(time.perf_counter() - t0)
+            fine_use.set_theme(start)
+        best = min(timings) * 1000
+        print(f"{start.value:>12} -> {target.value:<13} {changed:2d} tokens changed  {best:8.2f} ms")
+
+    if app is not None:
+        app.root.destroy()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Fine Use Benchmark - Token Lookups During Construction
+======================================================
+
+Replays the token calls a dashboard makes while constructing widgets
+(FineUseButton: font + size padding + border, labels: font, grids:
+gap spacing) with the legacy per-call dict building versus the
+interned TokenSet tables.
+
+Run with: python benchmarks/bench_tokens.py
+"""
+
+import sys
+import os
+import time
+
+# Add parent directory for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fine_use_core import fine_use, get_font, get_spacing, get_border_width
+
+WIDGETS = 20_000
+SIZES = ('sm', 'md', 'lg', 'xl')
+
+
+def legacy_get_font(size='md', weight='normal'):
+    return (
+        fine_use.typography.FONT_FAMILY,
+        fine_use.typography.FONT_SIZES[size],
+        'bold' if weight in ['semibold', 'bold'] else 'normal'
+    )
+
+
+def legacy_get_spacing(size):
+    spacing_map = {
+        'xs': fine_use.spacing.XS,
+        'sm': fine_use.spacing.SM,
+        'md': fine_use.spacing.MD,
+        'lg': fine_use.spacing.LG,
+        'xl': fine_use.spacing.XL,
+        'xxl': fine_use.spacing.XXL
+    }
+    return spacing_map.get(size, fine_use.spacing.MD)
+
+
+def legacy_get_border_width(size='thin'):
+    border_map = {
+        'thin': fine_use.borders.THIN,
+        'thick': fine_use.borders.THICK,
+        'heavy': fine_use.borders.HEAVY
+    }
+    return border_map.get(size, fine_use.borders.THIN)
+
+
+def construct(font, spacing, border):
+    """Token calls made while building WIDGETS buttons, labels and grid cells"""
+    for i in range(WIDGETS):
+        size = SIZES[i & 3]
+        # FineUseButton.__init__ / _get_size_padding
+        font(size, 'bold')
+        if size == 'sm':
+            spacing('sm'), spacing('xs')
+        elif size == 'lg':
+            spacing('xl'), spacing('lg')
+        elif size == 'xl':
+            spacing('xxl'), spacing('xl')
+        else:
+            spacing('lg'), spacing('md')
+        border('thin')
+        # FineUseLabel._get_level_font
+        font('md', 'normal')
+        # FineUseButtonGrid / CompactButtonGrid gap
+        spacing('md')
+
+
+def timed(*args):
+    start = time.perf_counter()
+    construct(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    legacy = min(timed(legacy_get_font, legacy_get_spacing, legacy_get_border_width) for _ in range(3))
+    tokens = min(timed(get_font, get_spacing, get_border_width) for _ in range(3))
+
+    print("Fine Use Token Lookup Benchmark")
+    print("=" * 48)
+    print(f"Widgets constructed: {WIDGETS:,}")
+    print(f"legacy dict path:  {legacy * 1000:8.1f} ms")
+    print(f"TokenSet tables:   {tokens * 1000:8.1f} ms  ({legacy / tokens:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Fine Use Benchmark - Button Variant Colors
+==========================================
+
+Builds 10,000 buttons across all variants and compares the legacy
+per-button color dict against the shared VariantColors flyweights:
+construction time and memory held by the color state (tracemalloc).
+
+Uses real FineUseButton widgets when a display is available, otherwise
+headless buttons that resolve and store colors the same way.
+
+Run with: python benchmarks/bench_variants.py
+"""
+
+import sys
+import os
+import time
+import tracemalloc
+
+# Add parent directory for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fine_use_core import fine_use, VARIANT_NAMES
+
+BUTTONS = 10_000
+
+
+def legacy_variant_colors(variant):
+    """The pre-flyweight FineUseButton._get_variant_colors"""
+    if variant == "secondary":
+        return {
+            'bg': fine_use.colors['surface'],
+            'fg': fine_use.colors['text'],
+            'hover_bg': fine_use.colors['border'],
+            'hover_fg': fine_use.colors['text']
+        }
+    token = 'accent' if variant == 'primary' else variant
+    return {
+        'bg': fine_use.colors[token],
+        'fg': fine_use.colors['bg'],
+        'hover_bg': fine_use.colors['bg'],
+        'hover_fg': fine_use.colors[token]
+    }
+
+
+class HeadlessButton:
+    """Stand-in button that keeps its colors like FineUseButton does"""
+
+    __slots__ = ('variant', 'colors')
+
+    def __init__(self, variant, resolve):
+        self.variant = variant
+        self.colors = resolve(variant)
+
+
+def build_headless(resolve):
+    return [HeadlessButton(VARIANT_NAMES[i % len(VARIANT_NAMES)], resolve) for i in range(BUTTONS)]
+
+
+def measure(resolve):
+    """Construction time and traced bytes for BUTTONS headless buttons"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    buttons = build_headless(resolve)
+    elapsed = time.perf_counter() - start
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del buttons
+    return elapsed, size
+
+
+def measure_tk():
+    from fine_use_tkinter import FineUseApp, FineUseButton
+
+    app = FineUseApp(title="Variant Benchmark")
+    app.root.withdraw()
+    start = time.perf_counter()
+    buttons = [
+        FineUseButton(app.main_frame, text=f"B{i}", variant=VARIANT_NAMES[i % len(VARIANT_NAMES)])
+        for i in range(BUTTONS)
+    ]
+    elapsed = time.perf_counter() - start
+    shared = len({id(button.colors) for button in buttons})
+    app.root.destroy()
+    return elapsed, shared
+
+
+def main():
+    print("Fine Use Button Variant Benchmark")
+    print("=" * 52)
+    print(f"Buttons: {BUTTONS:,} across {len(VARIANT_NAMES)} variants")
+
+    legacy_time, legacy_bytes = min(measure(legacy_variant_colors) for _ in range(3))
+    shared_time, shared_bytes = min(measure(fine_use.get_variant_colors) for _ in range(3))
+    print(f"legacy dicts:  {legacy_time * 1000:7.2f} ms  {legacy_bytes / 1024:8.1f} KiB")
+    print(
+        f"flyweights:    {shared_time * 1000:7.2f} ms  {shared_bytes / 1024:8.1f} KiB  "
+        f"({legacy_time / shared_time:.1f}x, {legacy_bytes / shared_bytes:.1f}x less memory)"
+    )
+
+    if os.environ.get('DISPLAY') or sys.platform in ('win32', 'darwin'):
+        elapsed, shared = measure_tk()
+        print(f"FineUseButton: {elapsed * 1000:7.2f} ms  ({shared} distinct color objects)")
+
+
+if __name__ == "__main__":
+    main()
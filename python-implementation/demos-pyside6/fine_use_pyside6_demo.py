@@ -6,13 +6,18 @@ Complete system demo with pixel-perfect Fine Use implementation
 
 import sys
 import os
+
+# python-implementation/ holds fine_use_cache, which themes shares with fine_use_pyqt
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
 from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                               QHBoxLayout, QGridLayout, QLabel, QComboBox)
 from PySide6.QtCore import Qt, QTimer
 from PySide6.QtGui import QFont
 
 # Import Fine Use components
-from themes import get_theme_qss, get_available_themes
+from themes import get_available_themes
+from themes.applier import ThemeApplier
 from widgets.metric_widget import (FineUseMetricWidget, FineUseStatusIndicator, 
                                   FineUseComponentContainer, FineUseProgressGroup)
 from widgets.fine_use_button import FineUseButtonGrid, FineUseActionButtons
@@ -25,6 +30,7 @@ class FineUsePySide6Demo(QMainWindow):
     def __init__(self):
         super().__init__()
         self.current_theme = "github-dark"
+        self.theme_applier = ThemeApplier(self)
         self.init_fonts()
         self.init_ui()
         self.apply_theme()
@@ -205,13 +211,7 @@ class FineUsePySide6Demo(QMainWindow):
     
     def apply_theme(self):
         """Apply the current theme to the entire application"""
-        qss = get_theme_qss(self.current_theme)
-        self.setStyleSheet(qss)
-        
-        # Force style refresh
-        self.style().unpolish(self)
-        self.style().polish(self)
-        self.update()
+        self.theme_applier.apply(self.current_theme)
     
     def setup_live_updates(self):
         """Setup live data updates like HTML demo"""
@@ -239,6 +239,9 @@ class FineUsePySide6Demo(QMainWindow):
 
 def main():
     """Main application entry point"""
+    # ThemeApplier needs style sheet propagation, set before any widget exists
+    QApplication.setAttribute(Qt.ApplicationAttribute.AA_UseStyleSheetPropagationInWidgetStyles, True)
+    
     # Create Qt application
     app = QApplication(sys.argv)
     
@@ -6,6 +6,10 @@ Focusing on getting the visual styling exactly right
 
 import sys
 import os
+
+# python-implementation/ holds fine_use_cache, which themes shares with fine_use_pyqt
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
 from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                               QHBoxLayout, QGridLayout, QLabel, QComboBox, QPushButton, 
                               QProgressBar, QTextEdit, QFrame)
@@ -13,7 +17,7 @@ from PySide6.QtCore import Qt, QTimer
 from PySide6.QtGui import QFont
 
 # Import theme system
-from themes import get_theme_qss
+from themes.applier import ThemeApplier
 
 class FixedFineUseDemo(QMainWindow):
     """Simplified Fine Use demo focusing on perfect visual styling"""
@@ -21,6 +25,7 @@ class FixedFineUseDemo(QMainWindow):
     def __init__(self):
         super().__init__()
         self.current_theme = "github-dark"
+        self.theme_applier = ThemeApplier(self)
         self.init_ui()
         self.apply_theme()
     
@@ -394,16 +399,12 @@ class FixedFineUseDemo(QMainWindow):
     
     def apply_theme(self):
         """Apply theme styling"""
-        qss = get_theme_qss(self.current_theme)
-        self.setStyleSheet(qss)
-        
-        # Force refresh
-        self.style().unpolish(self)
-        self.style().polish(self)
-        self.update()
+        self.theme_applier.apply(self.current_theme)
 
 def main():
     """Main entry point"""
+    # ThemeApplier needs style sheet propagation, set before any widget exists
+    QApplication.setAttribute(Qt.ApplicationAttribute.AA_UseStyleSheetPropagationInWidgetStyles, True)
     app = QApplication(sys.argv)
     
     # Set monospace font
@@ -5,6 +5,8 @@ from datetime import datetime
 
 # Add current directory to path
 sys.path.insert(0, os.path.dirname(__file__))
+# python-implementation/ holds fine_use_cache, which themes shares with fine_use_pyqt
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from PySide6.QtWidgets import QApplication
 from PySide6.QtCore import QTimer, Qt
@@ -12,18 +14,24 @@ from PySide6.QtGui import QFont, QFontDatabase
 
 # Import themes directly
 from themes import THEMES
+from themes.applier import ThemeApplier
 from layouts.dashboard_layout import DashboardLayout
+from widgets.async_source import FineUseAsyncBridge, subprocess_lines
 
 class FineUseSystemMonitor(DashboardLayout):
-    def __init__(self):
+    def __init__(self, follow_command=None):
         super().__init__()
         self.current_theme = 'github-dark'
+        self.theme_applier = ThemeApplier(self)
+        self.async_bridge = FineUseAsyncBridge(self)
         self.setup_window()
         self.setup_theme_system()
         self.setup_real_time_updates()
         self.setup_demo_data()
         self.apply_theme(self.current_theme)
         self.show_startup_logs()
+        if follow_command:
+            self.follow(follow_command)
     
     def setup_window(self):
         self.setWindowTitle("Fine Use System Monitor - PySide6 Demo")
@@ -55,12 +63,11 @@ class FineUseSystemMonitor(DashboardLayout):
             return
         
         theme = THEMES[theme_name]
-        stylesheet = theme.get_stylesheet()
-        self.setStyleSheet(stylesheet)
+        self.theme_applier.apply(theme_name)
         self.current_theme = theme_name
         
         system_log, _ = self.get_terminals()
-        system_log.add_log_entry("SUCCESS", f"Theme changed to {theme.name}")
+        system_log.add_log("SUCCESS", f"Theme changed to {theme.name}")
     
     def update_metrics(self):
         cpu_metric, memory_metric, disk_metric = self.get_metrics()
@@ -69,13 +76,13 @@ class FineUseSystemMonitor(DashboardLayout):
         memory_change = random.randint(-5, 5)
         disk_change = random.randint(-15, 15)
         
-        new_cpu = max(10, min(95, cpu_metric.get_value() + cpu_change))
-        new_memory = max(20, min(90, memory_metric.get_value() + memory_change))
-        new_disk = max(5, min(85, disk_metric.get_value() + disk_change))
+        new_cpu = max(10, min(95, cpu_metric.current_value + cpu_change))
+        new_memory = max(20, min(90, memory_metric.current_value + memory_change))
+        new_disk = max(5, min(85, disk_metric.current_value + disk_change))
         
-        cpu_metric.update_value(new_cpu)
-        memory_metric.update_value(new_memory)
-        disk_metric.update_value(new_disk)
+        cpu_metric.set_value(new_cpu)
+        memory_metric.set_value(new_memory)
+        disk_metric.set_value(new_disk)
     
     def generate_random_log(self):
         system_log, operations_log = self.get_terminals()
@@ -108,23 +115,38 @@ class FineUseSystemMonitor(DashboardLayout):
         
         if random.choice([True, False]):
             level, message = random.choice(system_messages)
-            system_log.add_log_entry(level, message)
+            system_log.add_log(level, message)
         else:
             level, message = random.choice(operations_messages)
-            operations_log.add_log_entry(level, message)
+            operations_log.add_log(level, message)
+    
+    def follow(self, command):
+        """Stream a command's output into the system log instead of sample messages"""
+        system_log, _ = self.get_terminals()
+        self.log_timer.stop()
+        system_log.add_log("INFO", f"Following: {' '.join(command)}")
+        system_log.subscribe(self.async_bridge, subprocess_lines(*command))
+        self.async_bridge.source_finished.connect(
+            lambda subscription: system_log.add_log(
+                "ERROR" if subscription.error else "INFO",
+                f"Stream ended: {subscription.error or 'process exited'}"
+            )
+        )
     
     def show_startup_logs(self):
         system_log, operations_log = self.get_terminals()
         
-        system_log.add_log_entry("SUCCESS", "Fine Use System Monitor started")
-        system_log.add_log_entry("INFO", "PySide6 implementation initialized")
-        system_log.add_log_entry("SUCCESS", "All 10 themes loaded successfully")
+        system_log.add_log("SUCCESS", "Fine Use System Monitor started")
+        system_log.add_log("INFO", "PySide6 implementation initialized")
+        system_log.add_log("SUCCESS", "All 10 themes loaded successfully")
         
-        operations_log.add_log_entry("INFO", "Dashboard layout manager active")
-        operations_log.add_log_entry("SUCCESS", "Real-time metrics system online")
-        operations_log.add_log_entry("INFO", "Perfect button alignment achieved")
+        operations_log.add_log("INFO", "Dashboard layout manager active")
+        operations_log.add_log("SUCCESS", "Real-time metrics system online")
+        operations_log.add_log("INFO", "Perfect button alignment achieved")
 
 def main():
+    # ThemeApplier needs style sheet propagation, set before any widget exists
+    QApplication.setAttribute(Qt.ApplicationAttribute.AA_UseStyleSheetPropagationInWidgetStyles, True)
     app = QApplication(sys.argv)
     
     QApplication.setApplicationName("Fine Use System Monitor")
@@ -143,7 +165,9 @@ def main():
     default_font.setStyleHint(QFont.Monospace)
     QApplication.setFont(default_font)
     
-    window = FineUseSystemMonitor()
+    # launcher.py --follow tail -f /var/log/syslog
+    follow_command = sys.argv[sys.argv.index("--follow") + 1:] if "--follow" in sys.argv else None
+    window = FineUseSystemMonitor(follow_command)
     window.show()
     
     sys.exit(app.exec())
@@ -11,7 +11,10 @@ from datetime import datetime
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
-from widgets import FineUseButton, MetricWidget, LogTerminal, ThemeSelector
+from widgets.fine_use_button import FineUseButton
+from widgets.metric_widget import FineUseMetricWidget
+from widgets.log_terminal import FineUseLogTerminalWithControls
+from widgets.theme_selector import FineUseThemeSelector
 
 class DashboardLayout(QMainWindow):
     """Main Fine Use dashboard with perfect proportional layout"""
@@ -78,7 +81,7 @@ class DashboardLayout(QMainWindow):
         title_layout.addWidget(subtitle)
         
         # Theme selector
-        self.theme_selector = ThemeSelector()
+        self.theme_selector = FineUseThemeSelector()
         
         # Add to header layout
         header_layout.addWidget(title_widget)
@@ -99,9 +102,9 @@ class DashboardLayout(QMainWindow):
         metrics_layout.setSpacing(16)
         
         # Create three metrics with PERFECT equal widths
-        self.cpu_metric = MetricWidget("CPU USAGE", "%", 45)
-        self.memory_metric = MetricWidget("MEMORY", "%", 67)
-        self.disk_metric = MetricWidget("DISK I/O", "%", 23)
+        self.cpu_metric = FineUseMetricWidget("CPU USAGE", 45)
+        self.memory_metric = FineUseMetricWidget("MEMORY", 67)
+        self.disk_metric = FineUseMetricWidget("DISK I/O", 23)
         
         # Add to layout with equal stretch factors (GUARANTEED equal widths)
         metrics_layout.addWidget(self.cpu_metric, stretch=1)
@@ -260,8 +263,8 @@ class DashboardLayout(QMainWindow):
         terminal_layout.setSpacing(16)
         
         # Create two terminals side by side
-        self.system_log = LogTerminal("SYSTEM EVENT LOG")
-        self.operations_log = LogTerminal("OPERATIONS LOG")
+        self.system_log = FineUseLogTerminalWithControls("SYSTEM EVENT LOG")
+        self.operations_log = FineUseLogTerminalWithControls("OPERATIONS LOG")
         
         # Add with equal widths
         terminal_layout.addWidget(self.system_log, stretch=1)
@@ -298,7 +301,7 @@ class DashboardLayout(QMainWindow):
         
         return status_container
     
-    def get_theme_selector(self) -> ThemeSelector:
+    def get_theme_selector(self) -> FineUseThemeSelector:
         """Get the theme selector widget for connecting signals"""
         return self.theme_selector
     
@@ -1,35 +1,157 @@
 # Fine Use Design System - PySide6 Themes
 # COMPLETE REWRITE - Pixel-perfect matching HTML demos
 
-from typing import Dict, Any
-
-# Core Fine Use Themes - Exact color values from CSS
-FINE_USE_THEMES = {
-    "github-dark": {
-        "name": "Dark Mode",
-        "colors": {
-            "bg": "#0d1117",
-            "surface": "#161b22", 
-            "border": "#30363d",
-            "text": "#f0f6fc",
-            "comment": "#7d8590",
-            "success": "#238636",
-            "warning": "#d29922",
-            "error": "#da3633",
-            "info": "#1f6feb",
-            "accent": "#58a6ff",
-            "orange": "#fd7d00"
-        }
-    }
+import importlib
+import re
+import threading
+import time
+from collections.abc import Mapping
+from typing import Dict, Iterator, NamedTuple, Optional, Tuple
+
+# The compiled-theme LRU is shared with fine_use_pyqt; the demo entry
+# points put python-implementation/ (fine_use_cache.py) on sys.path
+from fine_use_cache import LRUCache
+
+class FineUseTheme(NamedTuple):
+    """A theme definition: display name and color tokens"""
+    name: str
+    colors: Dict[str, str]
+
+DEFAULT_THEME = "github-dark"
+
+# Theme key -> (module in this package, selector display name).
+# Each module defines its theme as the module name in upper case.
+THEME_INDEX = {
+    "github-dark": ("github_dark", "Dark Mode"),
+    "github-light": ("github_light", "Light Mode"),
+    "amber": ("amber", "Amber Terminal"),
+    "gruvbox": ("gruvbox", "Gruvbox"),
+    "monochrome": ("monochrome", "Monochrome"),
+    "monokai": ("monokai", "Monokai"),
+    "newspaper": ("newspaper", "Newspaper"),
+    "sakura": ("sakura", "Sakura"),
+    "synthwave": ("synthwave", "Synthwave"),
+    "vt220": ("vt220", "VT220"),
 }
 
+class ThemeRegistry(Mapping):
+    """Every theme by key; a theme module is imported on first lookup"""
+    
+    def __init__(self, index: Dict[str, Tuple[Optional[str], str]]):
+        self._index = dict(index)
+        self._themes: Dict[str, FineUseTheme] = {}
+    
+    def __getitem__(self, key: str) -> FineUseTheme:
+        theme = self._themes.get(key)
+        if theme is None:
+            module_name = self._index[key][0]
+            module = importlib.import_module(f"{__name__}.{module_name}")
+            theme = self._themes[key] = getattr(module, module_name.upper())
+        return theme
+    
+    def __contains__(self, key) -> bool:
+        return key in self._index
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+    
+    def __len__(self) -> int:
+        return len(self._index)
+    
+    @property
+    def loaded(self) -> Tuple[str, ...]:
+        """Keys of the themes imported so far"""
+        return tuple(self._themes)
+    
+    def display_names(self) -> Dict[str, str]:
+        """Theme key -> display name, without importing any theme"""
+        return {key: display_name for key, (_, display_name) in self._index.items()}
+    
+    def register(self, key: str, theme: FineUseTheme, display_name: Optional[str] = None):
+        """Add a theme defined at runtime"""
+        if key in self._index:
+            raise ValueError(f"Theme '{key}' is already registered")
+        self._index[key] = (None, display_name or theme.name)
+        self._themes[key] = theme
+
+THEMES = ThemeRegistry(THEME_INDEX)
+
+_RULE = re.compile(r'([^{}]+)\{([^{}]*)\}')
+_COMMENT = re.compile(r'/\*.*?\*/', re.S)
+
+def resolve_theme_name(theme_name: str) -> str:
+    """Theme key that will actually be used (unknown keys fall back to github-dark)"""
+    return theme_name if theme_name in THEMES else DEFAULT_THEME
+
+class CompiledTheme(NamedTuple):
+    """A theme's QSS text and its (selector, declarations) rules"""
+    qss: str
+    rules: Tuple[Tuple[str, str], ...]
+
+class ThemeCache(LRUCache):
+    """Bounded LRU of compiled themes with hit/miss counters (thread-safe)"""
+    
+    def get(self, theme_key: str) -> CompiledTheme:
+        """Compiled theme for a registered key, compiling it on a miss"""
+        return self.cached(theme_key, lambda: compile_theme(theme_key))
+    
+    def warm(self, theme_key: str) -> bool:
+        """Compile ahead of use, as least recently used and without counting a lookup"""
+        return self.prewarm(theme_key, lambda: compile_theme(theme_key))
+
+THEME_CACHE = ThemeCache()
+
+class ThemePrewarmer:
+    """Imports and compiles themes on a worker thread so switching only pays the apply"""
+    
+    def __init__(self, cache: ThemeCache = THEME_CACHE):
+        self.cache = cache
+        self.compiled = 0
+        self.elapsed = 0.0
+        self._thread: Optional[threading.Thread] = None
+    
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+    
+    def start(self, active: Optional[str] = None):
+        """Warm every registered theme except the active one"""
+        if self.running:
+            return
+        keys = [key for key in THEMES if key != active]
+        self._thread = threading.Thread(target=self._run, args=(keys,), name="fine-use-prewarm", daemon=True)
+        self._thread.start()
+    
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until warming is done; returns False on timeout"""
+        if self._thread is not None:
+            self._thread.join(timeout)
+        return not self.running
+    
+    def _run(self, keys):
+        start = time.perf_counter()
+        for key in keys:
+            if self.cache.warm(key):
+                self.compiled += 1
+        self.elapsed = time.perf_counter() - start
+
 def get_theme_qss(theme_name: str) -> str:
+    """QSS stylesheet for a theme, compiled once and kept in THEME_CACHE"""
+    return THEME_CACHE.get(resolve_theme_name(theme_name)).qss
+
+def get_theme_rules(theme_name: str) -> Tuple[Tuple[str, str], ...]:
+    """(selector, declarations) pairs of a theme's compiled QSS, in order"""
+    return THEME_CACHE.get(resolve_theme_name(theme_name)).rules
+
+def compile_theme(theme_key: str) -> CompiledTheme:
+    """Build and parse a theme's QSS (uncached)"""
+    qss = build_theme_qss(theme_key)
+    rules = tuple((selector.strip(), body) for selector, body in _RULE.findall(_COMMENT.sub('', qss)))
+    return CompiledTheme(qss, rules)
+
+def build_theme_qss(theme_name: str) -> str:
     """Generate PERFECT QSS stylesheet matching HTML demos exactly"""
-    if theme_name not in FINE_USE_THEMES:
-        theme_name = "github-dark"
-    
-    theme = FINE_USE_THEMES[theme_name]
-    colors = theme["colors"]
+    colors = THEMES[resolve_theme_name(theme_name)].colors
     
     return f"""
 /* Fine Use Design System - PERFECT PIXEL MATCHING */
@@ -282,7 +404,7 @@ QPushButton[objectName="success"]:hover {{
 }}
 
 /* === PERFECT LOG TERMINAL === */
-QTextEdit {{
+QTextEdit, QPlainTextEdit {{
     background-color: {colors['bg']};
     border: 2px solid {colors['border']};
     color: {colors['text']};
@@ -367,10 +489,8 @@ QHBoxLayout {{
 
 def get_available_themes() -> Dict[str, str]:
     """Get all available theme names and display names"""
-    return {key: value["name"] for key, value in FINE_USE_THEMES.items()}
+    return THEMES.display_names()
 
 def get_theme_colors(theme_name: str) -> Dict[str, str]:
     """Get color palette for a specific theme"""
-    if theme_name not in FINE_USE_THEMES:
-        theme_name = "github-dark"
-    return FINE_USE_THEMES[theme_name]["colors"]
+    return THEMES[resolve_theme_name(theme_name)].colors
@@ -0,0 +1,160 @@
+"""Incremental theme application for Fine Use PySide6 windows"""
+
+from functools import partial
+from typing import Dict, List, Optional, Tuple
+
+from PySide6.QtCore import QTimer
+from PySide6.QtWidgets import QWidget
+
+from . import ThemePrewarmer, get_theme_rules, resolve_theme_name
+
+THEME_PROPERTY = "fineUseTheme"
+
+# (type name, objectName) a selector can match; None matches anything
+Target = Tuple[Optional[str], Optional[str]]
+Rules = Tuple[Tuple[str, str], ...]
+
+
+def _is_window_rule(selector: str) -> bool:
+    """Rules addressed to every QWidget are applied to the window alone"""
+    return 'QWidget' in (part.strip() for part in selector.split(','))
+
+
+def _target(selector: str) -> Target:
+    """Widget type and objectName (#name or [objectName=...]) the last compound of a selector needs
+
+    Pseudo-states, sub-controls and ancestors are ignored, so a widget
+    is over- rather than under-matched.
+    """
+    compound = selector.split()[-1].split(':')[0]
+    head, _, attribute = compound.partition('[')
+    type_name, _, name = head.partition('#')
+    if attribute.startswith('objectName='):
+        name = attribute[len('objectName='):].rstrip(']').strip('"\'')
+    return (type_name if type_name not in ('', '*') else None), (name or None)
+
+
+def _rule_map(rules: Rules) -> Dict[str, str]:
+    """Declarations of a theme by selector (a repeated selector's bodies are joined in order)"""
+    bodies: Dict[str, str] = {}
+    for selector, body in rules:
+        bodies[selector] = bodies[selector] + body if selector in bodies else body
+    return bodies
+
+
+def _widget_rules(rules: Dict[str, str]) -> Tuple[Tuple[Tuple[Target, ...], str], ...]:
+    """Per-widget rules of a theme as (targets, declarations)"""
+    return tuple(
+        (tuple(_target(part) for part in selector.split(',')), body)
+        for selector, body in rules.items()
+        if not _is_window_rule(selector)
+    )
+
+
+class ThemeApplier:
+    """Apply Fine Use themes to a window, restyling only what changed
+
+    ``setStyleSheet`` on a top-level window makes Qt unpolish and repolish
+    every descendant. The applier installs one stylesheet holding the rules
+    of every theme it has applied, scoped under a ``fineUseTheme`` property
+    of the window. Switching between those themes flips the property and
+    repolishes only the widgets whose matching rules differ between the two
+    themes; a theme seen for the first time extends the stylesheet (one
+    full restyle). Window colours and fonts reach plain child widgets via
+    style sheet propagation instead of a rule per widget, so the
+    application must set
+    ``Qt.ApplicationAttribute.AA_UseStyleSheetPropagationInWidgetStyles``
+    once, before any widget exists (the demo entry points do). It is
+    application-wide, so the applier leaves it to the caller.
+
+    With prewarm (default) the other themes are compiled on a worker
+    thread once the event loop is idle after the first apply.
+    """
+
+    def __init__(self, window: QWidget, prewarm: bool = True):
+        self.window = window
+        self.theme: Optional[str] = None
+        self.restyled = 0
+        self.skipped = 0
+        self.prewarmer = ThemePrewarmer() if prewarm else None
+        self._themes: List[str] = []
+        self._rules: Dict[str, Dict[str, str]] = {}
+        self._widget_rules: Dict[str, tuple] = {}
+        self._signatures: Dict[Tuple[str, str, str], Tuple[str, ...]] = {}
+
+    def apply(self, theme_name: str) -> int:
+        """Apply a theme to the window, returns the number of widgets restyled"""
+        theme = resolve_theme_name(theme_name)
+        if theme == self.theme:
+            self.restyled, self.skipped = 0, len(self.window.findChildren(QWidget)) + 1
+            return 0
+
+        previous, self.theme = self.theme, theme
+        window = self.window
+        widgets = window.findChildren(QWidget)
+        window.setUpdatesEnabled(False)
+        try:
+            window.setProperty(THEME_PROPERTY, theme)
+            if theme not in self._themes:
+                self._themes.append(theme)
+                self._rules[theme] = _rule_map(get_theme_rules(theme))
+                self._widget_rules[theme] = _widget_rules(self._rules[theme])
+                window.setStyleSheet(self._compile())
+                changed = widgets
+            else:
+                changed = [
+                    widget for widget in widgets
+                    if self._signature(widget, previous) != self._signature(widget, theme)
+                ]
+                style = window.style()
+                for widget in [window] + changed:
+                    style.unpolish(widget)
+                    style.polish(widget)
+        finally:
+            window.setUpdatesEnabled(True)
+
+        self.restyled = len(changed) + 1
+        self.skipped = len(widgets) - len(changed)
+        if previous is None and self.prewarmer is not None:
+            QTimer.singleShot(0, partial(self.prewarmer.start, theme))
+        return self.restyled
+
+    def _compile(self) -> str:
+        """Stylesheet with the rules of every applied theme
+
+        Rules are matched across themes by selector. One every theme
+        declares identically is written once; any other is written under
+        the scope of each theme that has it.
+        """
+        blocks = []
+        scopes = [(f'[{THEME_PROPERTY}="{theme}"]', self._rules[theme]) for theme in self._themes]
+        selectors = dict.fromkeys(selector for _, rules in scopes for selector in rules)
+        for selector in selectors:
+            bodies = [rules.get(selector) for _, rules in scopes]
+            window_rule = _is_window_rule(selector)
+            if not window_rule and None not in bodies and len(set(bodies)) == 1:
+                blocks.append(f"{selector} {{{bodies[0]}}}")
+                continue
+            for (scope, _), body in zip(scopes, bodies):
+                if body is None:
+                    continue
+                if window_rule:
+                    blocks.append(f"{scope} {{{body}}}")
+                else:
+                    scoped = ', '.join(f"{scope} {part.strip()}" for part in selector.split(','))
+                    blocks.append(f"{scoped} {{{body}}}")
+        return '\n'.join(blocks)
+
+    def _signature(self, widget: QWidget, theme: str) -> Tuple[str, ...]:
+        """Declarations of every rule of a theme that can match the widget"""
+        meta = widget.metaObject()
+        key = (meta.className(), widget.objectName(), theme)
+        signature = self._signatures.get(key)
+        if signature is None:
+            name = key[1]
+            signature = self._signatures[key] = tuple(
+                body for targets, body in self._widget_rules[theme]
+                if any((type_name is None or widget.inherits(type_name)) and (target is None or target == name)
+                       for type_name, target in targets)
+            )
+        return signature
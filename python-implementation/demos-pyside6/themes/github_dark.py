@@ -14,6 +14,7 @@ GITHUB_DARK = FineUseTheme(
         'success': '#238636',
         'warning': '#d29922',
         'error': '#da3633',
-        'info': '#1f6feb'
+        'info': '#1f6feb',
+        'orange': '#fd7d00'
     }
 )
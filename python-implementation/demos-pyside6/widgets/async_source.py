@@ -0,0 +1,271 @@
+"""
+Fine Use Design System - Async Sources
+Feed log terminals and metric widgets from asyncio streams
+"""
+
+from PySide6.QtCore import QObject, QCoreApplication, QMetaObject, Qt, Signal, Slot
+from typing import Any, AsyncIterable, AsyncIterator, Callable, List, Optional
+import asyncio
+import concurrent.futures
+import threading
+
+_END = object()
+
+class FineUseStreamSubscription:
+    """One async source feeding a widget through a FineUseAsyncBridge
+    
+    A producer task reads the source into a queue of at most capacity
+    items (transform, if given, is applied there, off the GUI thread).
+    A sender task hands the queued items to the GUI thread in batches of
+    up to batch_size, and sink(batch) is called there. Only max_batches
+    batches may be in flight: the sender waits until the GUI thread has
+    applied one before sending another. A GUI that falls behind fills
+    the queue, the producer stops reading and the pressure reaches the
+    writer - a child process blocks on its full stdout pipe, a socket
+    peer on a full socket buffer, an async generator is not resumed.
+    
+    pause() holds delivered batches (and so their credit) until resume().
+    """
+    
+    def __init__(self, bridge: 'FineUseAsyncBridge', source: AsyncIterable, sink: Callable[[list], Any],
+                 transform: Optional[Callable[[Any], Any]] = None, batch_size: int = 1000,
+                 capacity: int = 10000, max_batches: int = 1):
+        if batch_size < 1 or capacity < 1 or max_batches < 1:
+            raise ValueError("batch_size, capacity and max_batches must be at least 1")
+        self.bridge = bridge
+        self.source = source
+        self.sink = sink
+        self.transform = transform
+        self.batch_size = batch_size
+        self.capacity = capacity
+        self.max_batches = max_batches
+        self.paused = False
+        self.error: Optional[BaseException] = None
+        self.delivered = 0
+        self.batches = 0
+        self._held: List[list] = []
+        self._credits: Optional[asyncio.Semaphore] = None
+        self._future: Optional[concurrent.futures.Future] = None
+    
+    @property
+    def running(self) -> bool:
+        """True until the source is exhausted, fails or the subscription is cancelled"""
+        return self._future is not None and not self._future.done()
+    
+    def start(self) -> 'FineUseStreamSubscription':
+        self._future = asyncio.run_coroutine_threadsafe(self._run(), self.bridge.loop)
+        return self
+    
+    def cancel(self):
+        """Stop reading the source; batches already delivered stay applied"""
+        if self._future is not None:
+            self._future.cancel()
+        self._held = []
+    
+    def pause(self):
+        """Hold incoming batches - the source is throttled once the queue is full"""
+        self.paused = True
+    
+    def resume(self):
+        """Apply the held batches and let the source flow again"""
+        self.paused = False
+        held, self._held = self._held, []
+        for batch in held:
+            try:
+                self._apply(batch)
+            except Exception as error:
+                # As in FineUseAsyncBridge._dispatch: keep applying the rest
+                self.error = error
+    
+    async def _run(self):
+        queue: asyncio.Queue = asyncio.Queue(self.capacity)
+        credits = self._credits = asyncio.Semaphore(self.max_batches)
+        producer = asyncio.ensure_future(self._produce(queue))
+        try:
+            ended = False
+            while not ended:
+                await credits.acquire()
+                batch = []
+                item = await queue.get()
+                while True:
+                    if item is _END:
+                        ended = True
+                        break
+                    batch.append(item)
+                    if len(batch) >= self.batch_size or queue.empty():
+                        break
+                    item = queue.get_nowait()
+                if batch:
+                    self.bridge._post(self, batch)
+                else:
+                    credits.release()
+        finally:
+            producer.cancel()
+            self.bridge._post(self, None)
+    
+    async def _produce(self, queue: asyncio.Queue):
+        transform = self.transform
+        try:
+            async for item in self.source:
+                await queue.put(item if transform is None else transform(item))
+        except Exception as error:
+            self.error = error
+        finally:
+            close = getattr(self.source, 'aclose', None)
+            if close is not None:
+                await close()
+        await queue.put(_END)
+    
+    def _deliver(self, batch: list):
+        """Called on the GUI thread for each batch the sender posts"""
+        if self.paused:
+            self._held.append(batch)
+        elif self._future is not None and not self._future.cancelled():
+            self._apply(batch)
+    
+    def _apply(self, batch: list):
+        try:
+            self.sink(batch)
+        finally:
+            self.delivered += len(batch)
+            self.batches += 1
+            loop = self.bridge._loop
+            if loop is not None and not loop.is_closed():
+                loop.call_soon_threadsafe(self._credits.release)
+
+class FineUseAsyncBridge(QObject):
+    """asyncio event loop running alongside the Qt event loop
+    
+    The asyncio loop runs in a daemon thread and sleeps in its selector
+    until a pipe, socket or timer is ready. Batches for the GUI thread
+    are queued, and a queued call wakes the Qt loop when the queue was
+    empty, so every batch posted meanwhile is applied in one pass.
+    Neither loop polls the other; widgets are only touched from the GUI
+    thread.
+    
+    subscribe() connects an async source (subprocess_lines,
+    unix_socket_lines or any async generator) to a sink callable such as
+    FineUseLogTerminal.add_log_entries; source_finished(subscription) is
+    emitted when a source is exhausted, fails (subscription.error) or is
+    cancelled. An exception raised by a sink is stored in
+    subscription.error too, and dispatching carries on with the other
+    batches. The loop stops when the application quits.
+    """
+    
+    source_finished = Signal(object)
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.subscriptions: List[FineUseStreamSubscription] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._posted: List[tuple] = []
+        self._posted_lock = threading.Lock()
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.stop)
+    
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The asyncio event loop, started on first use"""
+        if self._loop is None:
+            self.start()
+        return self._loop
+    
+    def start(self):
+        """Start the asyncio loop thread (subscribe() does so when needed)"""
+        if self._thread is not None:
+            return
+        loop = asyncio.new_event_loop()
+        ready = threading.Event()
+        
+        def run():
+            asyncio.set_event_loop(loop)
+            loop.call_soon(ready.set)
+            try:
+                loop.run_forever()
+                tasks = asyncio.all_tasks(loop)
+                for task in tasks:
+                    task.cancel()
+                loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+                loop.run_until_complete(loop.shutdown_asyncgens())
+            finally:
+                loop.close()
+        
+        self._loop = loop
+        self._thread = threading.Thread(target=run, name='fine-use-asyncio', daemon=True)
+        self._thread.start()
+        ready.wait()
+    
+    def stop(self, timeout: float = 2.0):
+        """Cancel every subscription and stop the asyncio loop"""
+        if self._thread is None:
+            return
+        for subscription in self.subscriptions:
+            subscription.cancel()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout)
+        self._thread = None
+        self._loop = None
+    
+    def run(self, coroutine) -> concurrent.futures.Future:
+        """Schedule a coroutine on the asyncio loop (from any thread)"""
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop)
+    
+    def subscribe(self, source: AsyncIterable, sink: Callable[[list], Any],
+                  transform: Optional[Callable[[Any], Any]] = None, batch_size: int = 1000,
+                  capacity: int = 10000, max_batches: int = 1) -> FineUseStreamSubscription:
+        """Start feeding sink(batch) on the GUI thread from an async source"""
+        subscription = FineUseStreamSubscription(self, source, sink, transform, batch_size, capacity, max_batches)
+        self.subscriptions.append(subscription)
+        return subscription.start()
+    
+    def _post(self, subscription: FineUseStreamSubscription, batch: Optional[list]):
+        """Queue a batch (None once the source has ended) for the GUI thread - asyncio thread"""
+        with self._posted_lock:
+            wake = not self._posted
+            self._posted.append((subscription, batch))
+        if wake:
+            QMetaObject.invokeMethod(self, '_dispatch', Qt.ConnectionType.QueuedConnection)
+    
+    @Slot()
+    def _dispatch(self):
+        with self._posted_lock:
+            posted, self._posted = self._posted, []
+        for subscription, batch in posted:
+            try:
+                if batch is not None:
+                    subscription._deliver(batch)
+                    continue
+                if subscription in self.subscriptions:
+                    self.subscriptions.remove(subscription)
+                self.source_finished.emit(subscription)
+            except Exception as error:
+                # One failing sink must not lose the batches posted after it
+                subscription.error = error
+
+async def subprocess_lines(*command: str, encoding: str = 'utf-8', **kwargs) -> AsyncIterator[str]:
+    """Lines a child process writes to stdout and stderr, without line endings
+    
+    The process is killed if the subscription ends before it exits.
+    """
+    process = await asyncio.create_subprocess_exec(
+        *command, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.STDOUT, **kwargs
+    )
+    try:
+        async for line in process.stdout:
+            yield line.decode(encoding, 'replace').rstrip('\r\n')
+        await process.wait()
+    finally:
+        if process.returncode is None:
+            process.kill()
+            await process.wait()
+
+async def unix_socket_lines(path: str, encoding: str = 'utf-8') -> AsyncIterator[str]:
+    """Lines read from a Unix domain socket until the peer closes it"""
+    reader, writer = await asyncio.open_unix_connection(path)
+    try:
+        async for line in reader:
+            yield line.decode(encoding, 'replace').rstrip('\r\n')
+    finally:
+        writer.close()
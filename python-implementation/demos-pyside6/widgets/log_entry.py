@@ -0,0 +1,168 @@
+"""
+Fine Use Design System - Log Entry
+Slotted log record, text line parsing and timestamp formatting
+"""
+
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Union
+import re
+import time
+
+# Level ids index LEVELS (the order of FineUseLogTerminal.LOG_LEVELS)
+LEVELS = ('INFO', 'WARN', 'ERROR', 'SUCCESS', 'DEBUG')
+LEVEL_ALIASES = {'WARNING': 'WARN', 'CRITICAL': 'ERROR', 'FATAL': 'ERROR'}
+DEFAULT_LEVEL_ID = LEVELS.index('INFO')
+
+# Names of other logging systems and the usual spellings map straight to an id
+LEVEL_IDS: Dict[str, int] = {}
+for _name, _level in [(level, level) for level in LEVELS] + list(LEVEL_ALIASES.items()):
+    for _spelling in (_name, _name.lower(), _name.capitalize()):
+        LEVEL_IDS[_spelling] = LEVELS.index(_level)
+del _name, _level, _spelling
+
+# '[2024-05-01 12:00:00,123] ERROR: message' - an optional local date and
+# time (fraction up to ns, optionally bracketed), an optional level word
+# and the rest of the line. After a stamp a bare level word counts;
+# without one only '[level]' or 'level:' does, so 'Success rate 99%'
+# stays a whole INFO message
+_LEVEL_WORD = r'(?i:info|warn|warning|error|critical|fatal|success|debug)'
+LINE = re.compile(
+    r'(?:\[?(\d{4}-\d\d-\d\d[T ]\d\d:\d\d:\d\d|\d\d:\d\d:\d\d)(?:[.,](\d{1,9}))?\]?\s+)?'
+    rf'(?:(?(1)|(?=\[{_LEVEL_WORD}\]|{_LEVEL_WORD}:))\[?({_LEVEL_WORD})\b\]?:?\s*)?'
+    r'(.*)'
+)
+
+_FRACTION_NS = tuple(10 ** (9 - digits) for digits in range(10))
+_CACHE_SIZE = 4096
+_stamp_ns: Dict[str, int] = {}
+_time_prefixes: Dict[int, str] = {}
+
+class LogEntry:
+    """One log line: ns since the epoch, level id (index into LEVELS) and message"""
+    
+    __slots__ = ('ts_ns', 'level_id', 'message')
+    
+    def __init__(self, ts_ns: int, level_id: int, message: str):
+        self.ts_ns = ts_ns
+        self.level_id = level_id
+        self.message = message
+    
+    @classmethod
+    def from_record(cls, level: str, message: str,
+                    timestamp: Union[datetime, float, None] = None) -> 'LogEntry':
+        """LogEntry for a (level, message[, timestamp]) record
+        
+        timestamp is a datetime or seconds since the epoch (time.time());
+        None means now. Unknown levels log as INFO.
+        """
+        return cls(to_ns(timestamp), level_id(level), message)
+    
+    @property
+    def level(self) -> str:
+        return LEVELS[self.level_id]
+    
+    @property
+    def timestamp(self) -> datetime:
+        return datetime.fromtimestamp(self.ts_ns / 1e9)
+    
+    def __eq__(self, other):
+        if other.__class__ is not LogEntry:
+            return NotImplemented
+        return (self.ts_ns, self.level_id, self.message) == (other.ts_ns, other.level_id, other.message)
+    
+    def __hash__(self):
+        return hash((self.ts_ns, self.level_id, self.message))
+    
+    def __repr__(self):
+        return f"LogEntry(ts_ns={self.ts_ns}, level_id={self.level_id} ({self.level}), message={self.message!r})"
+
+def level_id(level: str) -> int:
+    """Level id for a level name (unknown levels log as INFO)"""
+    found = LEVEL_IDS.get(level)
+    if found is None:
+        found = LEVEL_IDS.get(str(level).upper(), DEFAULT_LEVEL_ID)
+    return found
+
+def to_ns(timestamp: Union[datetime, float, None]) -> int:
+    """ns since the epoch of a datetime or of seconds since the epoch (None: now)"""
+    if timestamp is None:
+        return time.time_ns()
+    if isinstance(timestamp, datetime):
+        timestamp = timestamp.timestamp()
+    return int(timestamp * 1e9)
+
+def _stamp_seconds(key: str) -> Optional[int]:
+    """ns since the epoch of a local 'YYYY-MM-DD HH:MM:SS' stamp (None if it is no real time)"""
+    try:
+        ns = int(time.mktime(time.strptime(key.replace('T', ' '), '%Y-%m-%d %H:%M:%S'))) * 1_000_000_000
+    except ValueError:
+        return None
+    if len(_stamp_ns) >= _CACHE_SIZE:
+        _stamp_ns.clear()
+    _stamp_ns[key] = ns
+    return ns
+
+def parse_lines(lines: Iterable[str]) -> List[LogEntry]:
+    """LogEntry of each text line, parsed with LINE
+    
+    Stamps are converted once per distinct second ('HH:MM:SS' ones per
+    day); lines without one get the time of the call and lines without
+    a level word log as INFO. A stamp with an impossible date or time
+    ('2024-02-30', '99:99:99') leaves the whole line as an unstamped
+    INFO message.
+    """
+    match, stamps, level_ids, fraction_ns = LINE.match, _stamp_ns, LEVEL_IDS, _FRACTION_NS
+    now = time.time_ns()
+    today = time.strftime('%Y-%m-%d ')
+    entries = []
+    append = entries.append
+    for line in lines:
+        stamp, fraction, level, message = match(line).groups()
+        if stamp is None:
+            ts_ns = now
+        else:
+            key = stamp if len(stamp) > 8 else today + stamp
+            ts_ns = stamps.get(key)
+            if ts_ns is None:
+                ts_ns = _stamp_seconds(key)
+                if ts_ns is None:
+                    append(LogEntry(now, DEFAULT_LEVEL_ID, line))
+                    continue
+            if fraction is not None:
+                ts_ns += int(fraction) * fraction_ns[len(fraction)]
+        if level is None:
+            append(LogEntry(ts_ns, DEFAULT_LEVEL_ID, message))
+        else:
+            found = level_ids.get(level)
+            append(LogEntry(ts_ns, level_id(level) if found is None else found, message))
+    return entries
+
+def parse_line(line: str) -> LogEntry:
+    """LogEntry of one text line (see parse_lines)"""
+    return parse_lines((line,))[0]
+
+def time_prefix(ts_ns: int) -> str:
+    """'[HH:MM:SS]' local time of a timestamp, formatted once per second"""
+    second = ts_ns // 1_000_000_000
+    prefix = _time_prefixes.get(second)
+    if prefix is None:
+        if len(_time_prefixes) >= _CACHE_SIZE:
+            _time_prefixes.clear()
+        prefix = _time_prefixes[second] = time.strftime('[%H:%M:%S]', time.localtime(second))
+    return prefix
+
+def format_lines(entries: Iterable[LogEntry]) -> List[str]:
+    """'[HH:MM:SS] LEVEL message' of each entry"""
+    prefixes, levels = _time_prefixes, LEVELS
+    lines = []
+    append = lines.append
+    for entry in entries:
+        prefix = prefixes.get(entry.ts_ns // 1_000_000_000)
+        if prefix is None:
+            prefix = time_prefix(entry.ts_ns)
+        append(f"{prefix} {levels[entry.level_id]} {entry.message}")
+    return lines
+
+def format_line(entry: LogEntry) -> str:
+    """'[HH:MM:SS] LEVEL message' of an entry"""
+    return f"{time_prefix(entry.ts_ns)} {LEVELS[entry.level_id]} {entry.message}"
@@ -0,0 +1,284 @@
+"""
+Fine Use Design System - Log File Source
+Memory-mapped, lazily indexed log files for FineUseLogView
+"""
+
+from PySide6.QtCore import Qt, QAbstractListModel, QModelIndex, QTimer, Signal
+from array import array
+from bisect import bisect_right
+from typing import Dict, Optional, Tuple
+import mmap
+import os
+import threading
+
+from .log_entry import LEVELS, LINE, DEFAULT_LEVEL_ID, level_id
+
+_DISPLAY_ROLE = int(Qt.ItemDataRole.DisplayRole)
+
+# Newlines are counted per fixed-size block; a line is found by locating
+# its block in the cumulative counts and scanning only that block
+BLOCK_SIZE = 4096
+CHUNK_SIZE = 8 * 1024 * 1024  # bytes read per indexing step (multiple of BLOCK_SIZE)
+
+def _block_counts(data: bytes, reverse: bool = False) -> array:
+    """Newline count of each BLOCK_SIZE block of data (from the end if reverse)"""
+    counts = array('Q')
+    if reverse:
+        for end in range(len(data), 0, -BLOCK_SIZE):
+            counts.append(data.count(b'\n', max(0, end - BLOCK_SIZE), end))
+    else:
+        for start in range(0, len(data) - BLOCK_SIZE + 1, BLOCK_SIZE):
+            counts.append(data.count(b'\n', start, start + BLOCK_SIZE))
+    return counts
+
+class FineUseLogFileModel(QAbstractListModel):
+    """Log file rows for FineUseLogView, read through mmap
+    
+    Opening shows the last tail_bytes of the file at once. The rest of the
+    file is indexed backwards on a worker thread in CHUNK_SIZE steps and
+    its rows are inserted above as each step lands. The index is one
+    newline count per 4 KiB block (about 2 bytes per KiB of log), and
+    only the lines being painted are decoded and parsed. The file is
+    polled every poll_interval_ms and appended lines are added like
+    tail -f; a file that shrinks (truncated or rotated) is reopened.
+    
+    Only complete lines are shown: a last line without a newline appears
+    once it is terminated.
+    """
+    
+    LEVELS = LEVELS
+    
+    # Worker -> GUI thread: (generation, block counts of the next step back)
+    _head_indexed = Signal(int, object)
+    indexing_finished = Signal()
+    
+    def __init__(self, path: str, parent=None, tail_bytes: int = 1024 * 1024,
+                 poll_interval_ms: int = 250, max_poll_bytes: int = 32 * 1024 * 1024):
+        super().__init__(parent)
+        self.path = path
+        self.tail_bytes = tail_bytes
+        self.max_poll_bytes = max_poll_bytes
+        self._generation = 0
+        self._file = None
+        self._mm: Optional[mmap.mmap] = None
+        self._worker: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._head_indexed.connect(self._apply_head)
+        self._open()
+        
+        self._poll_timer = QTimer(self)
+        self._poll_timer.setInterval(poll_interval_ms)
+        self._poll_timer.timeout.connect(self.poll)
+        if poll_interval_ms > 0:
+            self._poll_timer.start()
+    
+    @property
+    def indexing(self) -> bool:
+        """True until every line before the initial tail has been indexed"""
+        return not self._head_done
+    
+    @property
+    def size(self) -> int:
+        """Bytes of the file covered by the tail index"""
+        return self._tail_end
+    
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the line index"""
+        return (self._head_cum.itemsize * len(self._head_cum)
+                + self._tail_cum.itemsize * len(self._tail_cum))
+    
+    def _open(self):
+        """Map the file, index its tail and start indexing the rest backwards"""
+        self._stop = threading.Event()
+        self._generation += 1
+        self._rows: Dict[int, Tuple[str, int, str]] = {}
+        self._file = open(self.path, 'rb')
+        size = os.fstat(self._file.fileno()).st_size
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+        
+        # Initial tail: whole lines in the last tail_bytes
+        self._tail_start = 0
+        if size > self.tail_bytes:
+            self._tail_start = self._mm.rfind(b'\n', 0, size - self.tail_bytes) + 1
+        self._tail_cum = array('Q', [0])
+        self._tail_end = self._tail_start
+        self._tail_partial = 0
+        
+        # Lines before the tail: newlines counted backwards from _tail_start
+        self._head_cum = array('Q', [0])
+        self._head_rows = 0
+        self._head_done = self._tail_start == 0
+        self._extend_tail(size, notify=False)
+        if not self._head_done:
+            self._worker = threading.Thread(
+                target=self._index_head, args=(self._generation, self._tail_start, self._stop),
+                name="fine-use-log-index", daemon=True
+            )
+            self._worker.start()
+    
+    def close(self):
+        """Stop indexing and polling and release the mapping"""
+        self._poll_timer.stop()
+        self._stop.set()
+        self._generation += 1
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+    
+    def wait_indexed(self, timeout: Optional[float] = None) -> bool:
+        """Block until the worker has read the whole file (results land via the event loop)"""
+        if self._worker is not None:
+            self._worker.join(timeout)
+        return self._worker is None or not self._worker.is_alive()
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._head_rows + self._tail_rows()
+    
+    def data(self, index: QModelIndex, role=_DISPLAY_ROLE):
+        if role == _DISPLAY_ROLE:
+            return self.line(index.row())
+        return None
+    
+    def line(self, row: int) -> str:
+        """Raw text of a row"""
+        start, end = self._span(row)
+        return self._mm[start:end].decode('utf-8', 'replace').rstrip('\r')
+    
+    def time_text(self, row: int) -> str:
+        return self._parsed(row)[0]
+    
+    def level_id(self, row: int) -> int:
+        return self._parsed(row)[1]
+    
+    def message(self, row: int) -> str:
+        return self._parsed(row)[2]
+    
+    def poll(self):
+        """Add lines appended since the last poll; reopen a truncated or rotated file"""
+        if self._file is None:
+            return
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return
+        size = stat.st_size
+        if size < self._tail_end or stat.st_ino != os.fstat(self._file.fileno()).st_ino:
+            self.beginResetModel()
+            self.close()
+            self._open()
+            self.endResetModel()
+            self._poll_timer.start()
+        elif size > self._tail_end:
+            self._extend_tail(min(size, self._tail_end + self.max_poll_bytes))
+    
+    def _parsed(self, row: int) -> Tuple[str, int, str]:
+        """(time text, level id, message) of a row, parsed once while it stays cached"""
+        parsed = self._rows.get(row)
+        if parsed is None:
+            stamp, _, level, message = LINE.match(self.line(row)).groups()
+            if len(self._rows) >= 4096:
+                self._rows.clear()
+            parsed = self._rows[row] = (
+                f"[{stamp[-8:]}]" if stamp else '', DEFAULT_LEVEL_ID if level is None else level_id(level), message
+            )
+        return parsed
+    
+    def _span(self, row: int) -> Tuple[int, int]:
+        """Byte range of a row's text (without the newline)"""
+        head = self._head_rows
+        if row < head:
+            back = head - 1 - row
+            end = self._head_newline(back)
+            start = self._head_newline(back + 1) + 1 if back + 1 < self._head_cum[-1] else 0
+        else:
+            line = row - head
+            start = self._tail_start if line == 0 else self._tail_newline(line - 1) + 1
+            end = self._tail_newline(line)
+        return start, end
+    
+    def _head_newline(self, back: int) -> int:
+        """Offset of the back-th newline before the initial tail, counting backwards"""
+        cum = self._head_cum
+        block = bisect_right(cum, back) - 1
+        block_end = self._tail_start - block * BLOCK_SIZE
+        block_start = max(0, block_end - BLOCK_SIZE)
+        position = block_end
+        for _ in range(back - cum[block] + 1):
+            position = self._mm.rfind(b'\n', block_start, position)
+        return position
+    
+    def _tail_newline(self, line: int) -> int:
+        """Offset of the line-th newline from the initial tail on"""
+        cum = self._tail_cum
+        block = bisect_right(cum, line) - 1
+        block_start = self._tail_start + block * BLOCK_SIZE
+        block_end = self._tail_end if block == len(cum) - 1 else block_start + BLOCK_SIZE
+        position = block_start - 1
+        for _ in range(line - cum[block] + 1):
+            position = self._mm.find(b'\n', position + 1, block_end)
+        return position
+    
+    def _tail_rows(self) -> int:
+        return self._tail_cum[-1] + self._tail_partial
+    
+    def _extend_tail(self, end: int, notify: bool = True):
+        """Index the tail up to end, inserting the new rows at the bottom"""
+        if end <= self._tail_end:
+            return
+        if self._mm is None or len(self._mm) < end:
+            if self._mm is not None:
+                self._mm.close()
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        block_start = self._tail_start + (len(self._tail_cum) - 1) * BLOCK_SIZE
+        data = self._mm[block_start:end]
+        counts = _block_counts(data)
+        partial = data.count(b'\n', len(counts) * BLOCK_SIZE)
+        rows = self._tail_rows()
+        added = sum(counts) + partial - self._tail_partial
+        notify = notify and added > 0
+        
+        if notify:
+            self.beginInsertRows(QModelIndex(), self._head_rows + rows, self._head_rows + rows + added - 1)
+        total = self._tail_cum[-1]
+        for count in counts:
+            total += count
+            self._tail_cum.append(total)
+        self._tail_partial = partial
+        self._tail_end = end
+        if notify:
+            self.endInsertRows()
+    
+    def _index_head(self, generation: int, end: int, stop: threading.Event):
+        """Worker: count newlines in CHUNK_SIZE steps from end back to the start of the file"""
+        with open(self.path, 'rb') as f:
+            position = end
+            while position > 0 and not stop.is_set():
+                start = max(0, position - CHUNK_SIZE)
+                f.seek(start)
+                self._head_indexed.emit(generation, _block_counts(f.read(position - start), reverse=True))
+                position = start
+    
+    def _apply_head(self, generation: int, counts: array):
+        """GUI thread: add a step of head block counts and insert the rows it completes"""
+        if generation != self._generation:
+            return
+        cum = self._head_cum
+        total = cum[-1]
+        for count in counts:
+            total += count
+            cum.append(total)
+        self._head_done = (len(cum) - 1) * BLOCK_SIZE >= self._tail_start
+        # The earliest newline's line is only complete once its start is known
+        rows = total if self._head_done else max(0, total - 1)
+        added = rows - self._head_rows
+        if added:
+            self.beginInsertRows(QModelIndex(), 0, added - 1)
+            self._head_rows = rows
+            self._rows = {}
+            self.endInsertRows()
+        if self._head_done:
+            self.indexing_finished.emit()
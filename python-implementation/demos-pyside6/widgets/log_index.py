@@ -0,0 +1,280 @@
+"""
+Fine Use Design System - Log Index
+Level bitsets and a trigram index for filtering FineUseLogModel lines
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+import sys
+
+# Rows are grouped in blocks of BLOCK_ROWS for the level bitsets, and
+# distinct messages in blocks of BLOCK_MESSAGES for the trigram index
+BLOCK_ROWS = 1024
+BLOCK_MESSAGES = 1024
+
+def _trigrams(text: bytes) -> Set[tuple]:
+    return set(zip(text, text[1:], text[2:]))
+
+def _set_bits(bits: int) -> List[int]:
+    """Positions of the set bits of a mask, lowest first"""
+    text = format(bits, 'b')[::-1]
+    positions, position = [], text.find('1')
+    while position >= 0:
+        positions.append(position)
+        position = text.find('1', position + 1)
+    return positions
+
+class FineUseLogSelection:
+    """Rows matching a filter, kept as one bitmask per block
+    
+    Matching rows are counted per block, so the n-th match is found with
+    a bisect over the counts and a scan of a single block - the row list
+    is never built.
+    """
+    
+    def __init__(self):
+        self.blocks: Dict[int, int] = {}
+        self._block_ids = array('Q')
+        self._cum = array('Q', [0])
+        self._cached_block = -1
+        self._cached_rows: List[int] = []
+    
+    def __len__(self) -> int:
+        return self._cum[-1]
+    
+    def __getitem__(self, position: int) -> int:
+        """Row of the position-th match"""
+        if not 0 <= position < self._cum[-1]:
+            raise IndexError(position)
+        index = bisect_right(self._cum, position) - 1
+        block = self._block_ids[index]
+        if block != self._cached_block:
+            self._cached_block = block
+            self._cached_rows = _set_bits(self.blocks[block])
+        return block * BLOCK_ROWS + self._cached_rows[position - self._cum[index]]
+    
+    def add(self, block: int, bits: int):
+        """Add matching rows of a block at or after the last block added"""
+        if self._block_ids and self._block_ids[-1] == block:
+            self.blocks[block] |= bits
+            self._cum[-1] = self._cum[-2] + bin(self.blocks[block]).count('1')
+            if block == self._cached_block:
+                self._cached_block = -1
+        else:
+            self.blocks[block] = bits
+            self._block_ids.append(block)
+            self._cum.append(self._cum[-1] + bin(bits).count('1'))
+
+class FineUseLogIndex:
+    """Incremental level bitsets and trigram index over log rows
+    
+    Works on the columns of FineUseLogModel: the message id of each row
+    and the UTF-8 message pool with its offsets. extend() indexes each
+    batch as it lands:
+    
+    - levels: one bitmask per BLOCK_ROWS rows and level, built from the
+      level bytes with bytes.translate (no per-row Python work)
+    - messages: every distinct message is indexed once, when it enters
+      the pool - each trigram of the lowercased text sets the bit of its
+      BLOCK_MESSAGES block of message ids. Repeated messages cost nothing.
+    
+    matching_messages() searches only the pool slices of the message
+    blocks holding all trigrams of a text. match() ORs the masks of the
+    wanted levels and keeps the rows holding one of those messages.
+    """
+    
+    def __init__(self, level_count: int, message_ids: array, pool: bytearray, offsets: array):
+        self.message_ids = message_ids
+        self.pool = pool
+        self.offsets = offsets
+        self.rows = 0
+        self.level_bits: List[List[int]] = [[] for _ in range(level_count)]
+        self.trigrams: Dict[tuple, int] = {}
+        self._level_tables = [
+            bytes(0x31 if byte == level else 0x30 for byte in range(256)) for level in range(level_count)
+        ]
+        self._indexed_messages = 0
+        self._block_trigrams: Set[tuple] = set()
+        # Per row block: lowest and highest message id, and whether row i
+        # holds message first + i (unique messages, as most request logs)
+        self._first_ids = array('Q')
+        self._last_ids = array('Q')
+        self._sequential = bytearray()
+    
+    @property
+    def block_count(self) -> int:
+        return len(self._first_ids)
+    
+    @property
+    def nbytes(self) -> int:
+        """Approximate bytes held by the level bitsets, trigram index and block ranges"""
+        masks = [mask for masks in self.level_bits for mask in masks] + list(self.trigrams.values())
+        return (sum(sys.getsizeof(mask) for mask in masks) + 64 * len(self.trigrams)
+                + 17 * len(self._first_ids))
+    
+    def message_text(self, message_id: int) -> str:
+        return self.pool[self.offsets[message_id]:self.offsets[message_id + 1]].decode('utf-8')
+    
+    def extend(self, levels: array, message_ids: array):
+        """Index the rows appended after self.rows (levels and message ids of the new rows)"""
+        self._index_messages(len(self.offsets) - 1)
+        start, end = self.rows, self.rows + len(levels)
+        position = start
+        while position < end:
+            block, offset = divmod(position, BLOCK_ROWS)
+            stop = min(end, (block + 1) * BLOCK_ROWS)
+            if offset == 0:
+                for masks in self.level_bits:
+                    masks.append(0)
+            segment = slice(position - start, stop - start)
+            self._index_levels(block, offset, levels[segment].tobytes())
+            self._index_id_range(block, offset, message_ids[segment])
+            position = stop
+        self.rows = end
+    
+    def _index_levels(self, block: int, offset: int, levels: bytes):
+        for level in set(levels):
+            bits = int(levels.translate(self._level_tables[level])[::-1], 2) << offset
+            self.level_bits[level][block] |= bits
+    
+    def _index_id_range(self, block: int, offset: int, message_ids: array):
+        low, high, start = min(message_ids), max(message_ids), message_ids[0]
+        run = message_ids == array(message_ids.typecode, range(start, start + len(message_ids)))
+        if offset == 0:
+            self._first_ids.append(low)
+            self._last_ids.append(high)
+            self._sequential.append(run)
+        else:
+            self._sequential[block] = self._sequential[block] and run and start == self._last_ids[block] + 1
+            self._first_ids[block] = min(self._first_ids[block], low)
+            self._last_ids[block] = max(self._last_ids[block], high)
+    
+    def _index_messages(self, count: int):
+        """Add the trigrams of messages self._indexed_messages..count to the index"""
+        offsets, index = self.offsets, self.trigrams
+        while self._indexed_messages < count:
+            first = self._indexed_messages
+            block = first // BLOCK_MESSAGES
+            if first % BLOCK_MESSAGES == 0:
+                self._block_trigrams = set()
+            last = min(count, (block + 1) * BLOCK_MESSAGES)
+            # Trigrams across two messages are indexed too - they only
+            # widen the candidates, matches are always checked on the text
+            new = _trigrams(self.pool[offsets[first]:offsets[last]].lower()) - self._block_trigrams
+            self._block_trigrams |= new
+            bit = 1 << block
+            for trigram in new:
+                index[trigram] = index.get(trigram, 0) | bit
+            self._indexed_messages = last
+    
+    def match(self, level_ids: Optional[Iterable[int]] = None, messages: Optional[List[int]] = None,
+              start: int = 0) -> Iterator[Tuple[int, int]]:
+        """(block, row bits) of the blocks with rows from start on matching the filter
+        
+        level_ids None matches every level; messages (sorted ids, from
+        matching_messages) None matches every message.
+        """
+        level_ids = range(len(self.level_bits)) if level_ids is None else level_ids
+        levels = [self.level_bits[level] for level in level_ids]
+        first_block = start // BLOCK_ROWS
+        for block in range(first_block, self.block_count):
+            bits = 0
+            for masks in levels:
+                bits |= masks[block]
+            if block == first_block:
+                bits &= -1 << (start - block * BLOCK_ROWS)
+            if bits and messages is not None:
+                bits &= self._message_rows(block, messages)
+            if bits:
+                yield block, bits
+    
+    def select(self, level_ids: Optional[Iterable[int]] = None,
+               messages: Optional[List[int]] = None) -> FineUseLogSelection:
+        """FineUseLogSelection of every row matching the filter"""
+        selection = FineUseLogSelection()
+        for block, bits in self.match(level_ids, messages):
+            selection.add(block, bits)
+        return selection
+    
+    def matching_messages(self, text: str, start: int = 0) -> List[int]:
+        """Sorted ids from start on of the distinct messages containing text (case-insensitive)"""
+        needle = text.lower()
+        count = len(self.offsets) - 1
+        if not needle.isascii():
+            # The pool is lowercased as bytes (ASCII only), so check the decoded text
+            return [message_id for message_id in range(start, count)
+                    if needle in self.message_text(message_id).lower()]
+        pattern = needle.encode('ascii')
+        matched: List[int] = []
+        for first, last in self._candidate_ranges(pattern, start, count):
+            matched.extend(self._search_pool(pattern, first, last))
+        return matched
+    
+    def _candidate_ranges(self, pattern: bytes, start: int, count: int) -> Iterator[Tuple[int, int]]:
+        """Message id ranges from start on that may contain pattern, from the trigram index"""
+        blocks = -1 << (start // BLOCK_MESSAGES)
+        if len(pattern) >= 3:
+            for trigram in _trigrams(pattern):
+                blocks &= self.trigrams.get(trigram, 0)
+        indexed = self._indexed_messages
+        for block in _set_bits(blocks & ((1 << -(-indexed // BLOCK_MESSAGES)) - 1)):
+            first = max(start, block * BLOCK_MESSAGES)
+            last = min(indexed, (block + 1) * BLOCK_MESSAGES)
+            if first < last:
+                yield first, last
+        # Messages not indexed yet are always searched
+        if max(start, indexed) < count:
+            yield max(start, indexed), count
+    
+    def _search_pool(self, pattern: bytes, first: int, last: int) -> List[int]:
+        """Ids first..last-1 whose message contains pattern (ASCII, lowercase)"""
+        offsets = self.offsets
+        base = offsets[first]
+        region = self.pool[base:offsets[last]].lower()
+        if region.count(pattern) * 4 >= last - first:
+            # Most messages match: test each one rather than mapping every hit
+            starts = offsets[first:last + 1]
+            return [message_id for message_id, begin, end in zip(range(first, last), starts, starts[1:])
+                    if pattern in region[begin - base:end - base]]
+        found = []
+        position = region.find(pattern)
+        while position >= 0:
+            message_id = bisect_right(offsets, base + position, first, last) - 1
+            end = offsets[message_id + 1] - base
+            if position + len(pattern) <= end:
+                found.append(message_id)
+                position = region.find(pattern, end)
+            else:
+                # Spans two messages - look further on
+                position = region.find(pattern, position + 1)
+        return found
+    
+    def _message_rows(self, block: int, matched: List[int]) -> int:
+        """Bits of the rows of a block holding one of the matched message ids"""
+        first, last = self._first_ids[block], self._last_ids[block]
+        ids = matched[bisect_left(matched, first):bisect_right(matched, last)]
+        if not ids:
+            return 0
+        rows = 0
+        if self._sequential[block]:
+            if len(ids) == last - first + 1:
+                return (1 << len(ids)) - 1
+            for message_id in ids:
+                rows |= 1 << (message_id - first)
+            return rows
+        start = block * BLOCK_ROWS
+        message_ids = self.message_ids[start:start + BLOCK_ROWS]
+        if len(ids) <= 16:
+            # Few matching messages: locate their ids in the raw column
+            data, size = message_ids.tobytes(), message_ids.itemsize
+            for message_id in ids:
+                pattern = message_id.to_bytes(size, sys.byteorder)
+                position = data.find(pattern)
+                while position >= 0:
+                    if not position % size:
+                        rows |= 1 << (position // size)
+                    position = data.find(pattern, position + 1)
+            return rows
+        wanted = set(ids)
+        return int(''.join(['1' if message_id in wanted else '0' for message_id in reversed(message_ids)]), 2)
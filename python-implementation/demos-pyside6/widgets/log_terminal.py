@@ -3,15 +3,31 @@ Fine Use Design System - Log Terminal Component
 Perfect log formatting matching HTML demos exactly
 """
 
-from PySide6.QtWidgets import QTextEdit, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton
+from PySide6.QtWidgets import QPlainTextEdit, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton
 from PySide6.QtCore import Qt, QTimer, Signal
 from PySide6.QtGui import QTextCursor, QFont, QTextCharFormat, QColor
+from collections import deque
 from datetime import datetime
+from typing import Iterable
 import random
+import threading
+import time
 
-class FineUseLogTerminal(QTextEdit):
-    """Perfect Fine Use log terminal with exact HTML demo formatting"""
+from .log_entry import LogEntry, level_id, parse_line, time_prefix, to_ns
+
+class FineUseLogTerminal(QPlainTextEdit):
+    """Perfect Fine Use log terminal with exact HTML demo formatting
+
+    A ring buffer of at most max_lines entries: the document's maximum
+    block count drops the oldest line in O(1) as a new one is appended,
+    and the LogEntry records are kept in a deque of the same bound.
+
+    Entries are queued by add_log_entry/add_log_entries, which any thread
+    may call, and written once per frame (flush_interval_ms) in a single
+    document edit followed by one scroll to the bottom.
+    """
     
+    # Same order as log_entry.LEVELS - a LogEntry level_id indexes both
     LOG_LEVELS = {
         'INFO': {'color': '#58a6ff', 'weight': 700},     # Accent blue
         'WARN': {'color': '#d29922', 'weight': 700},     # Warning yellow
@@ -20,23 +36,77 @@ class FineUseLogTerminal(QTextEdit):
         'DEBUG': {'color': '#7d8590', 'weight': 700}     # Comment gray
     }
     
-    def __init__(self, parent=None):
+    _flush_requested = Signal()
+    
+    def __init__(self, parent=None, max_lines: int = 50, flush_interval_ms: int = 16):
         super().__init__(parent)
-        self.max_lines = 50  # Limit log lines like HTML demo
+        self.entries: deque = deque(maxlen=max_lines)
+        self._pending: list = []
+        self._pending_dropped = 0
+        self._pending_since = 0.0
+        self._pending_lock = threading.Lock()
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(flush_interval_ms)
+        self._flush_timer.timeout.connect(self.flush)
+        self._flush_requested.connect(self._flush_timer.start)
+        self.reset_counters()
+        self._cursor = QTextCursor(self.document())
+        self._formats = self._build_formats()
+        self.max_lines = max_lines  # Limit log lines like HTML demo
         self.init_styling()
         self.setup_auto_logging()
     
+    @property
+    def max_lines(self) -> int:
+        return self.entries.maxlen
+    
+    @max_lines.setter
+    def max_lines(self, max_lines: int):
+        if max_lines != self.entries.maxlen:
+            self.entries = deque(self.entries, maxlen=max_lines)
+        self.setMaximumBlockCount(max_lines)
+    
+    @property
+    def flush_interval_ms(self) -> int:
+        return self._flush_timer.interval()
+    
+    @flush_interval_ms.setter
+    def flush_interval_ms(self, interval: int):
+        self._flush_timer.setInterval(interval)
+    
+    @property
+    def mean_batch(self) -> float:
+        """Average number of entries written per flush"""
+        return self.flushed / self.flushes if self.flushes else 0.0
+    
+    def reset_counters(self):
+        """Reset the flush counters (flushes, flushed, dropped, batch sizes, latency in ms)
+        
+        flushed and the batch sizes count every record handed in; dropped
+        counts those superseded by max_lines newer ones before a flush,
+        which are never converted or shown.
+        """
+        self.flushes = 0
+        self.flushed = 0
+        self.dropped = 0
+        self.last_batch = 0
+        self.max_batch = 0
+        self.flush_latency = 0.0
+        self.max_flush_latency = 0.0
+    
     def init_styling(self):
         """Initialize terminal with perfect Fine Use styling"""
         # Set exact log terminal styling
         self.setObjectName("log-terminal")
         self.setReadOnly(True)
+        self.setUndoRedoEnabled(False)
         self.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         
         # Font and basic styling
         self.setStyleSheet("""
-            QTextEdit {
+            QPlainTextEdit {
                 background-color: #0d1117;
                 border: 2px solid #30363d;
                 color: #f0f6fc;
@@ -47,89 +117,114 @@ class FineUseLogTerminal(QTextEdit):
                 border-radius: 0px;
             }
         """)
+    
+    def _build_formats(self) -> dict:
+        """Character formats for the timestamp, each level and the message"""
+        def char_format(color: str, weight: int = 500) -> QTextCharFormat:
+            fmt = QTextCharFormat()
+            fmt.setForeground(QColor(color))
+            fmt.setFontWeight(weight)
+            return fmt
         
-        # Enable rich text for colored log levels
-        self.setAcceptRichText(True)
+        formats = {level: char_format(style['color'], style['weight']) for level, style in self.LOG_LEVELS.items()}
+        formats['timestamp'] = char_format('#7d8590')
+        formats['message'] = char_format('#f0f6fc')
+        return formats
     
     def add_log_entry(self, level: str, message: str, timestamp: datetime = None):
-        """Add a log entry with proper formatting"""
-        if timestamp is None:
-            timestamp = datetime.now()
-        
-        # Format timestamp like HTML demo
-        time_str = timestamp.strftime("%H:%M:%S")
-        
-        # Get level styling
-        level_style = self.LOG_LEVELS.get(level.upper(), self.LOG_LEVELS['INFO'])
+        """Queue a log entry for the next flush (safe from any thread)"""
+        self._enqueue(((level, message, timestamp or time.time()),))
+    
+    def add_log_entries(self, entries: Iterable):
+        """Queue LogEntry records or (level, message[, timestamp]) tuples for the next flush
+
+        Tuples without a timestamp get the time of the call.
+        """
+        now = time.time()
+        self._enqueue([
+            entry if entry.__class__ is LogEntry
+            else (entry[0], entry[1], entry[2] if len(entry) > 2 and entry[2] else now)
+            for entry in entries
+        ])
+    
+    def _enqueue(self, records: Iterable):
+        """Add LogEntry or raw (level, message, timestamp) records, waking the flush timer if idle
         
-        # Format entry exactly like HTML demo: [timestamp] LEVEL message
-        log_html = f"""
-        <div style="margin-bottom: 4px; font-family: 'Fira Code', monospace; font-size: 12px;">
-            <span style="color: #7d8590;">[{time_str}]</span>
-            <span style="color: {level_style['color']}; font-weight: {level_style['weight']}; margin-left: 8px;">{level.upper()}</span>
-            <span style="color: #f0f6fc; margin-left: 8px;">{message}</span>
-        </div>
+        Only the newest max_lines records are kept until the next flush, so
+        a producer outpacing the frame flush cannot grow the queue.
         """
+        with self._pending_lock:
+            wake = not self._pending
+            if wake:
+                self._pending_since = time.perf_counter()
+            pending = self._pending
+            pending.extend(records)
+            excess = len(pending) - self.entries.maxlen
+            if excess > 0:
+                del pending[:excess]
+                self._pending_dropped += excess
+            wake = wake and bool(pending)
+        if wake:
+            self._flush_requested.emit()
+    
+    def flush(self):
+        """Write every queued entry in one document edit and scroll to the bottom
+
+        Records are turned into LogEntry records here, on the GUI thread,
+        and only the last max_lines of a batch are converted and laid
+        out, the rest would be evicted before they could be painted.
+        """
+        self._flush_timer.stop()
+        with self._pending_lock:
+            records, self._pending = self._pending, []
+            dropped, self._pending_dropped = self._pending_dropped, 0
+            since = self._pending_since
+        if not records:
+            return
+        visible = [self._log_entry(record) for record in records[-self.max_lines:]]
+        self.entries.extend(visible)
         
-        # Add to terminal
-        cursor = self.textCursor()
-        cursor.movePosition(QTextCursor.MoveOperation.End)
-        cursor.insertHtml(log_html)
+        formats = self._formats
+        timestamp_format, message_format = formats['timestamp'], formats['message']
+        cursor = self._cursor
+        cursor.beginEditBlock()
+        try:
+            cursor.movePosition(QTextCursor.MoveOperation.End)
+            new_block = not self.document().isEmpty()
+            for entry in visible:
+                # Format entry exactly like HTML demo: [timestamp] LEVEL message
+                if new_block:
+                    cursor.insertBlock()
+                new_block = True
+                cursor.insertText(time_prefix(entry.ts_ns) + ' ', timestamp_format)
+                level = entry.level
+                cursor.insertText(level, formats[level])
+                cursor.insertText(f" {entry.message}", message_format)
+        finally:
+            cursor.endEditBlock()
         
         # Auto-scroll to bottom
-        self.setTextCursor(cursor)
-        self.ensureCursorVisible()
+        scroll_bar = self.verticalScrollBar()
+        scroll_bar.setValue(scroll_bar.maximum())
         
-        # Limit number of lines
-        self._limit_lines()
+        self.flushes += 1
+        self.flushed += len(records) + dropped
+        self.dropped += dropped + len(records) - len(visible)
+        self.last_batch = len(records) + dropped
+        self.max_batch = max(self.max_batch, self.last_batch)
+        self.flush_latency = (time.perf_counter() - since) * 1000
+        self.max_flush_latency = max(self.max_flush_latency, self.flush_latency)
     
-    def _limit_lines(self):
-        """Limit the number of log lines to prevent memory issues"""
-        # Get all text and split into lines
-        all_text = self.toPlainText()
-        lines = all_text.split('\\n')
-        
-        if len(lines) > self.max_lines:
-            # Keep only the most recent lines
-            recent_lines = lines[-self.max_lines:]
-            
-            # Clear and re-add with formatting
-            self.clear()
-            
-            # Note: We lose formatting here, but it prevents memory issues
-            # In a real implementation, you'd want to track formatted entries
-            for line in recent_lines:
-                if line.strip():
-                    # Try to parse back the log level for re-formatting
-                    self._parse_and_add_line(line)
+    def _log_entry(self, record) -> LogEntry:
+        """LogEntry for a queued record (a LogEntry, or a tuple with a datetime or time.time())"""
+        if record.__class__ is LogEntry:
+            return record
+        level, message, timestamp = record
+        return LogEntry(to_ns(timestamp), level_id(level), message)
     
-    def _parse_and_add_line(self, line: str):
-        """Parse a plain text line and re-add with formatting"""
-        # Simple parsing to restore formatting
-        try:
-            if '] INFO ' in line:
-                parts = line.split('] INFO ', 1)
-                timestamp = parts[0].replace('[', '')
-                message = parts[1]
-                self.add_log_entry('INFO', message, datetime.strptime(timestamp, '%H:%M:%S'))
-            elif '] WARN ' in line:
-                parts = line.split('] WARN ', 1)
-                timestamp = parts[0].replace('[', '')
-                message = parts[1]
-                self.add_log_entry('WARN', message, datetime.strptime(timestamp, '%H:%M:%S'))
-            elif '] ERROR ' in line:
-                parts = line.split('] ERROR ', 1)
-                timestamp = parts[0].replace('[', '')
-                message = parts[1]
-                self.add_log_entry('ERROR', message, datetime.strptime(timestamp, '%H:%M:%S'))
-            elif '] SUCCESS ' in line:
-                parts = line.split('] SUCCESS ', 1)
-                timestamp = parts[0].replace('[', '')
-                message = parts[1]
-                self.add_log_entry('SUCCESS', message, datetime.strptime(timestamp, '%H:%M:%S'))
-        except:
-            # If parsing fails, just add as plain text
-            pass
+    # LogEntry of a text line ('2024-05-01 12:00:00,123 ERROR message');
+    # safe off the GUI thread, so it can be a subscription transform
+    parse_line = staticmethod(parse_line)
     
     def setup_auto_logging(self):
         """Setup automatic log generation like HTML demo"""
@@ -161,7 +256,12 @@ class FineUseLogTerminal(QTextEdit):
         self.add_log_entry(level, message)
     
     def clear_logs(self):
-        """Clear all log entries"""
+        """Clear all log entries, including queued ones"""
+        with self._pending_lock:
+            self._pending = []
+            self._pending_dropped = 0
+        self._flush_timer.stop()
+        self.entries.clear()
         self.clear()
     
     def pause_auto_logging(self):
@@ -180,6 +280,8 @@ class FineUseLogTerminalWithControls(QWidget):
         super().__init__(parent)
         self.title = title
         self.is_paused = False
+        self.subscriptions = []
+        self._bridges = []
         self.init_ui()
     
     def init_ui(self):
@@ -273,9 +375,13 @@ class FineUseLogTerminalWithControls(QWidget):
         
         if self.is_paused:
             self.terminal.pause_auto_logging()
+            for subscription in self.subscriptions:
+                subscription.pause()
             self.pause_button.setText("RESUME")
         else:
             self.terminal.resume_auto_logging()
+            for subscription in self.subscriptions:
+                subscription.resume()
             self.pause_button.setText("PAUSE")
     
     def _clear_logs(self):
@@ -286,6 +392,29 @@ class FineUseLogTerminalWithControls(QWidget):
         """Add a log entry"""
         self.terminal.add_log_entry(level, message)
     
+    def subscribe(self, bridge, source, transform=None, **options):
+        """Stream lines from an async source (see widgets.async_source) into the terminal
+        
+        Items are parsed with FineUseLogTerminal.parse_line unless a
+        transform returning LogEntry records or (level, message[,
+        timestamp]) tuples is given. PAUSE
+        holds the stream, which throttles the source; options go to
+        FineUseAsyncBridge.subscribe.
+        """
+        subscription = bridge.subscribe(source, self.terminal.add_log_entries,
+                                        transform or self.terminal.parse_line, **options)
+        if self.is_paused:
+            subscription.pause()
+        self.subscriptions.append(subscription)
+        if bridge not in self._bridges:
+            self._bridges.append(bridge)
+            bridge.source_finished.connect(self._source_finished)
+        return subscription
+    
+    def _source_finished(self, subscription):
+        if subscription in self.subscriptions:
+            self.subscriptions.remove(subscription)
+    
     def get_terminal(self) -> FineUseLogTerminal:
         """Get the underlying terminal widget"""
         return self.terminal
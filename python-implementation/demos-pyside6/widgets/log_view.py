@@ -0,0 +1,384 @@
+"""
+Fine Use Design System - Log View Component
+Virtualized [HH:MM:SS] LEVEL message viewer for millions of lines
+"""
+
+from PySide6.QtWidgets import QTableView, QHeaderView, QStyledItemDelegate, QStyle, QAbstractItemView
+from PySide6.QtCore import Qt, QAbstractListModel, QModelIndex, QRect, QSize
+from PySide6.QtGui import QFont, QFontMetrics, QColor
+from array import array
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+import time
+
+from .log_file import FineUseLogFileModel
+from .log_entry import LEVELS, LEVEL_IDS, LogEntry, level_id, time_prefix, to_ns
+from .log_index import FineUseLogIndex, FineUseLogSelection
+from .log_terminal import FineUseLogTerminal
+
+_DISPLAY_ROLE = int(Qt.ItemDataRole.DisplayRole)
+
+class FineUseLogModel(QAbstractListModel):
+    """Log lines stored as columns - no Python object per line
+    
+    Each line costs 13 bytes of columns: an int64 timestamp (ns since the
+    epoch), a uint8 level id and a uint32 message id. Message text lives
+    once per distinct message as UTF-8 in a shared pool, addressed by an
+    offset array; recently seen messages are interned, so repeated
+    messages share one pool entry. Text is only decoded for rows that are
+    painted.
+    
+    Lines are indexed as they land (FineUseLogIndex: level bitsets and a
+    trigram index), so set_filter() narrows the rows to some levels
+    and/or a substring without scanning every line; rows of a filtered
+    model are the matching lines.
+    """
+    
+    LEVELS = LEVELS
+    
+    def __init__(self, parent=None, intern_size: int = 4096):
+        super().__init__(parent)
+        self.intern_size = intern_size
+        self.filter_levels: Optional[Tuple[int, ...]] = None
+        self.filter_text = ''
+        self._reset_columns()
+    
+    def _reset_columns(self):
+        self.timestamps = array('q')
+        self.levels = array('B')
+        self.message_ids = array('I')
+        self._pool = bytearray()
+        self._offsets = array('Q', [0])
+        self._interned: Dict[str, int] = {}
+        self.log_index = FineUseLogIndex(len(self.LEVELS), self.message_ids, self._pool, self._offsets)
+        self._selection: Optional[FineUseLogSelection] = None
+        self._matched_messages: Optional[List[int]] = None
+        self._searched_messages = 0
+        if self.filtering:
+            self._selection = FineUseLogSelection()
+            self._matched_messages = [] if self.filter_text else None
+    
+    @property
+    def filtering(self) -> bool:
+        return self.filter_levels is not None or bool(self.filter_text)
+    
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the columns and the message pool"""
+        columns = (self.timestamps, self.levels, self.message_ids, self._offsets)
+        return sum(column.itemsize * len(column) for column in columns) + len(self._pool)
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self.timestamps) if self._selection is None else len(self._selection)
+    
+    def data(self, index: QModelIndex, role=_DISPLAY_ROLE):
+        if role == _DISPLAY_ROLE:
+            row = index.row()
+            return f"{self.time_text(row)} {self.level(row)} {self.message(row)}"
+        return None
+    
+    def add_log_entry(self, level: str, message: str, timestamp: datetime = None):
+        """Append one line"""
+        self.add_log_entries(((level, message, timestamp),))
+    
+    def add_log_entries(self, entries: Iterable):
+        """Append LogEntry records or (level, message[, timestamp]) lines with one rows-inserted notification
+        
+        Tuples without a timestamp get the time of the call.
+        """
+        now = time.time_ns()
+        level_ids, intern = LEVEL_IDS, self._intern
+        timestamps, levels, message_ids = array('q'), array('B'), array('I')
+        for entry in entries:
+            if entry.__class__ is LogEntry:
+                levels.append(entry.level_id)
+                message_ids.append(intern(entry.message))
+                timestamps.append(entry.ts_ns)
+                continue
+            level = level_ids.get(entry[0])
+            levels.append(self._level_id(entry[0]) if level is None else level)
+            message_ids.append(intern(entry[1]))
+            timestamp = entry[2] if len(entry) > 2 and entry[2] else None
+            timestamps.append(now if timestamp is None else to_ns(timestamp))
+        if not timestamps:
+            return
+        first = len(self.timestamps)
+        if self._selection is None:
+            self.beginInsertRows(QModelIndex(), first, first + len(timestamps) - 1)
+            self._extend_columns(timestamps, levels, message_ids)
+            self.endInsertRows()
+            return
+        
+        # Filtered: only the new lines that match become rows
+        self._extend_columns(timestamps, levels, message_ids)
+        if self._matched_messages is not None:
+            # Only messages new since the last search need checking
+            self._matched_messages.extend(
+                self.log_index.matching_messages(self.filter_text, self._searched_messages)
+            )
+            self._searched_messages = len(self._offsets) - 1
+        matches = list(self.log_index.match(self.filter_levels, self._matched_messages, start=first))
+        added = sum(bin(bits).count('1') for _, bits in matches)
+        if added:
+            rows = len(self._selection)
+            self.beginInsertRows(QModelIndex(), rows, rows + added - 1)
+            for block, bits in matches:
+                self._selection.add(block, bits)
+            self.endInsertRows()
+    
+    def _extend_columns(self, timestamps: array, levels: array, message_ids: array):
+        self.timestamps.extend(timestamps)
+        self.levels.extend(levels)
+        self.message_ids.extend(message_ids)
+        self.log_index.extend(levels, message_ids)
+    
+    def clear(self):
+        """Drop every line and the message pool"""
+        self.beginResetModel()
+        self._reset_columns()
+        self.endResetModel()
+    
+    def set_filter(self, levels: Optional[Iterable[str]] = None, text: str = ''):
+        """Show only lines of the given levels (None: all) whose message contains text
+        
+        The match is a case-insensitive substring; set_filter() with no
+        arguments shows every line again. Lines added later are matched
+        as they land.
+        """
+        self.beginResetModel()
+        self.filter_levels = None if levels is None else tuple(sorted({self._level_id(level) for level in levels}))
+        self.filter_text = text
+        self._matched_messages = self.log_index.matching_messages(text) if text else None
+        self._searched_messages = len(self._offsets) - 1
+        self._selection = self.log_index.select(self.filter_levels, self._matched_messages) if self.filtering else None
+        self.endResetModel()
+    
+    def source_row(self, row: int) -> int:
+        """Line number of a row (differs from the row while filtering)"""
+        return row if self._selection is None else self._selection[row]
+    
+    def entry(self, row: int) -> LogEntry:
+        """LogEntry for a row"""
+        line = self.source_row(row)
+        return LogEntry(self.timestamps[line], self.levels[line], self._message_text(self.message_ids[line]))
+    
+    def level(self, row: int) -> str:
+        return self.LEVELS[self.levels[self.source_row(row)]]
+    
+    def level_id(self, row: int) -> int:
+        return self.levels[self.source_row(row)]
+    
+    def message(self, row: int) -> str:
+        return self._message_text(self.message_ids[self.source_row(row)])
+    
+    def _message_text(self, message_id: int) -> str:
+        return self._pool[self._offsets[message_id]:self._offsets[message_id + 1]].decode('utf-8')
+    
+    def time_text(self, row: int) -> str:
+        """'[HH:MM:SS]' for a row, formatted once per second"""
+        return time_prefix(self.timestamps[self.source_row(row)])
+    
+    def _intern(self, message: str) -> int:
+        """Message id, reusing the pool entry of a recently seen identical message"""
+        message_id = self._interned.get(message)
+        if message_id is None:
+            self._pool += message.encode('utf-8')
+            message_id = len(self._offsets) - 1
+            self._offsets.append(len(self._pool))
+            if len(self._interned) >= self.intern_size:
+                self._interned.clear()
+            self._interned[message] = message_id
+        return message_id
+    
+    def _level_id(self, level: str) -> int:
+        """Level id for a level name (unknown levels log as INFO)"""
+        return level_id(level)
+
+
+class FineUseLogDelegate(QStyledItemDelegate):
+    """Paints a row as [HH:MM:SS] LEVEL message in the LOG_LEVELS colors
+    
+    Occurrences of highlight in the message (case-insensitive) are
+    painted over a highlight background.
+    """
+    
+    PADDING = 16
+    
+    def __init__(self, model: FineUseLogModel, font: QFont, parent=None):
+        super().__init__(parent)
+        self.log_model = model
+        self.font = QFont(font)
+        self.bold_font = QFont(font)
+        self.bold_font.setBold(True)
+        self.metrics = metrics = QFontMetrics(self.font)
+        self.time_width = metrics.horizontalAdvance('[00:00:00] ')
+        self.level_width = QFontMetrics(self.bold_font).horizontalAdvance(
+            max(model.LEVELS, key=len) + ' '
+        )
+        self.ascent = metrics.ascent()
+        self.size = QSize(0, metrics.height() + 4)
+        self.level_colors = [QColor(FineUseLogTerminal.LOG_LEVELS[level]['color']) for level in model.LEVELS]
+        self.time_color = QColor('#7d8590')
+        self.text_color = QColor('#f0f6fc')
+        self.selected_color = QColor('#30363d')
+        self.highlight_color = QColor('#d29922')
+        self.highlight_color.setAlpha(96)
+        self.highlight = ''
+    
+    def sizeHint(self, option, index) -> QSize:
+        return self.size
+    
+    def paint(self, painter, option, index):
+        # Called for every visible row on each paint - keep it flat
+        model, row, rect = self.log_model, index.row(), option.rect
+        if option.state & QStyle.StateFlag.State_Selected:
+            painter.fillRect(rect, self.selected_color)
+        x = rect.x() + self.PADDING
+        y = rect.y() + (rect.height() - self.size.height()) // 2 + 2 + self.ascent
+        painter.setFont(self.font)
+        painter.setPen(self.time_color)
+        painter.drawText(x, y, model.time_text(row))
+        x += self.time_width
+        painter.setFont(self.bold_font)
+        level_id = model.level_id(row)
+        painter.setPen(self.level_colors[level_id])
+        painter.drawText(x, y, model.LEVELS[level_id])
+        x += self.level_width
+        message = model.message(row)
+        if self.highlight:
+            self._paint_highlights(painter, rect, x, message)
+        painter.setFont(self.font)
+        painter.setPen(self.text_color)
+        painter.drawText(x, y, message)
+    
+    def _paint_highlights(self, painter, rect, x: int, message: str):
+        needle = self.highlight.lower()
+        folded = message.lower()
+        advance = self.metrics.horizontalAdvance
+        position = folded.find(needle)
+        while position >= 0:
+            end = position + len(needle)
+            left = x + advance(message[:position])
+            painter.fillRect(QRect(left, rect.y() + 1, advance(message[position:end]), rect.height() - 2),
+                             self.highlight_color)
+            position = folded.find(needle, end)
+
+
+class FineUseLogView(QTableView):
+    """Fine Use log viewer - virtualized single-column view over FineUseLogModel
+    
+    A QTableView with fixed row heights and hidden headers rather than a
+    QListView: QListView lays out every row again after each insert,
+    while a fixed-size header never measures rows. Only the visible rows
+    are formatted and painted, so scrolling through 10,000,000 lines costs
+    the same as through 100. Follows the tail while scrolled to the bottom
+    and otherwise keeps the visible lines in place when rows land above.
+    
+    Lines come from an in-memory FineUseLogModel (add_log_entries) or,
+    after open_file(), from a memory-mapped FineUseLogFileModel.
+    set_filter() narrows an in-memory model to levels and/or text and
+    highlights the text in the matching lines.
+    """
+    
+    def __init__(self, parent=None, follow: bool = True):
+        super().__init__(parent)
+        self.follow = follow
+        self._at_tail = True
+        self._scroll_value = 0
+        self.init_styling()
+        self.log_model = FineUseLogModel(self)
+        self.log_delegate = FineUseLogDelegate(self.log_model, self.font(), self)
+        self.setItemDelegate(self.log_delegate)
+        self._set_log_model(self.log_model)
+        
+        # Fixed row heights - no per-row size hints for millions of lines
+        vertical = self.verticalHeader()
+        vertical.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        vertical.setDefaultSectionSize(self.log_delegate.size.height())
+        vertical.hide()
+        horizontal = self.horizontalHeader()
+        horizontal.setStretchLastSection(True)
+        horizontal.hide()
+    
+    def init_styling(self):
+        """Initialize the view with Fine Use log terminal styling"""
+        self.setObjectName("log-view")
+        self.setShowGrid(False)
+        self.setWordWrap(False)
+        self.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerItem)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
+        self.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        
+        font = QFont('Fira Code')
+        font.setStyleHint(QFont.StyleHint.Monospace)
+        font.setPixelSize(12)
+        font.setWeight(QFont.Weight.Medium)
+        self.setFont(font)
+        self.setStyleSheet("""
+            QTableView {
+                background-color: #0d1117;
+                border: 2px solid #30363d;
+                color: #f0f6fc;
+                border-radius: 0px;
+            }
+        """)
+    
+    def add_log_entry(self, level: str, message: str, timestamp: datetime = None):
+        """Append one line"""
+        self.add_log_entries(((level, message, timestamp),))
+    
+    def add_log_entries(self, entries: Iterable[tuple]):
+        """Append (level, message[, timestamp]) lines to the in-memory model"""
+        self.log_model.add_log_entries(entries)
+    
+    def set_filter(self, levels: Optional[Iterable[str]] = None, text: str = ''):
+        """Show only lines of levels (None: all) containing text, with text highlighted"""
+        if not isinstance(self.log_model, FineUseLogModel):
+            raise TypeError("Filtering needs the in-memory FineUseLogModel, not a log file")
+        self.log_model.set_filter(levels, text)
+        self.log_delegate.highlight = text
+        if self.follow:
+            self.scrollToBottom()
+    
+    def open_file(self, path: str, **options) -> FineUseLogFileModel:
+        """Show a log file (mmap, lazy index, follows appends); options go to FineUseLogFileModel"""
+        previous = self.log_model
+        self.log_delegate.highlight = ''
+        self._set_log_model(FineUseLogFileModel(path, self, **options))
+        if isinstance(previous, FineUseLogFileModel):
+            previous.close()
+        previous.deleteLater()
+        self.scrollToBottom()
+        return self.log_model
+    
+    def clear_logs(self):
+        """Clear all log lines (a file is replaced by an empty in-memory model)"""
+        if isinstance(self.log_model, FineUseLogFileModel):
+            self.log_model.close()
+            self.log_model.deleteLater()
+            self._set_log_model(FineUseLogModel(self))
+        else:
+            self.log_model.clear()
+    
+    def _set_log_model(self, model):
+        self.log_model = model
+        self.log_delegate.log_model = model
+        self.setModel(model)
+        model.rowsAboutToBeInserted.connect(self._rows_about_to_be_inserted)
+        model.rowsInserted.connect(self._rows_inserted)
+    
+    def _rows_about_to_be_inserted(self, parent, first, last):
+        scroll_bar = self.verticalScrollBar()
+        self._scroll_value = scroll_bar.value()
+        self._at_tail = self._scroll_value >= scroll_bar.maximum()
+    
+    def _rows_inserted(self, parent, first, last):
+        if self.follow and self._at_tail:
+            self.scrollToBottom()
+        elif first == 0:
+            # Rows landed above the visible ones (file indexing) - stay put
+            self.verticalScrollBar().setValue(self._scroll_value + last - first + 1)
@@ -89,6 +89,15 @@ class FineUseMetricWidget(QWidget):
         self.progress_bar.setValue(self.current_value)
         self._update_progress_color()
     
+    def subscribe(self, bridge, source, transform=None, **options):
+        """Show values from an async source (see widgets.async_source)
+        
+        Stops the simulated updates. Only the latest value of each batch
+        is shown; options go to FineUseAsyncBridge.subscribe.
+        """
+        self.timer.stop()
+        return bridge.subscribe(source, lambda values: self.set_value(int(values[-1])), transform, **options)
+    
     def setup_auto_update(self):
         """Setup automatic value updates like HTML demo"""
         self.timer = QTimer()
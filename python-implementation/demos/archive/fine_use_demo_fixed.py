@@ -13,6 +13,7 @@ Run with: python fine_use_demo_fixed.py
 
 import tkinter as tk
 from tkinter import ttk
+import logging
 import threading
 import time
 import random
@@ -24,6 +25,7 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from fine_use_core import fine_use, FineUseTheme, get_spacing, get_font
+from fine_use_logging import FineUseLogHandler
 from fine_use_adaptive import (
     AdaptiveFineUseApp, CompactFineUseButton, CompactButtonGrid,
     FineUseScrollableFrame, calculate_required_height
@@ -511,6 +513,14 @@ class FixedSystemMonitorApp:
     # === REAL-TIME UPDATES ===
     def start_monitoring(self):
         self.is_running = True
+        
+        # The update thread logs; the records reach the Text widget on the Tk thread
+        self.logger = logging.getLogger("fine_use.demo")
+        self.logger.setLevel(logging.INFO)
+        self.log_handler = FineUseLogHandler(self.add_log_entries, level_names={logging.WARNING: "WARNING"})
+        self.log_handler.attach_tk(self.app.root)
+        self.logger.addHandler(self.log_handler)
+        
         self.update_thread = threading.Thread(target=self.update_loop, daemon=True)
         self.update_thread.start()
         self.update_ui()
@@ -532,7 +542,7 @@ class FixedSystemMonitorApp:
                         ("SUCCESS", "Security scan passed")
                     ]
                     level, message = random.choice(messages)
-                    self.add_log_entry(level, message)
+                    self.logger.log(logging.getLevelName(level), message)
             
             time.sleep(2)
     
@@ -558,6 +568,11 @@ class FixedSystemMonitorApp:
         
         self.app.root.after(1000, self.update_ui)
     
+    def add_log_entries(self, entries):
+        """Add (level, message, timestamp) entries drained by the log handler"""
+        for level, message, _ in entries:
+            self.add_log_entry(level, message)
+    
     def add_log_entry(self, level, message):
         if not self.is_running and level != "INFO":
             return
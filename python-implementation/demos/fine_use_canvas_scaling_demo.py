@@ -12,6 +12,7 @@ Run with: python fine_use_canvas_scaling_demo.py
 """
 
 import tkinter as tk
+import logging
 import threading
 import time
 import random
@@ -22,23 +23,8 @@ import os
 # Add parent directory to path for imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-try:
-    from fine_use_core import fine_use
-except ImportError:
-    # Fallback if import fails
-    class fine_use:
-        colors = {
-            'bg': '#0d1117',
-            'surface': '#161b22', 
-            'border': '#30363d',
-            'text': '#f0f6fc',
-            'comment': '#7d8590',
-            'accent': '#58a6ff',
-            'success': '#238636',
-            'warning': '#d29922',
-            'error': '#da3633',
-            'info': '#1f6feb'
-        }
+from fine_use_theme_loader import load_themes
+from fine_use_logging import FineUseLogHandler
 
 
 class CanvasScalingSystemMonitor:
@@ -55,60 +41,9 @@ class CanvasScalingSystemMonitor:
         self.DESIGN_WIDTH = 1400
         self.DESIGN_HEIGHT = 900
         
-        # ALL 10 FINE USE THEMES
+        # ALL FINE USE THEMES - loaded from the shared themes/*.css sources
         self.current_theme = 'github-dark'
-        self.themes = {
-            'github-dark': {
-                'bg': '#0d1117', 'surface': '#161b22', 'border': '#30363d',
-                'text': '#f0f6fc', 'comment': '#7d8590', 'accent': '#58a6ff',
-                'success': '#238636', 'warning': '#d29922', 'error': '#da3633', 'info': '#1f6feb'
-            },
-            'github-light': {
-                'bg': '#ffffff', 'surface': '#f6f8fa', 'border': '#d1d9e0',
-                'text': '#24292f', 'comment': '#656d76', 'accent': '#0969da',
-                'success': '#1a7f37', 'warning': '#bf8700', 'error': '#cf222e', 'info': '#0969da'
-            },
-            'amber': {
-                'bg': '#1a0f00', 'surface': '#2a1f14', 'border': '#664422',
-                'text': '#ffb000', 'comment': '#cc8800', 'accent': '#ffcc00',
-                'success': '#00ff00', 'warning': '#ffff00', 'error': '#ff4444', 'info': '#44aaff'
-            },
-            'gruvbox': {
-                'bg': '#282828', 'surface': '#3c3836', 'border': '#504945',
-                'text': '#ebdbb2', 'comment': '#928374', 'accent': '#d3869b',
-                'success': '#b8bb26', 'warning': '#fabd2f', 'error': '#fb4934', 'info': '#83a598'
-            },
-            'monochrome': {
-                'bg': '#000000', 'surface': '#111111', 'border': '#333333',
-                'text': '#ffffff', 'comment': '#888888', 'accent': '#ffffff',
-                'success': '#00ff00', 'warning': '#ffff00', 'error': '#ff0000', 'info': '#00ffff'
-            },
-            'monokai': {
-                'bg': '#272822', 'surface': '#3e3d32', 'border': '#75715e',
-                'text': '#f8f8f2', 'comment': '#75715e', 'accent': '#ae81ff',
-                'success': '#a6e22e', 'warning': '#e6db74', 'error': '#f92672', 'info': '#66d9ef'
-            },
-            'newspaper': {
-                'bg': '#ffffff', 'surface': '#f8f8f8', 'border': '#000000',
-                'text': '#000000', 'comment': '#666666', 'accent': '#000000',
-                'success': '#006600', 'warning': '#cc6600', 'error': '#cc0000', 'info': '#0066cc'
-            },
-            'sakura': {
-                'bg': '#2d1b2e', 'surface': '#3d2b3e', 'border': '#8b4d8b',
-                'text': '#f4e4f4', 'comment': '#a66ba6', 'accent': '#f093fb',
-                'success': '#7dd3c0', 'warning': '#fdc4db', 'error': '#ff6b9d', 'info': '#c589e8'
-            },
-            'synthwave': {
-                'bg': '#0a0014', 'surface': '#1a0a2e', 'border': '#16213e',
-                'text': '#e94560', 'comment': '#533483', 'accent': '#ff00ff',
-                'success': '#39ff14', 'warning': '#ffff00', 'error': '#ff073a', 'info': '#00d9ff'
-            },
-            'vt220': {
-                'bg': '#000000', 'surface': '#001100', 'border': '#00aa00',
-                'text': '#00ff00', 'comment': '#008800', 'accent': '#00cc00',
-                'success': '#00ff00', 'warning': '#ffff00', 'error': '#ff0000', 'info': '#00ffff'
-            }
-        }
+        self.themes = {key: entry.palette for key, entry in load_themes().items()}
         
         # Set current colors
         self.colors = self.themes[self.current_theme]
@@ -668,6 +603,11 @@ class CanvasScalingSystemMonitor:
                     event.y < self.dropdown_y or event.y > self.dropdown_y + 350):
                     self.close_dropdown()
     
+    def add_log_entries(self, entries):
+        """Add (level, message, timestamp) entries drained by the log handler"""
+        for level, message, _ in entries:
+            self.add_log_entry(level, message)
+    
     def add_log_entry(self, level, message):
         """Add a log entry"""
         timestamp = datetime.now().strftime("%H:%M:%S")
@@ -961,6 +901,13 @@ class CanvasScalingSystemMonitor:
         self.add_log_entry("INFO", f"Theme: {self.current_theme.upper()}")
         self.add_log_entry("INFO", "Canvas scaling initialized")
         
+        # The update thread logs; the records reach the canvas on the Tk thread
+        self.logger = logging.getLogger("fine_use.demo")
+        self.logger.setLevel(logging.INFO)
+        self.log_handler = FineUseLogHandler(self.add_log_entries, level_names={logging.WARNING: "WARNING"})
+        self.log_handler.attach_tk(self.root)
+        self.logger.addHandler(self.log_handler)
+        
         # Start update threads
         def update_loop():
             while self.is_running:
@@ -984,7 +931,7 @@ class CanvasScalingSystemMonitor:
                         ]
                         level = random.choice(["INFO", "SUCCESS", "WARNING"])
                         message = random.choice(messages)
-                        self.root.after_idle(lambda: self.add_log_entry(level, message))
+                        self.logger.log(logging.getLevelName(level), message)
                 
                 except Exception as e:
                     print(f"Update error: {e}")
@@ -0,0 +1,121 @@
+"""
+Fine Use Design System - Python Package
+=======================================
+
+Single import point for the Python implementation. Design tokens are
+available immediately; GUI backends are loaded on first attribute
+access (PEP 562), so token-only scripts never pay for Tk or Qt.
+
+Usage:
+    import fine_use
+
+    fine_use.fine_use.colors['accent']      # tokens - no GUI import
+    fine_use.get_spacing('lg')
+
+    with fine_use.theme_context(fine_use.FineUseTheme.AMBER):
+        ...                                 # this thread/task sees AMBER
+
+    app = fine_use.tkinter.FineUseApp()     # imports fine_use_tkinter now
+    button = fine_use.pyqt.FineUseButton("START")
+
+Backends:
+    tkinter   - fine_use_tkinter
+    adaptive  - fine_use_adaptive (Tkinter adaptive layouts)
+    pyqt      - fine_use_pyqt (PyQt6, PyQt5 or PySide6 - first available)
+    pyside6   - fine_use_pyqt bound to PySide6
+    colormath - fine_use_colormath (requires NumPy)
+"""
+
+import sys
+
+from fine_use_core import (
+    FineUse,
+    FineUseTheme,
+    FineUseColors,
+    FineUseSpacing,
+    FineUseTypography,
+    FineUseBorders,
+    FineUseTransitions,
+    FineUseZIndex,
+    Palette,
+    ThemeState,
+    VariantColors,
+    THEME_PALETTES,
+    TOKEN_NAMES,
+    TOKEN_INDEX,
+    VARIANT_NAMES,
+    VARIANT_TOKENS,
+    fine_use,
+    get_current_theme_colors,
+    get_font,
+    get_spacing,
+    get_border_width,
+    get_variant_table,
+    theme_context,
+)
+
+# Lazily loaded backends: attribute -> (module, forced Qt binding)
+_BACKENDS = {
+    'tkinter': ('fine_use_tkinter', None),
+    'adaptive': ('fine_use_adaptive', None),
+    'pyqt': ('fine_use_pyqt', None),
+    'pyside6': ('fine_use_pyqt', 'pyside6'),
+    'colormath': ('fine_use_colormath', None),
+}
+
+# Binding fine_use_pyqt is asked for while __getattr__ imports it
+_qt_api = None
+
+__all__ = [
+    'FineUse',
+    'FineUseTheme',
+    'FineUseColors',
+    'FineUseSpacing',
+    'FineUseTypography',
+    'FineUseBorders',
+    'FineUseTransitions',
+    'FineUseZIndex',
+    'Palette',
+    'ThemeState',
+    'VariantColors',
+    'THEME_PALETTES',
+    'TOKEN_NAMES',
+    'TOKEN_INDEX',
+    'VARIANT_NAMES',
+    'VARIANT_TOKENS',
+    'fine_use',
+    'get_current_theme_colors',
+    'get_font',
+    'get_spacing',
+    'get_border_width',
+    'get_variant_table',
+    'theme_context',
+] + list(_BACKENDS)
+
+
+def __getattr__(name):
+    """Import a GUI backend the first time it is touched"""
+    try:
+        module_name, binding = _BACKENDS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    import importlib
+    global _qt_api
+
+    if binding is not None and module_name not in sys.modules:
+        _qt_api = binding
+    try:
+        module = importlib.import_module(module_name)
+    finally:
+        _qt_api = None
+    if binding is not None and getattr(module, 'QT_API', binding) != binding:
+        raise ImportError(
+            f"{module_name} is already bound to {module.QT_API}, cannot load {binding}"
+        )
+
+    globals()[name] = module
+    return module
+
+
+def __dir__():
+    return sorted(__all__)
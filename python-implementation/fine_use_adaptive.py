@@ -9,7 +9,7 @@ in Python GUIs by implementing adaptive layouts and spacing.
 import tkinter as tk
 from tkinter import ttk
 from typing import Dict, Tuple, Optional
-from fine_use_core import fine_use, get_spacing, get_font
+from fine_use_core import fine_use, get_spacing, get_font, VariantColors
 
 
 class AdaptiveSpacing:
@@ -223,10 +223,10 @@ class CompactFineUseButton(tk.Button):
             text=text.upper(),
             command=command,
             font=font_tuple,
-            bg=colors['bg'],
-            fg=colors['fg'],
-            activebackground=colors['hover_bg'],
-            activeforeground=colors['hover_fg'],
+            bg=colors.bg,
+            fg=colors.fg,
+            activebackground=colors.hover_bg,
+            activeforeground=colors.hover_fg,
             relief='solid',
             bd=2,  # Always use thin border
             highlightthickness=0,
@@ -243,43 +243,9 @@ class CompactFineUseButton(tk.Button):
         self.bind('<Enter>', self._on_enter)
         self.bind('<Leave>', self._on_leave)
     
-    def _get_variant_colors(self, variant: str) -> Dict[str, str]:
-        """Get colors for button variant"""
-        if variant == "primary":
-            return {
-                'bg': fine_use.colors['accent'],
-                'fg': fine_use.colors['bg'],
-                'hover_bg': fine_use.colors['bg'],
-                'hover_fg': fine_use.colors['accent']
-            }
-        elif variant == "success":
-            return {
-                'bg': fine_use.colors['success'],
-                'fg': fine_use.colors['bg'],
-                'hover_bg': fine_use.colors['bg'],
-                'hover_fg': fine_use.colors['success']
-            }
-        elif variant == "warning":
-            return {
-                'bg': fine_use.colors['warning'],
-                'fg': fine_use.colors['bg'],
-                'hover_bg': fine_use.colors['bg'],
-                'hover_fg': fine_use.colors['warning']
-            }
-        elif variant == "error":
-            return {
-                'bg': fine_use.colors['error'],
-                'fg': fine_use.colors['bg'],
-                'hover_bg': fine_use.colors['bg'],
-                'hover_fg': fine_use.colors['error']
-            }
-        else:  # secondary
-            return {
-                'bg': fine_use.colors['surface'],
-                'fg': fine_use.colors['text'],
-                'hover_bg': fine_use.colors['border'],
-                'hover_fg': fine_use.colors['text']
-            }
+    def _get_variant_colors(self, variant: str) -> VariantColors:
+        """Get the shared, precomputed colors for button variant"""
+        return fine_use.get_variant_colors(variant)
     
     def _get_adaptive_padding(self, size: str, app: AdaptiveFineUseApp) -> Dict[str, int]:
         """Get adaptive padding based on app settings"""
@@ -301,11 +267,11 @@ class CompactFineUseButton(tk.Button):
     
     def _on_enter(self, event):
         """Handle hover enter"""
-        self.configure(bg=self.colors['hover_bg'], fg=self.colors['hover_fg'])
+        self.configure(bg=self.colors.hover_bg, fg=self.colors.hover_fg)
     
     def _on_leave(self, event):
         """Handle hover leave"""
-        self.configure(bg=self.colors['bg'], fg=self.colors['fg'])
+        self.configure(bg=self.colors.bg, fg=self.colors.fg)
 
 
 class CompactButtonGrid:
@@ -0,0 +1,101 @@
+"""
+Fine Use Design System - Compiled Style Cache
+=============================================
+
+Bounded, thread-safe LRU for compiled styles, shared by the stylesheet
+cache of fine_use_pyqt and the theme cache of the PySide6 demos. Imports
+no GUI toolkit.
+
+Usage:
+    from fine_use_cache import LRUCache
+
+    class ThemeCache(LRUCache):
+        def get(self, key):
+            return self.cached(key, lambda: compile_theme(key))
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+
+class LRUCache:
+    """
+    Bounded LRU of compiled values with hit/miss counters
+
+    Values are compiled outside the lock, so worker threads never wait
+    on each other's compiles; two threads missing the same key may both
+    compile it and the later store wins. Subclasses add the key and
+    compile step of what they cache (see cached() and prewarm()).
+    """
+
+    def __init__(self, maxsize: int = 16):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.prewarmed = 0
+        self._entries: 'OrderedDict[Hashable, Any]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of lookups served without compiling"""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def lookup(self, key: Hashable) -> Optional[Any]:
+        """Cached value, now the most recently used, counting a hit - or None"""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            return value
+
+    def store(self, key: Hashable, value: Any):
+        """Insert as the most recently used, evicting beyond maxsize (counts nothing)"""
+        with self._lock:
+            self._insert(key, value)
+
+    def cached(self, key: Hashable, compile: Callable[[], Any]) -> Any:
+        """Cached value for key, compiling and storing it on a miss"""
+        value = self.lookup(key)
+        if value is None:
+            value = compile()
+            with self._lock:
+                self.misses += 1
+                self._insert(key, value)
+        return value
+
+    def prewarm(self, key: Hashable, compile: Callable[[], Any]) -> bool:
+        """
+        Compile ahead of use without counting a lookup
+
+        Warmed entries go in as least recently used and only while there
+        is room, so warming never evicts a value that was actually used.
+        Returns False if the key was already cached or the cache is full.
+        """
+        with self._lock:
+            if key in self._entries:
+                return False
+        value = compile()
+        with self._lock:
+            if key in self._entries or len(self._entries) >= self.maxsize:
+                return False
+            self._entries[key] = value
+            self._entries.move_to_end(key, last=False)
+            self.prewarmed += 1
+        return True
+
+    def clear(self):
+        """Drop every entry and reset the counters"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.prewarmed = 0
+
+    def _insert(self, key: Hashable, value: Any):
+        """Store as the most recently used and evict - caller holds the lock"""
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
@@ -0,0 +1,216 @@
+"""
+Fine Use Design System - Batch Color Math
+=========================================
+
+NumPy-backed color utilities that operate on whole arrays of colors
+at once instead of one hex string at a time. Intended for theme
+tooling: blending, lightening and contrast-checking every token of
+every theme in a single call.
+
+Usage:
+    from fine_use_colormath import token_matrix, contrast_ratio, derive_state_colors
+
+    rgb = token_matrix()                          # (themes, tokens, 3) uint8
+    ratios = contrast_ratio(rgb[:, TEXT], rgb[:, BG])
+    states = derive_state_colors()                # hover/disabled for all variants
+"""
+
+from typing import Iterable, NamedTuple, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    raise ImportError("NumPy is required for Fine Use batch color math (pip install numpy)")
+
+from fine_use_core import FineUseTheme, THEME_PALETTES, TOKEN_INDEX, VARIANT_TOKENS
+
+# ASCII lookup table: character code -> hex nibble value, _INVALID_NIBBLE
+# for every other character (codes above 127 are clamped to DEL, invalid)
+_INVALID_NIBBLE = 0xFF
+_HEX_NIBBLES = np.full(128, _INVALID_NIBBLE, dtype=np.uint8)
+for _i, _c in enumerate('0123456789abcdef'):
+    _HEX_NIBBLES[ord(_c)] = _i
+    _HEX_NIBBLES[ord(_c.upper())] = _i
+
+# Nibble value -> lowercase hex character code
+_HEX_CHARS = np.array([ord(c) for c in '0123456789abcdef'], dtype=np.uint32)
+
+# WCAG 2.x relative luminance coefficients (linear RGB)
+_LUMINANCE_WEIGHTS = np.array([0.2126, 0.7152, 0.0722])
+
+
+class StateColorTable(NamedTuple):
+    """Derived interaction colors for every theme x variant pair"""
+    themes: Tuple[FineUseTheme, ...]
+    variants: Tuple[str, ...]
+    base: np.ndarray      # (themes, variants, 3) uint8
+    hover: np.ndarray     # (themes, variants, 3) uint8
+    disabled: np.ndarray  # (themes, variants, 3) uint8
+
+
+def hex_to_rgb(hex_colors: Iterable[str]) -> np.ndarray:
+    """Convert an array of '#rrggbb' strings to an (N, 3) uint8 array
+    
+    Raises ValueError for a single string instead of a sequence, and for
+    any color that is not '#' followed by exactly six hex digits.
+    """
+    if isinstance(hex_colors, str):
+        raise ValueError("hex_to_rgb takes a sequence of colors - wrap a single color in a list")
+    codes = np.asarray(hex_colors, dtype=str)
+    if codes.size and codes.dtype.itemsize != np.dtype('<U7').itemsize:
+        raise ValueError("Hex colors must use the '#rrggbb' form")
+    # Shorter strings are padded with NUL, which maps to _INVALID_NIBBLE
+    codes = codes.astype('<U7')
+    chars = codes.view(np.uint32).reshape(codes.shape + (7,))
+    nibbles = _HEX_NIBBLES[np.minimum(chars[..., 1:], 127)]
+    if not (np.all(chars[..., 0] == ord('#')) and np.all(nibbles != _INVALID_NIBBLE)):
+        raise ValueError("Hex colors must use the '#rrggbb' form")
+    return (nibbles[..., 0::2] << 4) | nibbles[..., 1::2]
+
+
+def rgb_to_hex(rgb: np.ndarray) -> np.ndarray:
+    """Convert an (..., 3) RGB array to an array of '#rrggbb' strings"""
+    rgb = _as_uint8(rgb)
+    chars = np.empty(rgb.shape[:-1] + (7,), dtype=np.uint32)
+    chars[..., 0] = ord('#')
+    chars[..., 1::2] = _HEX_CHARS[rgb >> 4]
+    chars[..., 2::2] = _HEX_CHARS[rgb & 0x0F]
+    return chars.view('<U7')[..., 0]
+
+
+def pack_rgb(rgb: np.ndarray) -> np.ndarray:
+    """Pack an (..., 3) RGB array into 0xRRGGBB uint32 values"""
+    rgb = _as_uint8(rgb).astype(np.uint32)
+    return (rgb[..., 0] << 16) | (rgb[..., 1] << 8) | rgb[..., 2]
+
+
+def unpack_rgb(packed: np.ndarray) -> np.ndarray:
+    """Unpack 0xRRGGBB values into an (..., 3) uint8 array"""
+    packed = np.asarray(packed, dtype=np.uint32)
+    return np.stack(
+        [(packed >> 16) & 0xFF, (packed >> 8) & 0xFF, packed & 0xFF], axis=-1
+    ).astype(np.uint8)
+
+
+def srgb_to_linear(rgb: np.ndarray) -> np.ndarray:
+    """Convert sRGB (uint8 0-255 or float 0-1) to linear-light floats"""
+    c = _as_unit_float(rgb)
+    return np.where(c <= 0.04045, c / 12.92, ((c + 0.055) / 1.055) ** 2.4)
+
+
+def linear_to_srgb(linear: np.ndarray) -> np.ndarray:
+    """Convert linear-light floats to sRGB uint8"""
+    c = np.clip(np.asarray(linear, dtype=np.float64), 0.0, 1.0)
+    srgb = np.where(c <= 0.0031308, c * 12.92, 1.055 * c ** (1 / 2.4) - 0.055)
+    return _to_uint8(srgb)
+
+
+def blend(
+    fg: np.ndarray,
+    bg: np.ndarray,
+    alpha,
+    linear: bool = False
+) -> np.ndarray:
+    """
+    Alpha-composite fg over bg (source-over)
+    alpha broadcasts against the color arrays; linear=True blends in
+    linear light instead of the CSS-compatible sRGB space
+    """
+    a = np.asarray(alpha, dtype=np.float64)[..., np.newaxis] if np.ndim(alpha) else float(alpha)
+    if linear:
+        mixed = srgb_to_linear(fg) * a + srgb_to_linear(bg) * (1.0 - a)
+        return linear_to_srgb(mixed)
+    mixed = _as_unit_float(fg) * a + _as_unit_float(bg) * (1.0 - a)
+    return _to_uint8(mixed)
+
+
+def lighten(rgb: np.ndarray, amount) -> np.ndarray:
+    """Mix colors toward white by amount (0-1)"""
+    return blend(np.full(np.shape(rgb), 255, dtype=np.uint8), rgb, amount)
+
+
+def darken(rgb: np.ndarray, amount) -> np.ndarray:
+    """Mix colors toward black by amount (0-1)"""
+    return blend(np.zeros(np.shape(rgb), dtype=np.uint8), rgb, amount)
+
+
+def relative_luminance(rgb: np.ndarray) -> np.ndarray:
+    """WCAG relative luminance for an (..., 3) color array"""
+    return srgb_to_linear(rgb) @ _LUMINANCE_WEIGHTS
+
+
+def contrast_ratio(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """WCAG contrast ratio (1-21) between two broadcastable color arrays"""
+    la = relative_luminance(a)
+    lb = relative_luminance(b)
+    return (np.maximum(la, lb) + 0.05) / (np.minimum(la, lb) + 0.05)
+
+
+def token_matrix(
+    themes: Optional[Sequence[FineUseTheme]] = None,
+    tokens: Optional[Sequence[str]] = None
+) -> np.ndarray:
+    """
+    Stack theme palettes into a (themes, tokens, 3) uint8 array
+    Defaults to every theme and every token in TOKEN_NAMES order
+    """
+    themes = tuple(FineUseTheme) if themes is None else tuple(themes)
+    matrix = np.array([THEME_PALETTES[theme].rgb for theme in themes], dtype=np.uint8)
+    if tokens is None:
+        return matrix
+    return matrix[:, [TOKEN_INDEX[token] for token in tokens]]
+
+
+def derive_state_colors(
+    themes: Optional[Sequence[FineUseTheme]] = None,
+    variants: Optional[Sequence[str]] = None,
+    hover_amount: float = 0.15,
+    disabled_alpha: float = 0.5
+) -> StateColorTable:
+    """
+    Derive hover and disabled colors for every theme x variant in one pass
+
+    Hover lightens on dark themes and darkens on light ones; disabled
+    composites the base color over the theme background (CSS opacity).
+    """
+    themes = tuple(FineUseTheme) if themes is None else tuple(themes)
+    variants = tuple(VARIANT_TOKENS) if variants is None else tuple(variants)
+
+    rgb = token_matrix(themes)
+    base = rgb[:, [TOKEN_INDEX[VARIANT_TOKENS[v]] for v in variants]]
+    bg = rgb[:, TOKEN_INDEX['bg']][:, np.newaxis, :]
+
+    dark_theme = (relative_luminance(bg) < 0.5)[..., np.newaxis]
+    hover = np.where(dark_theme, lighten(base, hover_amount), darken(base, hover_amount))
+    disabled = blend(base, np.broadcast_to(bg, base.shape), disabled_alpha)
+
+    return StateColorTable(themes, variants, base, hover.astype(np.uint8), disabled)
+
+
+def _as_unit_float(rgb) -> np.ndarray:
+    """Normalise uint8 (0-255) or float (0-1) input to float64 0-1"""
+    arr = np.asarray(rgb)
+    if arr.dtype.kind in 'ui':
+        return arr.astype(np.float64) / 255.0
+    return arr.astype(np.float64, copy=False)
+
+
+def _as_uint8(rgb) -> np.ndarray:
+    """Normalise color input to uint8 (floats are treated as 0-1)"""
+    arr = np.asarray(rgb)
+    if arr.dtype.kind == 'f':
+        return _to_uint8(arr)
+    return arr.astype(np.uint8, copy=False)
+
+
+def _to_uint8(unit: np.ndarray) -> np.ndarray:
+    """Round 0-1 floats to uint8 channels"""
+    return np.rint(np.clip(unit, 0.0, 1.0) * 255.0).astype(np.uint8)
+
+
+if __name__ == "__main__":
+    # Example: WCAG text/background contrast for every theme
+    rgb = token_matrix()
+    ratios = contrast_ratio(rgb[:, TOKEN_INDEX['text']], rgb[:, TOKEN_INDEX['bg']])
+    for theme, ratio in zip(FineUseTheme, ratios):
+        print(f"{theme.value:<14} text/bg contrast {ratio:5.2f}:1")
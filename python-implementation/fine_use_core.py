@@ -8,9 +8,20 @@ translated to Python constants and utilities.
 ALL VALUES MATCH THE WEB IMPLEMENTATION EXACTLY.
 """
 
-from typing import Dict, Any, Tuple
+from __future__ import annotations
+
+import collections
+import collections.abc
+import contextvars
+import weakref
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from types import MappingProxyType, MethodType
 from enum import Enum
 
+# Annotations use builtin generics and collections.abc rather than typing:
+# importing typing (and the re it pulls in) would more than double the
+# cost of the token import
+
 
 class FineUseTheme(Enum):
     """Available Fine Use themes"""
@@ -174,6 +185,153 @@ class FineUseColors:
     }
 
 
+# Color token names in canonical order - index positions are stable
+TOKEN_NAMES: tuple[str, ...] = (
+    'bg', 'surface', 'border', 'text', 'comment',
+    'success', 'warning', 'error', 'info', 'accent', 'orange'
+)
+TOKEN_INDEX: Mapping[str, int] = MappingProxyType(
+    {name: i for i, name in enumerate(TOKEN_NAMES)}
+)
+
+
+class Palette(collections.abc.Mapping):
+    """
+    Immutable, precomputed color palette for a single theme
+    Built once per theme - hex strings, RGB tuples and packed
+    0xRRGGBB ints are parsed up front so token access never allocates
+    
+    Behaves like the read-only dict it replaces:
+        palette['accent']      -> '#58a6ff'
+        palette.rgb_of('bg')   -> (13, 17, 23)
+        palette.hex[TOKEN_INDEX['bg']]
+    """
+    
+    __slots__ = ('theme', 'hex', 'rgb', 'packed', 'index', '_hex_map', '_rgb_map', '_packed_map')
+    
+    def __init__(self, theme: FineUseTheme | str, colors: dict[str, str]):
+        hex_values = tuple(colors[name] for name in TOKEN_NAMES)
+        packed_values = tuple(int(value.lstrip('#'), 16) for value in hex_values)
+        self._assign(theme, hex_values, packed_values)
+    
+    @classmethod
+    def from_packed(cls, theme: FineUseTheme | str, packed: Iterable[int]) -> 'Palette':
+        """Build a palette from 0xRRGGBB ints in TOKEN_NAMES order (e.g. a binary cache)"""
+        palette = cls.__new__(cls)
+        packed_values = tuple(packed)
+        palette._assign(theme, tuple(['#%06x' % value for value in packed_values]), packed_values)
+        return palette
+    
+    def _assign(self, theme, hex_values: tuple[str, ...], packed_values: tuple[int, ...]):
+        """Populate the immutable slots (construction only)"""
+        rgb_values = tuple([(v >> 16, (v >> 8) & 0xFF, v & 0xFF) for v in packed_values])
+        
+        setattr_ = object.__setattr__
+        setattr_(self, 'theme', theme)
+        setattr_(self, 'hex', hex_values)
+        setattr_(self, 'rgb', rgb_values)
+        setattr_(self, 'packed', packed_values)
+        setattr_(self, 'index', TOKEN_INDEX)
+        setattr_(self, '_hex_map', dict(zip(TOKEN_NAMES, hex_values)))
+        setattr_(self, '_rgb_map', dict(zip(TOKEN_NAMES, rgb_values)))
+        setattr_(self, '_packed_map', dict(zip(TOKEN_NAMES, packed_values)))
+    
+    def __setattr__(self, name, value):
+        raise AttributeError("Palette is immutable")
+    
+    def __delattr__(self, name):
+        raise AttributeError("Palette is immutable")
+    
+    def __getitem__(self, token: str) -> str:
+        return self._hex_map[token]
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(TOKEN_NAMES)
+    
+    def __len__(self) -> int:
+        return len(TOKEN_NAMES)
+    
+    def __contains__(self, token) -> bool:
+        return token in self._hex_map
+    
+    def __hash__(self) -> int:
+        # Equality is Mapping's (by colors, whatever the theme) - hash the same way
+        return hash(self.hex)
+    
+    def __repr__(self) -> str:
+        return f"Palette({getattr(self.theme, 'value', self.theme)!r})"
+    
+    def get(self, token: str, default: object = None) -> object:
+        """Get hex color for token (dict-compatible)"""
+        return self._hex_map.get(token, default)
+    
+    def rgb_of(self, token: str) -> tuple[int, int, int]:
+        """Get pre-parsed RGB tuple for token"""
+        return self._rgb_map[token]
+    
+    def packed_of(self, token: str) -> int:
+        """Get packed 0xRRGGBB int for token"""
+        return self._packed_map[token]
+    
+    def diff(self, other: 'Palette') -> dict[str, str]:
+        """Get {token: hex} for tokens whose value differs in other"""
+        return {
+            name: new_hex
+            for name, old_packed, new_packed, new_hex
+            in zip(TOKEN_NAMES, self.packed, other.packed, other.hex)
+            if old_packed != new_packed
+        }
+
+
+class VariantColors(collections.namedtuple(
+        'VariantColors', 'bg fg hover_bg hover_fg pressed_bg pressed_fg focus')):
+    """
+    Immutable button colors for one variant in one theme
+    Shared by every button of that variant - widgets hold a reference,
+    never a copy
+    
+    Fields (hex strings): bg, fg, hover_bg, hover_fg, pressed_bg,
+    pressed_fg, focus
+    """
+    __slots__ = ()
+
+
+# Button variants in canonical order, and the token that fills each one
+VARIANT_NAMES: tuple[str, ...] = ('primary', 'secondary', 'success', 'warning', 'error', 'info')
+VARIANT_TOKENS: Mapping[str, str] = MappingProxyType({
+    'primary': 'accent',
+    'secondary': 'surface',
+    'success': 'success',
+    'warning': 'warning',
+    'error': 'error',
+    'info': 'info'
+})
+
+
+def build_variant_table(palette: Palette) -> Mapping[str, VariantColors]:
+    """Compute the variant x state color table for a palette"""
+    bg, accent = palette['bg'], palette['accent']
+    table = {
+        'secondary': VariantColors(
+            bg=palette['surface'], fg=palette['text'],
+            hover_bg=palette['border'], hover_fg=palette['text'],
+            pressed_bg=accent, pressed_fg=bg,
+            focus=accent
+        )
+    }
+    for variant in VARIANT_NAMES:
+        if variant == 'secondary':
+            continue
+        fill = palette[VARIANT_TOKENS[variant]]
+        table[variant] = VariantColors(
+            bg=fill, fg=bg,
+            hover_bg=bg, hover_fg=fill,
+            pressed_bg=fill, pressed_fg=bg,
+            focus=accent
+        )
+    return MappingProxyType({variant: table[variant] for variant in VARIANT_NAMES})
+
+
 class FineUseSpacing:
     """
     Fine Use Spacing System - Exact values from CSS
@@ -250,96 +408,350 @@ class FineUseZIndex:
     TOOLTIP = 1070
 
 
+class TokenSet:
+    """
+    Snapshot of typography, spacing and border tokens for one theme + scale
+    Every size/weight font tuple and spacing/border value is computed once
+    and interned, so the hot accessors are a single dict lookup
+    """
+    
+    __slots__ = ('palette', 'scale', 'font_table', 'spacing_table', 'border_table',
+                 '_default_spacing', '_default_border')
+    
+    def __init__(self, palette: Palette, scale: float = 1.0):
+        self.palette = palette
+        self.scale = scale
+        
+        family = FineUseTypography.FONT_FAMILY
+        self.font_table: dict[str, dict[str, tuple[str, int, str]]] = {}
+        for size, px in FineUseTypography.FONT_SIZES.items():
+            normal = (family, _scaled(px, scale), 'normal')
+            bold = (family, normal[1], 'bold')
+            self.font_table[size] = {
+                weight: bold if weight in ('semibold', 'bold') else normal
+                for weight in FineUseTypography.FONT_WEIGHTS
+            }
+        
+        self.spacing_table: dict[str, int] = {
+            'xs': _scaled(FineUseSpacing.XS, scale),
+            'sm': _scaled(FineUseSpacing.SM, scale),
+            'md': _scaled(FineUseSpacing.MD, scale),
+            'lg': _scaled(FineUseSpacing.LG, scale),
+            'xl': _scaled(FineUseSpacing.XL, scale),
+            'xxl': _scaled(FineUseSpacing.XXL, scale)
+        }
+        self.border_table: dict[str, int] = {
+            'thin': _scaled(FineUseBorders.THIN, scale),
+            'thick': _scaled(FineUseBorders.THICK, scale),
+            'heavy': _scaled(FineUseBorders.HEAVY, scale)
+        }
+        self._default_spacing = self.spacing_table['md']
+        self._default_border = self.border_table['thin']
+    
+    def font(self, size: str = 'md', weight: str = 'normal') -> tuple[str, int, str]:
+        """Get interned font tuple (family, size, weight)"""
+        weights = self.font_table[size]
+        return weights.get(weight) or weights['normal']
+    
+    def spacing(self, size: str) -> int:
+        """Get spacing value (defaults to md)"""
+        return self.spacing_table.get(size, self._default_spacing)
+    
+    def border_width(self, size: str = 'thin') -> int:
+        """Get border width (defaults to thin)"""
+        return self.border_table.get(size, self._default_border)
+
+
+def _scaled(value: int, scale: float) -> int:
+    """Scale a pixel token, never collapsing below 1px"""
+    return value if scale == 1.0 else max(1, round(value * scale))
+
+
+# TokenSets are shared by every FineUse instance using the same theme + scale
+_TOKEN_SETS: dict[tuple[Palette, float], TokenSet] = {}
+
+
+def get_token_set(palette: Palette, scale: float = 1.0) -> TokenSet:
+    """Get the shared TokenSet for a palette and scale factor"""
+    key = (palette, scale)
+    tokens = _TOKEN_SETS.get(key)
+    if tokens is None:
+        tokens = _TOKEN_SETS[key] = TokenSet(palette, scale)
+    return tokens
+
+
+class ThemeState(collections.namedtuple('ThemeState', 'palette scale tokens variants')):
+    """Everything the token accessors resolve against: palette + scale
+    
+    Fields: palette (Palette), scale (float), tokens (TokenSet) and
+    variants (variant name -> VariantColors)
+    """
+    __slots__ = ()
+    
+    @classmethod
+    def build(cls, palette: Palette, scale: float = 1.0) -> 'ThemeState':
+        return cls(palette, scale, get_token_set(palette, scale), get_variant_table(palette))
+
+
+class ThemeContext:
+    """
+    Context manager returned by FineUse.theme_context()
+    A plain class rather than contextlib.contextmanager, which would add
+    contextlib to every token import
+    """
+    
+    __slots__ = ('owner', 'theme', 'scale', '_token')
+    
+    def __init__(self, owner: FineUse, theme: FineUseTheme | Palette | None, scale: float | None):
+        self.owner = owner
+        self.theme = theme
+        self.scale = scale
+        self._token = None
+    
+    def __enter__(self) -> Palette:
+        owner, theme = self.owner, self.theme
+        current = owner.state
+        if theme is None:
+            palette = current.palette
+        elif isinstance(theme, Palette):
+            palette = theme
+        else:
+            palette = owner.get_theme_colors(theme)
+        scale = current.scale if self.scale is None else self.scale
+        self._token = owner._context.set(ThemeState.build(palette, scale))
+        return palette
+    
+    def __exit__(self, *exc_info):
+        self.owner._context.reset(self._token)
+        self._token = None
+
+
 class FineUse:
     """
     Main Fine Use Design System Class
     Provides access to all design tokens and utilities
+    
+    The theme is either the instance-wide one (set_theme) or, inside
+    theme_context(), a context-local override. Contexts follow
+    contextvars, so each thread and asyncio task sees its own theme.
     """
     
     def __init__(self, theme: FineUseTheme = FineUseTheme.GITHUB_DARK):
-        self.current_theme = theme
-        self.colors = self.get_theme_colors(theme)
         self.spacing = FineUseSpacing()
         self.typography = FineUseTypography()
         self.borders = FineUseBorders()
         self.transitions = FineUseTransitions()
         self.z_index = FineUseZIndex()
+        self._global = ThemeState.build(self.get_theme_colors(theme))
+        self._context: contextvars.ContextVar[ThemeState | None] = contextvars.ContextVar(
+            f'fine_use_theme_{id(self):x}', default=None
+        )
+        self._subscribers: dict[weakref.ref, frozenset[str] | None] = {}
     
-    def get_theme_colors(self, theme: FineUseTheme) -> Dict[str, str]:
-        """Get color palette for specified theme"""
-        theme_map = {
-            FineUseTheme.GITHUB_DARK: FineUseColors.GITHUB_DARK,
-            FineUseTheme.GITHUB_LIGHT: FineUseColors.GITHUB_LIGHT,
-            FineUseTheme.AMBER: FineUseColors.AMBER,
-            FineUseTheme.GRUVBOX: FineUseColors.GRUVBOX,
-            FineUseTheme.MONOCHROME: FineUseColors.MONOCHROME,
-            FineUseTheme.MONOKAI: FineUseColors.MONOKAI,
-            FineUseTheme.NEWSPAPER: FineUseColors.NEWSPAPER,
-            FineUseTheme.SAKURA: FineUseColors.SAKURA,
-            FineUseTheme.SYNTHWAVE: FineUseColors.SYNTHWAVE,
-            FineUseTheme.VT220: FineUseColors.VT220
-        }
-        return theme_map[theme]
+    @property
+    def state(self) -> ThemeState:
+        """Active theme state - the context override if any, else the global one"""
+        return self._context.get() or self._global
+    
+    @property
+    def colors(self) -> Palette:
+        return (self._context.get() or self._global).palette
+    
+    @property
+    def current_theme(self) -> FineUseTheme | str:
+        return (self._context.get() or self._global).palette.theme
+    
+    @property
+    def scale(self) -> float:
+        return (self._context.get() or self._global).scale
+    
+    @property
+    def tokens(self) -> TokenSet:
+        return (self._context.get() or self._global).tokens
+    
+    @property
+    def variants(self) -> Mapping[str, VariantColors]:
+        return (self._context.get() or self._global).variants
+    
+    @property
+    def in_theme_context(self) -> bool:
+        """True inside a theme_context() block"""
+        return self._context.get() is not None
+    
+    def theme_context(
+        self,
+        theme: FineUseTheme | Palette | None = None,
+        scale: float | None = None
+    ) -> ThemeContext:
+        """
+        Temporarily use another theme and/or scale in the current context
+        
+        Only code running in this thread/task sees the override, so several
+        windows or render workers can build different themes in parallel:
+        
+            with fine_use.theme_context(FineUseTheme.AMBER) as palette:
+                window = build_window()
+        
+        theme=None keeps the current palette; set_theme()/set_scale() inside
+        the block change the override only. Widgets built inside a context
+        keep its theme and do not subscribe to global theme switches.
+        """
+        return ThemeContext(self, theme, scale)
+    
+    def get_theme_colors(self, theme: FineUseTheme) -> Palette:
+        """Get precomputed color palette for specified theme"""
+        return THEME_PALETTES[theme]
     
     def set_theme(self, theme: FineUseTheme):
-        """Change current theme"""
-        self.current_theme = theme
-        self.colors = self.get_theme_colors(theme)
+        """Change current theme and notify subscribers of changed tokens"""
+        self.set_palette(self.get_theme_colors(theme))
+    
+    def set_palette(self, palette: Palette):
+        """
+        Switch to any Palette - including ones loaded from theme files
+        (see fine_use_theme_loader) - and notify subscribers
+        
+        Inside theme_context() only the context override changes and no
+        subscribers are notified.
+        """
+        context = self._context.get()
+        if context is not None:
+            self._context.set(ThemeState.build(palette, context.scale))
+            return
+        
+        old_colors = self._global.palette
+        self._global = ThemeState.build(palette, self._global.scale)
+        
+        changes = old_colors.diff(palette)
+        if changes:
+            self._notify(MappingProxyType(changes))
+    
+    def subscribe(
+        self,
+        callback: Callable[[Mapping[str, str]], None],
+        tokens: Iterable[str] | None = None
+    ):
+        """
+        Register a weakly-held theme change callback
+        
+        The callback receives a read-only {token: new_hex} mapping holding
+        only the tokens that changed. When tokens is given the callback is
+        skipped unless one of them changed. Bound methods are held via
+        WeakMethod, so subscribing never keeps a widget alive.
+        
+        Inside theme_context() this is a no-op: the caller is pinned to
+        the context's theme and must not follow global switches.
+        """
+        if self._context.get() is not None:
+            return
+        if isinstance(callback, MethodType):
+            ref = weakref.WeakMethod(callback, self._discard_subscriber)
+        else:
+            ref = weakref.ref(callback, self._discard_subscriber)
+        self._subscribers[ref] = frozenset(tokens) if tokens is not None else None
+    
+    def unsubscribe(self, callback: Callable[[Mapping[str, str]], None]):
+        """Remove a theme change callback (no-op if not subscribed)"""
+        if isinstance(callback, MethodType):
+            ref = weakref.WeakMethod(callback)
+        else:
+            ref = weakref.ref(callback)
+        self._subscribers.pop(ref, None)
+    
+    def _discard_subscriber(self, ref: weakref.ref):
+        """Drop a subscriber whose referent has been garbage collected"""
+        self._subscribers.pop(ref, None)
+    
+    def _notify(self, changes: Mapping[str, str]):
+        """Deliver one batch of token changes to interested subscribers"""
+        changed = changes.keys()
+        for ref, tokens in list(self._subscribers.items()):
+            if tokens is not None and tokens.isdisjoint(changed):
+                continue
+            callback = ref()
+            if callback is not None:
+                callback(changes)
+    
+    def set_scale(self, scale: float):
+        """Change the pixel scale factor for fonts, spacing and borders"""
+        context = self._context.get()
+        if context is not None:
+            self._context.set(ThemeState.build(context.palette, scale))
+        else:
+            self._global = ThemeState.build(self._global.palette, scale)
     
-    def get_font_tuple(self, size: str = 'md', weight: str = 'normal') -> Tuple[str, int, str]:
+    def get_font_tuple(self, size: str = 'md', weight: str = 'normal') -> tuple[str, int, str]:
         """Get font tuple for GUI frameworks (family, size, weight)"""
-        return (
-            self.typography.FONT_FAMILY,
-            self.typography.FONT_SIZES[size],
-            'bold' if weight in ['semibold', 'bold'] else 'normal'
-        )
+        return self.tokens.font(size, weight)
     
-    def hex_to_rgb(self, hex_color: str) -> Tuple[int, int, int]:
+    def hex_to_rgb(self, hex_color: str) -> tuple[int, int, int]:
         """Convert hex color to RGB tuple"""
         hex_color = hex_color.lstrip('#')
         return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
     
+    def get_variant_colors(self, variant: str) -> VariantColors:
+        """Get shared button colors for variant (unknown variants -> secondary)"""
+        variants = (self._context.get() or self._global).variants
+        return variants.get(variant) or variants['secondary']
+    
     def get_semantic_color(self, semantic: str) -> str:
         """Get semantic color (success, warning, error, info)"""
         return self.colors.get(semantic, self.colors['text'])
 
 
+# Frozen theme registry - one Palette per theme, built once at import
+THEME_PALETTES: Mapping[FineUseTheme, Palette] = MappingProxyType({
+    theme: Palette(theme, getattr(FineUseColors, theme.name))
+    for theme in FineUseTheme
+})
+
+
+# One shared variant table per palette - built-in themes precomputed at import
+_VARIANT_TABLES: dict[Palette, Mapping[str, VariantColors]] = {
+    palette: build_variant_table(palette) for palette in THEME_PALETTES.values()
+}
+
+
+def get_variant_table(palette: Palette) -> Mapping[str, VariantColors]:
+    """Get the shared variant table for a palette (built on first use for loaded themes)"""
+    table = _VARIANT_TABLES.get(palette)
+    if table is None:
+        table = _VARIANT_TABLES[palette] = build_variant_table(palette)
+    return table
+
+
 # Singleton instance for global access
 fine_use = FineUse()
+_override = fine_use._context  # read directly by the hot token helpers below
 
 
 # Utility functions for common operations
-def get_current_theme_colors() -> Dict[str, str]:
+def get_current_theme_colors() -> Palette:
     """Get current theme colors"""
     return fine_use.colors
 
 
-def get_font(size: str = 'md', weight: str = 'normal') -> Tuple[str, int, str]:
+def get_font(size: str = 'md', weight: str = 'normal') -> tuple[str, int, str]:
     """Get font configuration tuple"""
-    return fine_use.get_font_tuple(size, weight)
+    return (_override.get() or fine_use._global).tokens.font(size, weight)
 
 
 def get_spacing(size: str) -> int:
     """Get spacing value"""
-    spacing_map = {
-        'xs': fine_use.spacing.XS,
-        'sm': fine_use.spacing.SM,
-        'md': fine_use.spacing.MD,
-        'lg': fine_use.spacing.LG,
-        'xl': fine_use.spacing.XL,
-        'xxl': fine_use.spacing.XXL
-    }
-    return spacing_map.get(size, fine_use.spacing.MD)
+    return (_override.get() or fine_use._global).tokens.spacing(size)
 
 
 def get_border_width(size: str = 'thin') -> int:
     """Get border width"""
-    border_map = {
-        'thin': fine_use.borders.THIN,
-        'thick': fine_use.borders.THICK,
-        'heavy': fine_use.borders.HEAVY
-    }
-    return border_map.get(size, fine_use.borders.THIN)
+    return (_override.get() or fine_use._global).tokens.border_width(size)
+
+
+def theme_context(
+    theme: FineUseTheme | Palette | None = None,
+    scale: float | None = None
+):
+    """Context-local theme override for the global fine_use instance"""
+    return fine_use.theme_context(theme, scale)
 
 
 if __name__ == "__main__":
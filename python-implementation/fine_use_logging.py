@@ -0,0 +1,267 @@
+"""
+Fine Use Design System - Logging Integration
+============================================
+
+Streams Python logging records into the Fine Use log terminals without
+touching widgets off the UI thread.
+
+Usage:
+    import logging
+    from fine_use_logging import FineUseLogHandler
+
+    handler = FineUseLogHandler(terminal.add_log_entries)
+    handler.attach_qt(terminal)          # or handler.attach_tk(app.root)
+    logging.getLogger().addHandler(handler)
+
+    logging.getLogger("worker").warning("Disk usage at 91%")  # any thread
+"""
+
+import importlib
+import logging
+import threading
+from bisect import bisect_right
+from collections import deque
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+# Fine Use dashboards log successes next to INFO/WARN/ERROR
+SUCCESS = 25
+logging.addLevelName(SUCCESS, 'SUCCESS')
+
+# Fine Use level for each logging level; a level in between maps to the
+# nearest one below it (CRITICAL -> ERROR, custom 15 -> DEBUG)
+LEVEL_NAMES = {
+    logging.DEBUG: 'DEBUG',
+    logging.INFO: 'INFO',
+    SUCCESS: 'SUCCESS',
+    logging.WARNING: 'WARN',
+    logging.ERROR: 'ERROR',
+}
+
+DROP_OLDEST = 'drop-oldest'
+DROP_NEWEST = 'drop-newest'
+BLOCK = 'block'
+DROP_POLICIES = (DROP_OLDEST, DROP_NEWEST, BLOCK)
+
+QT_BINDINGS = ('PyQt6', 'PyQt5', 'PySide6')
+
+
+class FineUseLogHandler(logging.Handler):
+    """logging.Handler that queues records for a Fine Use log terminal
+
+    emit() may be called from any thread. It formats the record and
+    appends (levelno, message, created) to a bounded deque - no handler
+    lock is taken, appends and pops on a deque are atomic. The UI thread
+    drains the queue every interval_ms (attach_tk / attach_qt), at most
+    batch_size records per drain, and hands them to sink as a list of
+    (level, message, timestamp) entries - the shape add_log_entries of
+    the terminals takes.
+
+    When capacity records are waiting, drop_policy decides:
+
+    - 'drop-oldest' (default): evict the oldest queued record
+    - 'drop-newest': discard the incoming record
+    - 'block': wait up to block_timeout seconds for the UI thread to make
+      room, then discard the record. Never blocks the UI thread itself.
+
+    capacity is a soft bound: the check and the append are not one atomic
+    step, so threads emitting at the same moment can each add one record
+    past it. Evictions and blocked appends re-check under a lock, so only
+    records actually evicted or discarded are counted as dropped.
+
+    Counters: emitted, dropped, drained, drains, max_batch and high_water
+    (the most records seen waiting at a drain).
+    """
+
+    def __init__(self, sink: Callable[[List[tuple]], None], capacity: int = 10000,
+                 drop_policy: str = DROP_OLDEST, batch_size: int = 5000,
+                 level: int = logging.NOTSET, level_names: Optional[Dict[int, str]] = None,
+                 block_timeout: float = 1.0):
+        super().__init__(level)
+        if drop_policy not in DROP_POLICIES:
+            raise ValueError(f"Unknown drop_policy {drop_policy!r}, expected one of {DROP_POLICIES}")
+        if capacity < 1 or batch_size < 1:
+            raise ValueError("capacity and batch_size must be at least 1")
+        self.sink = sink
+        self.capacity = capacity
+        self.drop_policy = drop_policy
+        self.batch_size = batch_size
+        self.block_timeout = block_timeout
+        self.level_names = dict(LEVEL_NAMES, **(level_names or {}))
+        self._levels = sorted(self.level_names)
+        self._level_cache: Dict[int, str] = {}
+        self._queue: deque = deque()
+        self._drop_lock = threading.Lock()
+        self._space = threading.Condition(threading.Lock())
+        self._ui_thread: Optional[int] = None
+        self._detach: Optional[Callable[[], None]] = None
+        self.reset_counters()
+
+    @property
+    def pending(self) -> int:
+        """Records waiting for the next drain"""
+        return len(self._queue)
+
+    @property
+    def emitted(self) -> int:
+        """Records handed to the handler (drained, dropped or waiting)"""
+        return self.drained + self.dropped + len(self._queue)
+
+    def reset_counters(self):
+        """Reset dropped, drained, drains, max_batch and high_water"""
+        self.dropped = 0
+        self.drained = 0
+        self.drains = 0
+        self.max_batch = 0
+        self.high_water = 0
+
+    def handle(self, record: logging.LogRecord):
+        """Filter and emit without the per-record handler lock - emit() is thread-safe"""
+        result = self.filter(record)
+        if isinstance(result, logging.LogRecord):
+            record = result
+        if result:
+            self.emit(record)
+        return result
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            item = (record.levelno, self.format(record), record.created)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+            return
+        queue = self._queue
+        if len(queue) < self.capacity:
+            queue.append(item)
+        elif self.drop_policy == DROP_OLDEST:
+            self._make_room()
+            queue.append(item)
+        elif self.drop_policy == DROP_NEWEST or not self._append_when_room(item):
+            self._count_drop()
+
+    def _make_room(self):
+        """Evict the oldest records until the queue is below capacity, counting each one evicted"""
+        queue = self._queue
+        with self._drop_lock:
+            while len(queue) >= self.capacity:
+                try:
+                    queue.popleft()
+                except IndexError:
+                    break  # Drained meanwhile
+                self.dropped += 1
+
+    def _append_when_room(self, item: tuple) -> bool:
+        """Append once the queue is below capacity; False on timeout or on the UI thread"""
+        if threading.get_ident() == self._ui_thread:
+            return False
+        queue = self._queue
+        with self._space:
+            # The length is re-checked under the lock each time the UI thread
+            # signals room, so blocked threads never append past capacity
+            if not self._space.wait_for(lambda: len(queue) < self.capacity, self.block_timeout):
+                return False
+            queue.append(item)
+            return True
+
+    def _count_drop(self):
+        with self._drop_lock:
+            self.dropped += 1
+
+    def drain(self, max_records: Optional[int] = None) -> int:
+        """Hand up to max_records (default batch_size) queued records to sink; returns how many
+
+        Call on the UI thread - attach_tk/attach_qt do so every frame.
+        """
+        queue = self._queue
+        waiting = len(queue)
+        count = min(waiting, max_records or self.batch_size)
+        if not count:
+            return 0
+        self.high_water = max(self.high_water, waiting)
+        popleft = queue.popleft
+        records = []
+        try:
+            for _ in range(count):
+                records.append(popleft())
+        except IndexError:
+            pass
+        if self.drop_policy == BLOCK:
+            with self._space:
+                self._space.notify_all()
+
+        level_name, fromtimestamp = self._level_name, datetime.fromtimestamp
+        entries = [(level_name(levelno), message, fromtimestamp(created)) for levelno, message, created in records]
+        self.drained += len(entries)
+        self.drains += 1
+        self.max_batch = max(self.max_batch, len(entries))
+        self.sink(entries)
+        return len(entries)
+
+    def _level_name(self, levelno: int) -> str:
+        name = self._level_cache.get(levelno)
+        if name is None:
+            index = max(0, bisect_right(self._levels, levelno) - 1)
+            name = self._level_cache[levelno] = self.level_names[self._levels[index]]
+        return name
+
+    def attach_tk(self, widget, interval_ms: int = 16) -> 'FineUseLogHandler':
+        """Drain on the Tk main loop every interval_ms (call from the Tk thread)"""
+        self.detach()
+        self._ui_thread = threading.get_ident()
+        after_id = None
+
+        def tick():
+            nonlocal after_id
+            after_id = widget.after(interval_ms, tick)
+            self.drain()
+
+        def cancel():
+            try:
+                widget.after_cancel(after_id)
+            except Exception:
+                pass  # Widget already destroyed
+
+        after_id = widget.after(interval_ms, tick)
+        self._detach = cancel
+        return self
+
+    def attach_qt(self, widget, interval_ms: int = 16) -> 'FineUseLogHandler':
+        """Drain from a QTimer owned by widget every interval_ms (call from the GUI thread)
+
+        The timer comes from the Qt binding widget belongs to (PyQt5/6 or
+        PySide6), so the handler works with either implementation.
+        """
+        self.detach()
+        self._ui_thread = threading.get_ident()
+        binding = next(
+            cls.__module__.split('.')[0] for cls in type(widget).__mro__
+            if cls.__module__.split('.')[0] in QT_BINDINGS
+        )
+        qt_core = importlib.import_module(binding + '.QtCore')
+        timer = qt_core.QTimer(widget)
+        timer.setInterval(interval_ms)
+        timer.timeout.connect(self.drain)
+        timer.start()
+
+        def stop():
+            try:
+                timer.stop()
+                timer.deleteLater()
+            except RuntimeError:
+                pass  # Widget (and its timer) already deleted
+
+        self._detach = stop
+        return self
+
+    def detach(self):
+        """Stop draining on the UI loop; queued records stay until drain() is called"""
+        if self._detach is not None:
+            self._detach()
+            self._detach = None
+        self._ui_thread = None
+
+    def close(self):
+        self.detach()
+        super().close()
@@ -13,62 +13,211 @@ Usage:
     button = FineUseButton("START SERVICES", variant="primary")
 """
 
+import contextlib
+import hashlib
+import numbers
+import os
 import sys
-from typing import Optional, Callable, Dict, Any
-
-try:
-    from PyQt6.QtWidgets import *
-    from PyQt6.QtCore import *
-    from PyQt6.QtGui import *
-    PYQT_VERSION = 6
-except ImportError:
+import threading
+import time
+from array import array
+from typing import Optional, Callable, Dict, Any, Sequence, Iterable, List, Tuple
+
+# Qt binding: PyQt6, then PyQt5, then PySide6. Set FINE_USE_QT_API to
+# "pyqt6", "pyqt5" or "pyside6" to force one; importing through
+# fine_use.pyside6 forces PySide6 without touching the environment.
+_QT_API_ORDER = ('pyqt6', 'pyqt5', 'pyside6')
+_requested_api = (
+    getattr(sys.modules.get('fine_use'), '_qt_api', None)
+    or os.environ.get('FINE_USE_QT_API', '')
+).lower()
+if _requested_api and _requested_api not in _QT_API_ORDER:
+    raise ImportError(f"Unknown FINE_USE_QT_API {_requested_api!r}, expected one of {_QT_API_ORDER}")
+
+QT_API = None
+for _api in ((_requested_api,) if _requested_api else _QT_API_ORDER):
     try:
-        from PyQt5.QtWidgets import *
-        from PyQt5.QtCore import *
-        from PyQt5.QtGui import *
-        PYQT_VERSION = 5
+        if _api == 'pyqt6':
+            from PyQt6.QtWidgets import *
+            from PyQt6.QtCore import *
+            from PyQt6.QtGui import *
+            PYQT_VERSION = 6
+        elif _api == 'pyqt5':
+            from PyQt5.QtWidgets import *
+            from PyQt5.QtCore import *
+            from PyQt5.QtGui import *
+            PYQT_VERSION = 5
+        else:
+            from PySide6.QtWidgets import *
+            from PySide6.QtCore import *
+            from PySide6.QtGui import *
+            PYQT_VERSION = 6
+        QT_API = _api
+        break
     except ImportError:
-        raise ImportError("PyQt5 or PyQt6 is required for Fine Use PyQt implementation")
+        continue
+
+if QT_API is None:
+    raise ImportError("PyQt5, PyQt6 or PySide6 is required for Fine Use PyQt implementation")
+
+from fine_use_cache import LRUCache
+from fine_use_core import (
+    fine_use, get_spacing, get_font, get_border_width, get_token_set, get_variant_table,
+    Palette, TokenSet, THEME_PALETTES
+)
+
+# Bump STYLESHEET_VERSION whenever the QSS template changes - it is part of
+# every stylesheet cache key, together with the Qt binding and version
+STYLESHEET_VERSION = 4
+BACKEND_VERSION = f"{QT_API}-{qVersion()}-qss{STYLESHEET_VERSION}"
 
-from fine_use_core import fine_use, get_spacing, get_font, get_border_width
+# Spacing token padding each FineUseButton size - the QSS size selectors and
+# FineUseProxyStyle.sizeFromContents both read it, so the two stay in step
+BUTTON_PADDING = {'sm': 'xs', 'md': 'md', 'lg': 'lg', 'xl': 'xl'}
+
+
+class StyleSheetCache(LRUCache):
+    """
+    Compiled app stylesheets keyed by (theme, colors, scale, backend version)
+    
+    An in-memory LRU holds the most recent stylesheets; with disk_dir set,
+    compiled text is also stored as <key>.qss so later starts skip the
+    template entirely. Safe to use from render worker threads.
+    """
+    
+    def __init__(self, maxsize: int = 16, disk_dir: Optional[str] = None):
+        super().__init__(maxsize)
+        self.disk_dir = disk_dir
+        self.disk_hits = 0
+    
+    @property
+    def hit_rate(self) -> float:
+        """Share of get() calls served without compiling (memory or disk)"""
+        lookups = self.hits + self.disk_hits + self.misses
+        return (self.hits + self.disk_hits) / lookups if lookups else 0.0
+    
+    def get(self, palette: Palette, tokens: TokenSet) -> str:
+        """Get the stylesheet for palette + tokens, compiling it on a miss"""
+        key = (palette.theme, palette.packed, tokens.scale, BACKEND_VERSION)
+        qss = self.lookup(key)
+        if qss is not None:
+            return qss
+        
+        qss = self._read_disk(key)
+        from_disk = qss is not None
+        if not from_disk:
+            qss = self._compile(key, palette, tokens)
+        with self._lock:
+            if from_disk:
+                self.disk_hits += 1
+            else:
+                self.misses += 1
+            self._insert(key, qss)
+        return qss
+    
+    def warm(self, palette: Palette, tokens: TokenSet) -> bool:
+        """Compile (or read from disk) ahead of use - see LRUCache.prewarm"""
+        key = (palette.theme, palette.packed, tokens.scale, BACKEND_VERSION)
+        return self.prewarm(key, lambda: self._read_disk(key) or self._compile(key, palette, tokens))
+    
+    def clear(self):
+        """Drop in-memory entries and reset counters (disk store is kept)"""
+        super().clear()
+        self.disk_hits = 0
+    
+    def _compile(self, key: tuple, palette: Palette, tokens: TokenSet) -> str:
+        qss = FineUseStyleSheet.compile_stylesheet(palette, tokens)
+        self._write_disk(key, qss)
+        return qss
+    
+    def _disk_path(self, key: tuple) -> str:
+        theme, packed, scale, backend = key
+        digest = hashlib.sha1(
+            repr((getattr(theme, 'value', theme), packed, scale, backend)).encode('utf-8')
+        ).hexdigest()
+        return os.path.join(self.disk_dir, digest + '.qss')
+    
+    def _read_disk(self, key: tuple) -> Optional[str]:
+        if not self.disk_dir:
+            return None
+        try:
+            with open(self._disk_path(key), encoding='utf-8') as f:
+                return f.read()
+        except OSError:
+            return None
+    
+    def _write_disk(self, key: tuple, qss: str):
+        """Atomically store compiled text (silently skipped if not writable)"""
+        if not self.disk_dir:
+            return
+        path = self._disk_path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self.disk_dir, exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(qss)
+            os.replace(tmp_path, path)
+        except OSError:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
 
 
 class FineUseStyleSheet:
     """
     Fine Use QSS (Qt Style Sheets) generator
     Converts Fine Use design tokens to QSS
+    
+    Compiled stylesheets are memoized in FineUseStyleSheet.cache; set
+    FINE_USE_QSS_CACHE_DIR to also keep them on disk between runs.
     """
     
+    cache = StyleSheetCache(disk_dir=os.environ.get('FINE_USE_QSS_CACHE_DIR'))
+    
     @staticmethod
     def generate_app_stylesheet() -> str:
-        """Generate complete application stylesheet"""
-        colors = fine_use.colors
-        spacing = fine_use.spacing
-        borders = fine_use.borders
+        """Get the complete application stylesheet for the active theme and scale"""
+        return FineUseStyleSheet.cache.get(fine_use.colors, fine_use.tokens)
+    
+    @staticmethod
+    def compile_stylesheet(colors: Palette, tokens: TokenSet) -> str:
+        """Render the stylesheet template (uncached)"""
+        family = fine_use.typography.FONT_FAMILY
+        font_px = {size: weights['normal'][1] for size, weights in tokens.font_table.items()}
+        space = tokens.spacing_table
+        thin = tokens.border_width('thin')
+        button_sizes = '\n        \n        '.join(
+            f'QPushButton[buttonSize="{size}"] {{\n'
+            f"            padding: {space[pad]}px {space[pad] * 2}px;\n"
+            f"            font-size: {font_px[size]}px;\n"
+            "        }"
+            for size, pad in BUTTON_PADDING.items()
+        )
         
         return f"""
         /* Fine Use Application Styles */
         QMainWindow {{
             background-color: {colors['bg']};
             color: {colors['text']};
-            font-family: "{fine_use.typography.FONT_FAMILY}";
-            font-size: {fine_use.typography.FONT_SIZES['md']}px;
+            font-family: "{family}";
+            font-size: {font_px['md']}px;
         }}
         
         QWidget {{
             background-color: {colors['bg']};
             color: {colors['text']};
-            font-family: "{fine_use.typography.FONT_FAMILY}";
+            font-family: "{family}";
         }}
         
         /* Fine Use Button Base */
         QPushButton {{
             background-color: {colors['surface']};
             color: {colors['text']};
-            border: {borders.THIN}px solid {colors['border']};
-            padding: {spacing.MD}px {spacing.LG}px;
-            font-family: "{fine_use.typography.FONT_FAMILY}";
-            font-size: {fine_use.typography.FONT_SIZES['md']}px;
+            border: {thin}px solid {colors['border']};
+            padding: {space['md']}px {space['lg']}px;
+            font-family: "{family}";
+            font-size: {font_px['md']}px;
             font-weight: bold;
             text-transform: uppercase;
             min-height: 20px;
@@ -149,14 +298,17 @@ class FineUseStyleSheet:
             color: {colors['info']};
         }}
         
+        /* Button Sizes (FineUseButton "buttonSize" property) */
+        {button_sizes}
+        
         /* Fine Use Input Fields */
         QLineEdit {{
             background-color: {colors['surface']};
             color: {colors['text']};
-            border: {borders.THIN}px solid {colors['border']};
-            padding: {spacing.MD}px {spacing.LG}px;
-            font-family: "{fine_use.typography.FONT_FAMILY}";
-            font-size: {fine_use.typography.FONT_SIZES['md']}px;
+            border: {thin}px solid {colors['border']};
+            padding: {space['md']}px {space['lg']}px;
+            font-family: "{family}";
+            font-size: {font_px['md']}px;
             selection-background-color: {colors['accent']};
         }}
         
@@ -169,10 +321,10 @@ class FineUseStyleSheet:
         QTextEdit {{
             background-color: {colors['surface']};
             color: {colors['text']};
-            border: {borders.THIN}px solid {colors['border']};
-            padding: {spacing.MD}px;
-            font-family: "{fine_use.typography.FONT_FAMILY}";
-            font-size: {fine_use.typography.FONT_SIZES['md']}px;
+            border: {thin}px solid {colors['border']};
+            padding: {space['md']}px;
+            font-family: "{family}";
+            font-size: {font_px['md']}px;
             selection-background-color: {colors['accent']};
         }}
         
@@ -186,21 +338,21 @@ class FineUseStyleSheet:
         QLabel {{
             color: {colors['text']};
             background-color: transparent;
-            font-family: "{fine_use.typography.FONT_FAMILY}";
+            font-family: "{family}";
         }}
         
         QLabel[level="h1"] {{
-            font-size: {fine_use.typography.FONT_SIZES['4xl']}px;
+            font-size: {font_px['4xl']}px;
             font-weight: bold;
         }}
         
         QLabel[level="h2"] {{
-            font-size: {fine_use.typography.FONT_SIZES['2xl']}px;
+            font-size: {font_px['2xl']}px;
             font-weight: bold;
         }}
         
         QLabel[level="h3"] {{
-            font-size: {fine_use.typography.FONT_SIZES['xl']}px;
+            font-size: {font_px['xl']}px;
             font-weight: bold;
         }}
         
@@ -231,45 +383,51 @@ class FineUseStyleSheet:
         /* Fine Use Frames/Groups */
         QFrame {{
             background-color: {colors['surface']};
-            border: {borders.THIN}px solid {colors['border']};
-            padding: {spacing.LG}px;
+            border: {thin}px solid {colors['border']};
+            padding: {space['lg']}px;
         }}
         
         QGroupBox {{
             background-color: {colors['surface']};
-            border: {borders.THIN}px solid {colors['border']};
-            font-family: "{fine_use.typography.FONT_FAMILY}";
-            font-size: {fine_use.typography.FONT_SIZES['lg']}px;
+            border: {thin}px solid {colors['border']};
+            font-family: "{family}";
+            font-size: {font_px['lg']}px;
             font-weight: bold;
             color: {colors['text']};
-            padding: {spacing.LG}px;
-            margin-top: {spacing.MD}px;
+            padding: {space['lg']}px;
+            margin-top: {space['md']}px;
         }}
         
         QGroupBox::title {{
             subcontrol-origin: margin;
-            left: {spacing.MD}px;
-            padding: 0 {spacing.SM}px 0 {spacing.SM}px;
+            left: {space['md']}px;
+            padding: 0 {space['sm']}px 0 {space['sm']}px;
         }}
         
         /* Fine Use Tables */
-        QTableWidget {{
+        QTableView {{
             background-color: {colors['surface']};
             alternate-background-color: {colors['bg']};
             color: {colors['text']};
-            border: {borders.THIN}px solid {colors['border']};
-            font-family: "{fine_use.typography.FONT_FAMILY}";
-            font-size: {fine_use.typography.FONT_SIZES['md']}px;
+            border: {thin}px solid {colors['border']};
+            font-family: "{family}";
+            font-size: {font_px['md']}px;
             gridline-color: {colors['border']};
             selection-background-color: {colors['accent']};
             selection-color: {colors['bg']};
+            padding: 0px;
+        }}
+        
+        QHeaderView {{
+            border: none;
+            padding: 0px;
         }}
         
         QHeaderView::section {{
             background-color: {colors['border']};
             color: {colors['text']};
-            border: {borders.THIN}px solid {colors['border']};
-            padding: {spacing.MD}px;
+            border: {thin}px solid {colors['border']};
+            padding: {space['md']}px;
             font-weight: bold;
             text-transform: uppercase;
         }}
@@ -278,7 +436,7 @@ class FineUseStyleSheet:
         QScrollBar:vertical {{
             background-color: {colors['surface']};
             width: 16px;
-            border: {borders.THIN}px solid {colors['border']};
+            border: {thin}px solid {colors['border']};
         }}
         
         QScrollBar::handle:vertical {{
@@ -293,7 +451,7 @@ class FineUseStyleSheet:
         QScrollBar:horizontal {{
             background-color: {colors['surface']};
             height: 16px;
-            border: {borders.THIN}px solid {colors['border']};
+            border: {thin}px solid {colors['border']};
         }}
         
         QScrollBar::handle:horizontal {{
@@ -309,10 +467,10 @@ class FineUseStyleSheet:
         QComboBox {{
             background-color: {colors['surface']};
             color: {colors['text']};
-            border: {borders.THIN}px solid {colors['border']};
-            padding: {spacing.MD}px {spacing.LG}px;
-            font-family: "{fine_use.typography.FONT_FAMILY}";
-            font-size: {fine_use.typography.FONT_SIZES['md']}px;
+            border: {thin}px solid {colors['border']};
+            padding: {space['md']}px {space['lg']}px;
+            font-family: "{family}";
+            font-size: {font_px['md']}px;
         }}
         
         QComboBox:focus {{
@@ -324,30 +482,344 @@ class FineUseStyleSheet:
         QComboBox QAbstractItemView {{
             background-color: {colors['surface']};
             color: {colors['text']};
-            border: {borders.THIN}px solid {colors['border']};
+            border: {thin}px solid {colors['border']};
             selection-background-color: {colors['accent']};
             selection-color: {colors['bg']};
         }}
         """
 
 
+class PolishScheduler:
+    """
+    Process-wide, coalesced widget re-polish
+    
+    Changing a styling property (variant, size, level, color) only marks
+    the widget dirty; one batched unpolish/polish pass then runs on the
+    next event-loop iteration. Widgets that have never been polished are
+    skipped outright - Qt polishes them with their current properties
+    when they are first shown.
+    """
+    
+    def __init__(self, suspend_updates: bool = True):
+        self.suspend_updates = suspend_updates
+        self.requested = 0
+        self.polished = 0
+        self.flushes = 0
+        self._dirty: Dict[QWidget, None] = {}
+        self._scheduled = False
+    
+    @property
+    def saved(self) -> int:
+        """Polish passes avoided by deferring and coalescing"""
+        return self.requested - self.polished
+    
+    def mark_dirty(self, widget: QWidget):
+        """Schedule widget for re-polish (no-op until it has been polished once)"""
+        self.requested += 1
+        if not widget.testAttribute(Qt.WidgetAttribute.WA_WState_Polished):
+            return
+        self._dirty[widget] = None
+        if not self._scheduled:
+            self._scheduled = True
+            QTimer.singleShot(0, self.flush)
+    
+    def flush(self):
+        """Re-polish every dirty widget now"""
+        dirty, self._dirty = self._dirty, {}
+        self._scheduled = False
+        if not dirty:
+            return
+        self.flushes += 1
+        
+        windows = []
+        if self.suspend_updates:
+            for widget in dirty:
+                try:
+                    window = widget.window()
+                except RuntimeError:  # deleted before the flush
+                    continue
+                if window.updatesEnabled() and window not in windows:
+                    window.setUpdatesEnabled(False)
+                    windows.append(window)
+        try:
+            for widget in dirty:
+                try:
+                    style = widget.style()
+                    style.unpolish(widget)
+                    style.polish(widget)
+                except RuntimeError:
+                    continue
+                self.polished += 1
+        finally:
+            for window in windows:
+                window.setUpdatesEnabled(True)
+    
+    def reset_counters(self):
+        self.requested = self.polished = self.flushes = 0
+
+
+# Shared by every Fine Use widget
+polish_scheduler = PolishScheduler()
+
+
+def build_qpalette(colors: Palette) -> QPalette:
+    """Map Fine Use color tokens onto a QPalette (palette render mode)"""
+    role = QPalette.ColorRole
+    roles = {
+        role.Window: 'bg',
+        role.WindowText: 'text',
+        role.Base: 'surface',
+        role.AlternateBase: 'bg',
+        role.Text: 'text',
+        role.Button: 'surface',
+        role.ButtonText: 'text',
+        role.Highlight: 'accent',
+        role.HighlightedText: 'bg',
+        role.PlaceholderText: 'comment',
+        role.ToolTipBase: 'surface',
+        role.ToolTipText: 'text',
+        role.BrightText: 'error',
+        role.Link: 'info',
+        role.Light: 'border',
+        role.Midlight: 'border',
+        role.Mid: 'border',
+        role.Dark: 'border',
+        role.Shadow: 'bg'
+    }
+    palette = QPalette()
+    for qt_role, token in roles.items():
+        palette.setColor(qt_role, QColor(colors[token]))
+    disabled = QPalette.ColorGroup.Disabled
+    for qt_role in (role.WindowText, role.Text, role.ButtonText):
+        palette.setColor(disabled, qt_role, QColor(colors['comment']))
+    return palette
+
+
+class FineUseProxyStyle(QProxyStyle):
+    """
+    Paints Fine Use components directly instead of through QSS
+    
+    Square 2px borders, uppercase bold buttons colored from the shared
+    variant table, flat 16px progress bars. Colors come from fine_use at
+    paint time, so a theme switch is a palette swap plus a repaint.
+    """
+    
+    BORDER = 2
+    PROGRESS_HEIGHT = 16
+    
+    def __init__(self):
+        super().__init__('Fusion')
+    
+    def drawPrimitive(self, element, option, painter, widget=None):
+        if element == QStyle.PrimitiveElement.PE_FrameFocusRect:
+            return  # focus is part of the square border
+        if element in (QStyle.PrimitiveElement.PE_PanelLineEdit, QStyle.PrimitiveElement.PE_FrameLineEdit):
+            colors = fine_use.colors
+            focused = bool(option.state & QStyle.StateFlag.State_HasFocus)
+            if element == QStyle.PrimitiveElement.PE_PanelLineEdit:
+                painter.fillRect(option.rect, QColor(colors['surface']))
+            self._draw_border(painter, option.rect, colors['accent' if focused else 'border'])
+            return
+        super().drawPrimitive(element, option, painter, widget)
+    
+    def drawControl(self, element, option, painter, widget=None):
+        control = QStyle.ControlElement
+        if element == control.CE_PushButtonBevel:
+            bg, fg, border = self._button_colors(option, widget)
+            painter.fillRect(option.rect, QColor(bg))
+            self._draw_border(painter, option.rect, border)
+            return
+        if element == control.CE_PushButtonLabel:
+            bg, fg, border = self._button_colors(option, widget)
+            font = QFont(painter.font())
+            font.setBold(True)
+            painter.save()
+            painter.setFont(font)
+            painter.setPen(QColor(fg))
+            painter.drawText(option.rect, int(Qt.AlignmentFlag.AlignCenter), option.text.upper())
+            painter.restore()
+            return
+        if element == control.CE_ProgressBarGroove:
+            colors = fine_use.colors
+            painter.fillRect(option.rect, QColor(colors['surface']))
+            self._draw_border(painter, option.rect, colors['border'])
+            return
+        if element == control.CE_ProgressBarContents:
+            span = option.maximum - option.minimum
+            if span > 0:
+                inner = option.rect.adjusted(self.BORDER, self.BORDER, -self.BORDER, -self.BORDER)
+                filled = round(inner.width() * (option.progress - option.minimum) / span)
+                painter.fillRect(inner.x(), inner.y(), filled, inner.height(), QColor(fine_use.colors['accent']))
+            return
+        super().drawControl(element, option, painter, widget)
+    
+    def sizeFromContents(self, contents_type, option, size, widget=None):
+        if contents_type == QStyle.ContentsType.CT_PushButton:
+            size_name = self._property(widget, 'buttonSize', 'md') if widget is not None else 'md'
+            pad = get_spacing(BUTTON_PADDING.get(size_name, 'md'))
+            return QSize(size.width() + 4 * pad + 2 * self.BORDER, size.height() + 2 * pad + 2 * self.BORDER)
+        result = super().sizeFromContents(contents_type, option, size, widget)
+        if contents_type == QStyle.ContentsType.CT_ProgressBar:
+            result.setHeight(self.PROGRESS_HEIGHT)
+        return result
+    
+    def polish(self, target):
+        result = super().polish(target)
+        if isinstance(target, QLabel):
+            self._polish_label(target)
+        elif isinstance(target, FineUseFrame):
+            palette = target.palette()
+            palette.setColor(QPalette.ColorRole.Window, QColor(fine_use.colors['surface']))
+            target.setPalette(palette)
+        return result
+    
+    def _polish_label(self, label: QLabel):
+        """Apply the level font and color token that QSS selectors would set"""
+        level = self._property(label, 'level', 'body')
+        if level in ('h1', 'h2', 'h3'):
+            font = label.font()
+            font.setPixelSize(fine_use.typography.FONT_SIZES[{'h1': '4xl', 'h2': '2xl', 'h3': 'xl'}[level]])
+            font.setBold(True)
+            label.setFont(font)
+        color = self._property(label, 'color', 'text')
+        palette = label.palette()
+        palette.setColor(QPalette.ColorRole.WindowText, QColor(fine_use.colors.get(color, fine_use.colors['text'])))
+        label.setPalette(palette)
+    
+    def _button_colors(self, option, widget):
+        """(bg, fg, border) for the button's variant and state"""
+        colors = fine_use.colors
+        if not option.state & QStyle.StateFlag.State_Enabled:
+            return colors['surface'], colors['comment'], colors['border']
+        variant = self._property(widget, 'variant', 'secondary')
+        variant_colors = fine_use.get_variant_colors(variant)
+        secondary = variant_colors is fine_use.variants['secondary']
+        if option.state & QStyle.StateFlag.State_Sunken:
+            bg, fg = variant_colors.pressed_bg, variant_colors.pressed_fg
+        elif option.state & QStyle.StateFlag.State_MouseOver:
+            bg, fg = variant_colors.hover_bg, variant_colors.hover_fg
+        else:
+            bg, fg = variant_colors.bg, variant_colors.fg
+        if option.state & QStyle.StateFlag.State_HasFocus:
+            border = variant_colors.focus
+        elif secondary:
+            border = colors['accent' if option.state & QStyle.StateFlag.State_MouseOver else 'border']
+        else:
+            border = variant_colors.hover_fg
+        return bg, fg, border
+    
+    def _draw_border(self, painter, rect, color: str):
+        """Square border drawn inside rect"""
+        width = self.BORDER
+        pen = QPen(QColor(color), width)
+        pen.setJoinStyle(Qt.PenJoinStyle.MiterJoin)
+        painter.save()
+        painter.setPen(pen)
+        painter.setBrush(Qt.BrushStyle.NoBrush)
+        painter.drawRect(rect.adjusted(width // 2, width // 2, -(width + 1) // 2, -(width + 1) // 2))
+        painter.restore()
+    
+    @staticmethod
+    def _property(widget, name: str, default: str) -> str:
+        value = widget.property(name) if widget is not None else None
+        return value or default
+
+
+class ThemePrewarmer:
+    """
+    Compiles stylesheets and variant tables for the themes not in use
+    on a worker thread
+    
+    FineUseApp starts one once the event loop is idle after startup, so
+    a later theme switch finds its stylesheet in the cache and only pays
+    for Qt's parse. Entries go into the bounded StyleSheetCache LRU;
+    its hit_rate shows how many switches were served that way.
+    """
+    
+    def __init__(self, cache: Optional[StyleSheetCache] = None, palettes: Optional[Iterable[Palette]] = None):
+        self.cache = cache or FineUseStyleSheet.cache
+        self.palettes = palettes
+        self.compiled = 0
+        self.elapsed = 0.0
+        self._thread: Optional[threading.Thread] = None
+    
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+    
+    def start(self, scale: Optional[float] = None):
+        """Warm every palette except the active one at the active (or given) scale"""
+        if self.running:
+            return
+        scale = fine_use.scale if scale is None else scale
+        active = fine_use.colors
+        palettes = [
+            palette for palette in (self.palettes or THEME_PALETTES.values())
+            if palette != active
+        ]
+        self._thread = threading.Thread(
+            target=self._run, args=(palettes, scale), name="fine-use-prewarm", daemon=True
+        )
+        self._thread.start()
+    
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until warming is done; returns False on timeout"""
+        if self._thread is not None:
+            self._thread.join(timeout)
+        return not self.running
+    
+    def _run(self, palettes: List[Palette], scale: float):
+        start = time.perf_counter()
+        for palette in palettes:
+            get_variant_table(palette)
+            if self.cache.warm(palette, get_token_set(palette, scale)):
+                self.compiled += 1
+        self.elapsed = time.perf_counter() - start
+
+
+# Rendering modes for FineUseApp: app-wide QSS, or QPalette + FineUseProxyStyle
+RENDER_MODES = ('qss', 'palette')
+
+
 class FineUseApp(QApplication):
     """
     Fine Use PyQt Application
     Sets up the application with Fine Use styling
+    
+    render_mode "qss" (default) styles widgets with FineUseStyleSheet;
+    "palette" uses a QPalette and FineUseProxyStyle instead, which makes
+    startup and theme switches much cheaper on large widget trees. The
+    default can also be set with FINE_USE_RENDER_MODE.
+    
+    With prewarm (default), stylesheets for the other themes are compiled
+    on a worker thread once the event loop first goes idle.
     """
     
-    def __init__(self, theme: str = "github-dark"):
+    def __init__(self, theme: str = "github-dark", render_mode: Optional[str] = None, prewarm: bool = True):
         super().__init__(sys.argv)
         
+        render_mode = render_mode or os.environ.get('FINE_USE_RENDER_MODE', 'qss')
+        if render_mode not in RENDER_MODES:
+            raise ValueError(f"Unknown render_mode {render_mode!r}, expected one of {RENDER_MODES}")
+        self.render_mode = render_mode
+        
         # Set Fine Use theme
         if hasattr(fine_use, 'set_theme'):
             from fine_use_core import FineUseTheme
             theme_enum = getattr(FineUseTheme, theme.upper().replace('-', '_'))
             fine_use.set_theme(theme_enum)
         
-        # Apply Fine Use stylesheet
-        self.setStyleSheet(FineUseStyleSheet.generate_app_stylesheet())
+        # Apply Fine Use styling and re-apply it on theme switches
+        self._stylesheet = None
+        if render_mode == 'palette':
+            self.setStyle(FineUseProxyStyle())
+            self.setPalette(build_qpalette(fine_use.colors))
+        else:
+            self._apply_stylesheet()
+        fine_use.subscribe(self._on_theme_changed)
+        self.prewarmer = ThemePrewarmer()
+        if prewarm:
+            QTimer.singleShot(0, self.prewarmer.start)
         
         # Set application properties
         self.setApplicationName("Fine Use Application")
@@ -357,6 +829,24 @@ class FineUseApp(QApplication):
         font = QFont(fine_use.typography.FONT_FAMILY)
         font.setPixelSize(fine_use.typography.FONT_SIZES['md'])
         self.setFont(font)
+    
+    def _apply_stylesheet(self):
+        """Apply the cached stylesheet, skipping Qt's re-parse if it is unchanged"""
+        qss = FineUseStyleSheet.generate_app_stylesheet()
+        if qss is not self._stylesheet:
+            self._stylesheet = qss
+            self.setStyleSheet(qss)
+    
+    def _on_theme_changed(self, changes):
+        """Swap in the stylesheet (or palette) for the new theme"""
+        if self.render_mode == 'qss':
+            self._apply_stylesheet()
+            return
+        self.setPalette(build_qpalette(fine_use.colors))
+        # Labels and frames hold token colors in their own palettes
+        for widget in self.allWidgets():
+            if isinstance(widget, (FineUseLabel, FineUseFrame)):
+                polish_scheduler.mark_dirty(widget)
 
 
 class FineUseWindow(QMainWindow):
@@ -386,8 +876,12 @@ class FineUseWindow(QMainWindow):
 class FineUseButton(QPushButton):
     """
     Fine Use styled button with exact web implementation
+    
+    Sizes: sm, md, lg, xl (styled via QPushButton[buttonSize="..."] selectors)
     """
     
+    SIZES = ('sm', 'md', 'lg', 'xl')
+    
     def __init__(
         self,
         text: str = "",
@@ -397,36 +891,40 @@ class FineUseButton(QPushButton):
     ):
         super().__init__(text.upper(), parent)
         
-        # Set variant property for QSS styling
+        # Variant and size are matched by selectors in the app stylesheet -
+        # no per-button stylesheet to parse and cascade
+        # (QWidget already has a "size" property - a QSize - so the size name
+        # needs a name of its own)
         self.setProperty("variant", variant)
+        size = size if size in self.SIZES else 'md'
+        self.setProperty("buttonSize", size)
         
-        # Set size-specific properties
-        self._apply_size_styling(size)
+        # Set size-specific font (padding comes from the size selectors)
+        self._apply_size_font(size)
         
-        # Ensure styling is applied
-        self.style().unpolish(self)
-        self.style().polish(self)
+        # Styled when first shown (or on the next flush if already polished)
+        polish_scheduler.mark_dirty(self)
     
-    def _apply_size_styling(self, size: str):
-        """Apply size-specific styling"""
-        size_map = {
-            'sm': ('sm', 'xs'),
-            'md': ('md', 'md'),
-            'lg': ('lg', 'lg'),
-            'xl': ('xl', 'xl')
-        }
-        
-        font_size, padding_size = size_map.get(size, ('md', 'md'))
-        
-        # Set font size
+    def set_variant(self, variant: str):
+        """Change variant - restyled on the next polish flush"""
+        if self.property("variant") != variant:
+            self.setProperty("variant", variant)
+            polish_scheduler.mark_dirty(self)
+    
+    def set_size(self, size: str):
+        """Change size - restyled on the next polish flush"""
+        size = size if size in self.SIZES else 'md'
+        if self.property("buttonSize") != size:
+            self.setProperty("buttonSize", size)
+            self._apply_size_font(size)
+            polish_scheduler.mark_dirty(self)
+    
+    def _apply_size_font(self, size: str):
+        """Apply size-specific font"""
         font = self.font()
-        font.setPixelSize(fine_use.typography.FONT_SIZES[font_size])
+        font.setPixelSize(fine_use.typography.FONT_SIZES[size])
         font.setWeight(QFont.Weight.Bold if hasattr(QFont.Weight, 'Bold') else QFont.Bold)
         self.setFont(font)
-        
-        # Set padding
-        padding = get_spacing(padding_size)
-        self.setStyleSheet(f"padding: {padding}px {padding * 2}px;")
 
 
 class FineUseLabel(QLabel):
@@ -451,9 +949,22 @@ class FineUseLabel(QLabel):
         if level.startswith('h'):
             self.setText(text.upper())
         
-        # Ensure styling is applied
-        self.style().unpolish(self)
-        self.style().polish(self)
+        # Styled when first shown (or on the next flush if already polished)
+        polish_scheduler.mark_dirty(self)
+    
+    def set_level(self, level: str):
+        """Change typography level - restyled on the next polish flush"""
+        if self.property("level") != level:
+            self.setProperty("level", level)
+            if level.startswith('h'):
+                self.setText(self.text().upper())
+            polish_scheduler.mark_dirty(self)
+    
+    def set_color(self, color: str):
+        """Change text color token - restyled on the next polish flush"""
+        if self.property("color") != color:
+            self.setProperty("color", color)
+            polish_scheduler.mark_dirty(self)
 
 
 class FineUseFrame(QFrame):
@@ -497,11 +1008,286 @@ class FineUseLineEdit(QLineEdit):
         self.setFont(font)
 
 
+# Status words -> color token (matches DataTable.jsx getStatusClass)
+STATUS_TOKENS = {
+    **dict.fromkeys(('online', 'operational', 'success', 'completed'), 'success'),
+    **dict.fromkeys(('warning', 'degraded', 'pending'), 'warning'),
+    **dict.fromkeys(('error', 'offline', 'failed', 'critical'), 'error')
+}
+
+
+_DISPLAY_ROLE = int(Qt.ItemDataRole.DisplayRole)
+_TOKEN_ROLE = int(Qt.ItemDataRole.UserRole) + 1
+
+
+class FineUseTableModel(QAbstractTableModel):
+    """
+    Columnar table model - one sequence per column, no per-cell objects
+    
+    Columns can be lists, array.array or NumPy arrays; they are referenced,
+    not copied, so opening 1,000,000 rows costs nothing until rows are
+    painted. Sorting keeps a row permutation instead of reordering data.
+    """
+    
+    # Color token for a cell ('success', 'warning', 'error', 'info' or None)
+    TokenRole = _TOKEN_ROLE
+    
+    def __init__(
+        self,
+        columns: Dict[str, Sequence],
+        status_column: Optional[str] = 'status',
+        color_coded_columns: Iterable[str] = (),
+        thresholds: Sequence[float] = (70, 85),
+        parent: Optional[QObject] = None
+    ):
+        super().__init__(parent)
+        self.status_column = status_column
+        self.color_coded_columns = frozenset(color_coded_columns)
+        self.thresholds = tuple(thresholds)
+        self._status_cache: Dict[Any, str] = {}
+        self._set_columns(columns)
+    
+    def set_columns(self, columns: Dict[str, Sequence]):
+        """Replace all data (views keep their scroll position if possible)"""
+        self.beginResetModel()
+        self._set_columns(columns)
+        self.endResetModel()
+    
+    def _set_columns(self, columns: Dict[str, Sequence]):
+        self.names = list(columns)
+        self.columns = [columns[name] for name in self.names]
+        self._rows = len(self.columns[0]) if self.columns else 0
+        if any(len(column) != self._rows for column in self.columns):
+            raise ValueError("All FineUseTableModel columns must have the same length")
+        self._order: Optional[array] = None
+        self._kinds = [
+            'status' if name == self.status_column
+            else 'metric' if name in self.color_coded_columns
+            else None
+            for name in self.names
+        ]
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._rows
+    
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.columns)
+    
+    def value(self, row: int, column: int) -> Any:
+        """Raw value at a view row (after sorting)"""
+        if self._order is not None:
+            row = self._order[row]
+        return self.columns[column][row]
+    
+    def data(self, index: QModelIndex, role=_DISPLAY_ROLE):
+        # Called for every visible cell and role on each paint - keep it flat
+        if role == _DISPLAY_ROLE:
+            return self.text(index.row(), index.column())
+        if role == _TOKEN_ROLE:
+            return self.token(index.row(), index.column())
+        return None
+    
+    def text(self, row: int, column: int) -> str:
+        """Display text for a view cell"""
+        value = self.value(row, column)
+        if self._kinds[column] == 'status':
+            return str(value).upper()
+        return str(value)
+    
+    def token(self, row: int, column: int) -> Optional[str]:
+        """Color token for a view cell, None for plain columns"""
+        kind = self._kinds[column]
+        if kind is None:
+            return None
+        value = self.value(row, column)
+        return self.status_token(value) if kind == 'status' else self.metric_token(value)
+    
+    def token_columns(self) -> List[int]:
+        """Columns painted by FineUseStatusDelegate"""
+        return [column for column, kind in enumerate(self._kinds) if kind is not None]
+    
+    def headerData(self, section: int, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.names[section].upper().replace('_', ' ')
+        return None
+    
+    def status_token(self, value: Any) -> str:
+        """Color token for a status value (memoized per distinct value)"""
+        token = self._status_cache.get(value)
+        if token is None:
+            token = self._status_cache[value] = STATUS_TOKENS.get(str(value).lower(), 'info')
+        return token
+    
+    def metric_token(self, value: Any) -> Optional[str]:
+        """Color token for a metric value against the warning/error thresholds"""
+        try:
+            number = float(value)
+        except (TypeError, ValueError):
+            return None
+        if number >= self.thresholds[1]:
+            return 'error'
+        if number >= self.thresholds[0]:
+            return 'warning'
+        return 'success'
+    
+    def sort(self, column: int, order=Qt.SortOrder.AscendingOrder):
+        """Sort rows by column via a permutation (data is never moved)"""
+        if column < 0 or column >= len(self.columns):
+            return
+        # Work out the permutation first so views never see a layout change
+        # that does not finish
+        order_rows = self._sort_order(self.columns[column], order == Qt.SortOrder.DescendingOrder)
+        self.layoutAboutToBeChanged.emit()
+        self._order = order_rows
+        self.layoutChanged.emit()
+    
+    def _sort_order(self, values: Sequence, reverse: bool) -> array:
+        """Stable row permutation sorting values (numbers by value, anything else as lowercase text)"""
+        np = sys.modules.get('numpy')
+        if np is not None and isinstance(values, np.ndarray) and values.dtype.kind in 'biuf':
+            # Sort a reversed copy for descending order so ties keep their row order
+            if reverse:
+                rows = (self._rows - 1 - np.argsort(values[::-1], kind='stable'))[::-1]
+            else:
+                rows = np.argsort(values, kind='stable')
+            order_rows = array('q')
+            order_rows.frombytes(np.ascontiguousarray(rows, dtype=np.int64).tobytes())
+            return order_rows
+        if all(isinstance(values[i], numbers.Real) for i in range(min(self._rows, 16))):
+            try:
+                return array('q', sorted(range(self._rows), key=values.__getitem__, reverse=reverse))
+            except TypeError:
+                # Numbers at the top, text further down
+                pass
+        text = [str(value).lower() for value in values]
+        return array('q', sorted(range(self._rows), key=text.__getitem__, reverse=reverse))
+
+
+class FineUseStatusDelegate(QStyledItemDelegate):
+    """Paints status and metric cells in their token color (theme read at paint time)"""
+    
+    def __init__(self, model: FineUseTableModel, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self.table_model = model
+    
+    def paint(self, painter, option, index):
+        row, column = index.row(), index.column()
+        token = self.table_model.token(row, column)
+        if token is None:
+            super().paint(painter, option, index)
+            return
+        colors = fine_use.colors
+        painter.save()
+        if option.state & QStyle.StateFlag.State_Selected:
+            painter.fillRect(option.rect, QColor(colors['accent']))
+            painter.setPen(QColor(colors['bg']))
+        else:
+            painter.setPen(QColor(colors[token]))
+        font = QFont(option.font)
+        font.setBold(True)
+        painter.setFont(font)
+        text_rect = option.rect.adjusted(get_spacing('sm'), 0, -get_spacing('sm'), 0)
+        painter.drawText(
+            text_rect,
+            int(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter),
+            self.table_model.text(row, column)
+        )
+        painter.restore()
+
+
+class FineUseDataTable(QTableView):
+    """
+    Fine Use data table - virtualized QTableView over FineUseTableModel
+    
+    Only visible rows are ever formatted or painted; rows have a fixed
+    height so scrolling a 1,000,000-row table never measures rows.
+    
+        table = FineUseDataTable({
+            'service_id': ids, 'status': statuses, 'cpu': cpu_percent
+        }, color_coded_columns=('cpu',))
+    """
+    
+    def __init__(
+        self,
+        columns: Dict[str, Sequence],
+        status_column: Optional[str] = 'status',
+        color_coded_columns: Iterable[str] = (),
+        sortable: bool = True,
+        parent: Optional[QWidget] = None
+    ):
+        super().__init__(parent)
+        self.table_model = FineUseTableModel(columns, status_column, color_coded_columns, parent=self)
+        self.setModel(self.table_model)
+        self.status_delegate = FineUseStatusDelegate(self.table_model, self)
+        self._apply_delegates()
+        
+        # Fixed row heights - no per-row size hints for huge tables
+        row_height = fine_use.typography.FONT_SIZES['md'] + 2 * get_spacing('sm')
+        vertical = self.verticalHeader()
+        vertical.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        vertical.setDefaultSectionSize(row_height)
+        vertical.hide()
+        horizontal = self.horizontalHeader()
+        horizontal.setStretchLastSection(True)
+        horizontal.setHighlightSections(False)
+        horizontal.setResizeContentsPrecision(100)  # size columns from a sample, not every row
+        
+        self.setAlternatingRowColors(True)
+        self.setWordWrap(False)
+        self.setShowGrid(True)
+        self.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        
+        if sortable:
+            # No initial sort indicator, so enabling sorting does not sort
+            horizontal.setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
+            self.setSortingEnabled(True)
+        self.resizeColumnsToContents()
+    
+    def set_columns(self, columns: Dict[str, Sequence]):
+        """Replace the table data"""
+        for column in self.table_model.token_columns():
+            self.setItemDelegateForColumn(column, None)
+        self.table_model.set_columns(columns)
+        self._apply_delegates()
+        self.resizeColumnsToContents()
+    
+    def _apply_delegates(self):
+        """Status/metric columns get the color delegate; plain columns stay in C++"""
+        for column in self.table_model.token_columns():
+            self.setItemDelegateForColumn(column, self.status_delegate)
+
+
+class _GridLayout(QGridLayout):
+    """QGridLayout that counts geometry passes (FineUseButtonGrid.relayouts)"""
+    
+    def __init__(self, parent: QWidget):
+        super().__init__(parent)
+        self.relayouts = 0
+    
+    def setGeometry(self, rect):
+        self.relayouts += 1
+        super().setGeometry(rect)
+
+
 class FineUseButtonGrid(QWidget):
     """
     Fine Use button grid with perfect alignment
+    
+    Layouts: the 2x2, 1x4, halves and thirds presets, or any rows x cols
+    grid via set_layout(). add_buttons() builds many buttons with layout
+    activation and repaints suspended; set_layout() and set_buttons()
+    reuse the existing buttons instead of recreating them.
     """
     
+    # Preset -> (rows, cols); None means the grid grows along that axis
+    LAYOUTS = {
+        '2x2': (None, 2),
+        '1x4': (None, 1),
+        'halves': (1, None),
+        'thirds': (1, None)
+    }
+    
     def __init__(
         self,
         layout: str = "2x2",
@@ -514,16 +1300,17 @@ class FineUseButtonGrid(QWidget):
             gap = get_spacing('md')
         
         # Create grid layout
-        self.grid_layout = QGridLayout(self)
+        self.grid_layout = _GridLayout(self)
         self.grid_layout.setSpacing(gap)
         
         # Configure layout based on type
         self.layout_type = layout
+        self.rows, self.cols = self.LAYOUTS.get(layout, (None, 2))
         self.buttons = []
+        self._stretched = (set(), set())
         
         # Set uniform sizing
-        self.grid_layout.setRowStretch(0, 1)
-        self.grid_layout.setColumnStretch(0, 1)
+        self._stretch(0, 0)
     
     def add_button(
         self,
@@ -532,36 +1319,159 @@ class FineUseButtonGrid(QWidget):
         callback: Optional[Callable] = None
     ) -> FineUseButton:
         """Add button to grid with automatic positioning"""
-        button = FineUseButton(text, variant, parent=self)
-        
-        if callback:
-            button.clicked.connect(callback)
-        
-        # Calculate position based on layout
-        if self.layout_type == "2x2":
-            row = len(self.buttons) // 2
-            col = len(self.buttons) % 2
-        elif self.layout_type == "1x4":
-            row = len(self.buttons)
-            col = 0
-        elif self.layout_type == "halves":
-            row = 0
-            col = len(self.buttons)
-        elif self.layout_type == "thirds":
-            row = 0
-            col = len(self.buttons)
-        else:
-            row = len(self.buttons) // 2
-            col = len(self.buttons) % 2
-        
+        button = self._create_button(text, variant, callback)
+        row, col = self._position(len(self.buttons))
         self.grid_layout.addWidget(button, row, col)
+        self._stretch(row, col)
+        self.buttons.append(button)
+        return button
+    
+    def add_buttons(self, specs: Iterable) -> List[FineUseButton]:
+        """
+        Add many buttons in one layout pass
         
-        # Ensure equal sizing
-        self.grid_layout.setRowStretch(row, 1)
-        self.grid_layout.setColumnStretch(col, 1)
+        Each spec is the button text or a (text, variant, callback) tuple
+        with variant and callback optional.
+        """
+        added = []
+        with self._suspended(adding=True):
+            for spec in specs:
+                text, variant, callback = self._parse_spec(spec)
+                button = self._create_button(text, variant, callback)
+                row, col = self._position(len(self.buttons))
+                self.grid_layout.addWidget(button, row, col)
+                self._stretch(row, col)
+                self.buttons.append(button)
+                added.append(button)
+        return added
+    
+    def set_layout(self, rows: Optional[int], cols: Optional[int]):
+        """
+        Re-lay out the existing buttons as rows x cols (either may be None
+        to grow along that axis) without recreating them
+        """
+        if rows is None and cols is None:
+            raise ValueError("set_layout needs rows, cols or both")
+        if rows and cols and rows * cols < len(self.buttons):
+            raise ValueError(f"{rows}x{cols} grid cannot hold {len(self.buttons)} buttons")
+        self.rows, self.cols = rows, cols
+        self.layout_type = f"{rows or '*'}x{cols or '*'}"
+        with self._suspended():
+            for button in self.buttons:
+                self.grid_layout.removeWidget(button)
+            self._reset_stretch()
+            for index, button in enumerate(self.buttons):
+                row, col = self._position(index)
+                self.grid_layout.addWidget(button, row, col)
+                self._stretch(row, col)
+    
+    def set_buttons(self, specs: Iterable) -> List[FineUseButton]:
+        """
+        Replace the grid contents, reusing existing buttons: their text,
+        variant and callback are updated, missing ones are created and
+        surplus ones deleted
+        """
+        specs = [self._parse_spec(spec) for spec in specs]
+        with self._suspended(adding=len(specs) > len(self.buttons)):
+            for button in self.buttons[len(specs):]:
+                self.grid_layout.removeWidget(button)
+                button.deleteLater()
+            del self.buttons[len(specs):]
+            
+            for button, (text, variant, callback) in zip(self.buttons, specs):
+                button.setText(text.upper())
+                button.set_variant(variant)
+                self._connect(button, callback)
+            
+            for text, variant, callback in specs[len(self.buttons):]:
+                button = self._create_button(text, variant, callback)
+                row, col = self._position(len(self.buttons))
+                self.grid_layout.addWidget(button, row, col)
+                self._stretch(row, col)
+                self.buttons.append(button)
+        return list(self.buttons)
+    
+    @property
+    def relayouts(self) -> int:
+        """Geometry passes the grid layout has run"""
+        return self.grid_layout.relayouts
+    
+    @contextlib.contextmanager
+    def _suspended(self, adding: bool = False):
+        """
+        Defer layout activation and repaints until the block ends
         
-        self.buttons.append(button)
+        When adding buttons to a visible grid the grid is hidden for the
+        duration: children added to a visible parent are shown one by one
+        (a show, polish and parent relayout each), while children of a
+        hidden parent are shown together with it in a single pass.
+        """
+        updates = self.updatesEnabled()
+        visible = adding and self.isVisible()
+        self.setUpdatesEnabled(False)
+        self.grid_layout.setEnabled(False)
+        if visible:
+            self.hide()
+        try:
+            yield
+        finally:
+            self.grid_layout.setEnabled(True)
+            self.grid_layout.invalidate()
+            if visible:
+                self.show()
+            self.setUpdatesEnabled(updates)
+    
+    def _position(self, index: int) -> Tuple[int, int]:
+        """(row, col) of the index-th button"""
+        if self.cols:
+            return index // self.cols, index % self.cols
+        if self.rows == 1:
+            return 0, index
+        return index % self.rows, index // self.rows
+    
+    def _stretch(self, row: int, col: int):
+        """Give new rows/columns equal stretch (each only once)"""
+        rows, cols = self._stretched
+        if row not in rows:
+            rows.add(row)
+            self.grid_layout.setRowStretch(row, 1)
+        if col not in cols:
+            cols.add(col)
+            self.grid_layout.setColumnStretch(col, 1)
+    
+    def _reset_stretch(self):
+        rows, cols = self._stretched
+        for row in rows:
+            self.grid_layout.setRowStretch(row, 0)
+        for col in cols:
+            self.grid_layout.setColumnStretch(col, 0)
+        self._stretched = (set(), set())
+    
+    def _create_button(self, text: str, variant: str, callback: Optional[Callable]) -> FineUseButton:
+        button = FineUseButton(text, variant, parent=self)
+        button._grid_callback = None
+        self._connect(button, callback)
         return button
+    
+    @staticmethod
+    def _connect(button: FineUseButton, callback: Optional[Callable]):
+        """Point the button's clicked signal at callback (replacing the previous one)"""
+        if button._grid_callback is callback:
+            return
+        if button._grid_callback is not None:
+            button.clicked.disconnect(button._grid_callback)
+        if callback is not None:
+            button.clicked.connect(callback)
+        button._grid_callback = callback
+    
+    @staticmethod
+    def _parse_spec(spec) -> Tuple[str, str, Optional[Callable]]:
+        if isinstance(spec, str):
+            return spec, 'secondary', None
+        spec = tuple(spec)
+        variant = spec[1] if len(spec) > 1 else 'secondary'
+        callback = spec[2] if len(spec) > 2 else None
+        return spec[0], variant, callback
 
 
 # Example application
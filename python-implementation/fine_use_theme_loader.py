@@ -0,0 +1,286 @@
+"""
+Fine Use Design System - Theme File Loader
+==========================================
+
+Loads palettes straight from the web theme sources so every backend
+shares one source of truth:
+
+- themes/*.css                  - CSS custom properties (--fine-use-*)
+- themes/universal-config.json  - industry themes (financial, healthcare, ...)
+
+Parsing happens once; the result is written to a compact binary cache
+keyed by each source file's mtime/size and SHA-1. Later starts load the
+palettes from the cache without touching the CSS parser.
+
+Usage:
+    from fine_use_theme_loader import load_themes
+    from fine_use_core import fine_use
+
+    themes = load_themes()
+    fine_use.set_palette(themes['financial'].palette)
+"""
+
+import hashlib
+import json
+import os
+import re
+import struct
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from fine_use_core import FineUseTheme, Palette, THEME_PALETTES, TOKEN_NAMES
+
+
+# Default locations - overridable via environment
+DEFAULT_THEMES_DIR = os.environ.get(
+    'FINE_USE_THEMES_DIR',
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'themes')
+)
+DEFAULT_CACHE_PATH = os.path.join(
+    os.environ.get('XDG_CACHE_HOME', os.path.join(os.path.expanduser('~'), '.cache')),
+    'fine-use',
+    'themes.bin'
+)
+
+UNIVERSAL_CONFIG = 'universal-config.json'
+
+# Industry CSS variables -> Fine Use tokens
+INDUSTRY_CSS_TOKENS = {
+    'bg': 'background-color',
+    'surface': 'surface-color',
+    'border': 'border-color',
+    'text': 'text-primary',
+    'comment': 'text-secondary',
+    'success': 'success-color',
+    'warning': 'warning-color',
+    'error': 'error-color',
+    'info': 'info-color',
+    'accent': 'primary-color',
+    'orange': 'accent-color'
+}
+
+# universal-config.json industry keys -> Fine Use tokens
+INDUSTRY_JSON_TOKENS = {
+    'bg': 'backgroundColor',
+    'surface': 'surfaceColor',
+    'text': 'textColor',
+    'accent': 'primaryColor',
+    'orange': 'accentColor'
+}
+
+_CSS_VARIABLE = re.compile(r'--([\w-]+)\s*:\s*(#[0-9a-fA-F]{6})\b')
+_CSS_TITLE = re.compile(r'Fine Use Design System(?: v[\d.]+)? - (.+?) Theme')
+
+# Binary cache layout (little-endian):
+#   header  : magic, source count
+#   sources : name, mtime_ns, size, sha1           (one per source file)
+#   themes  : theme count, then key, name, 11 x 0xRRGGBB per theme
+_CACHE_MAGIC = b'FUTHEME1'
+_HEADER = struct.Struct('<8sI')
+_STRING_LEN = struct.Struct('<H')
+_SOURCE_STAT = struct.Struct('<qq20s')
+_COUNT = struct.Struct('<I')
+_PACKED_TOKENS = struct.Struct('<%dI' % len(TOKEN_NAMES))
+
+
+class ThemeEntry(NamedTuple):
+    """A loaded theme: registry key, display name and palette"""
+    key: str
+    name: str
+    palette: Palette
+
+
+class _SourceStat(NamedTuple):
+    name: str
+    mtime_ns: int
+    size: int
+    sha1: bytes
+
+
+def load_themes(
+    themes_dir: Optional[str] = None,
+    cache_path: Optional[str] = DEFAULT_CACHE_PATH
+) -> Dict[str, ThemeEntry]:
+    """
+    Load every theme under themes_dir, using the binary cache when valid
+    Pass cache_path=None to always parse the sources; if themes_dir does
+    not exist the built-in FineUseColors palettes are returned
+    """
+    themes_dir = themes_dir or DEFAULT_THEMES_DIR
+    if not os.path.isdir(themes_dir):
+        # Theme sources not shipped - fall back to the built-in palettes
+        return {
+            theme.value: ThemeEntry(theme.value, theme.value.replace('-', ' ').title(), palette)
+            for theme, palette in THEME_PALETTES.items()
+        }
+    sources = _source_files(themes_dir)
+
+    if cache_path:
+        cached = _read_cache(cache_path, themes_dir, sources)
+        if cached is not None:
+            return cached
+
+    themes = parse_themes(themes_dir, sources)
+
+    if cache_path:
+        stats = [_stat_source(themes_dir, name, with_hash=True) for name in sources]
+        _write_cache(cache_path, stats, themes)
+    return themes
+
+
+def parse_themes(themes_dir: str, sources: Optional[List[str]] = None) -> Dict[str, ThemeEntry]:
+    """Parse CSS themes and universal-config.json without any caching"""
+    sources = _source_files(themes_dir) if sources is None else sources
+    industries = {}
+    if UNIVERSAL_CONFIG in sources:
+        with open(os.path.join(themes_dir, UNIVERSAL_CONFIG), encoding='utf-8') as f:
+            industries = json.load(f).get('themeConfig', {}).get('industries', {})
+
+    themes = {}
+    for source in sources:
+        if not source.endswith('.css'):
+            continue
+        key = source[:-len('.css')]
+        with open(os.path.join(themes_dir, source), encoding='utf-8') as f:
+            css = f.read()
+        variables = parse_css_variables(css)
+
+        if all('fine-use-' + token in variables for token in TOKEN_NAMES):
+            colors = {token: variables['fine-use-' + token] for token in TOKEN_NAMES}
+            title = _CSS_TITLE.search(css)
+            name = title.group(1) if title else key.replace('-', ' ').title()
+        elif all(var in variables for var in INDUSTRY_CSS_TOKENS.values()):
+            colors = {token: variables[var] for token, var in INDUSTRY_CSS_TOKENS.items()}
+            config = industries.get(key, {})
+            colors.update({
+                token: config[field].lower()
+                for token, field in INDUSTRY_JSON_TOKENS.items() if field in config
+            })
+            name = config.get('name', key.replace('-', ' ').title())
+        else:
+            continue
+
+        themes[key] = ThemeEntry(key, name, Palette(_theme_id(key), colors))
+
+    return themes
+
+
+def parse_css_variables(css: str) -> Dict[str, str]:
+    """Extract hex-valued CSS custom properties (first definition wins)"""
+    variables = {}
+    for name, value in _CSS_VARIABLE.findall(css):
+        variables.setdefault(name, value.lower())
+    return variables
+
+
+def _theme_id(key: str):
+    """Use the FineUseTheme member for built-in themes, the key otherwise"""
+    try:
+        return FineUseTheme(key)
+    except ValueError:
+        return key
+
+
+def _source_files(themes_dir: str) -> List[str]:
+    """Sorted theme source file names"""
+    return sorted(
+        name for name in os.listdir(themes_dir)
+        if name.endswith('.css') or name == UNIVERSAL_CONFIG
+    )
+
+
+def _stat_source(themes_dir: str, name: str, with_hash: bool) -> _SourceStat:
+    path = os.path.join(themes_dir, name)
+    st = os.stat(path)
+    sha1 = b''
+    if with_hash:
+        with open(path, 'rb') as f:
+            sha1 = hashlib.sha1(f.read()).digest()
+    return _SourceStat(name, st.st_mtime_ns, st.st_size, sha1)
+
+
+def _read_cache(
+    cache_path: str,
+    themes_dir: str,
+    sources: List[str]
+) -> Optional[Dict[str, ThemeEntry]]:
+    """Return cached themes if every source is unchanged, else None"""
+    try:
+        with open(cache_path, 'rb') as f:
+            data = f.read()
+        magic, source_count = _HEADER.unpack_from(data, 0)
+        if magic != _CACHE_MAGIC or source_count != len(sources):
+            return None
+
+        offset = _HEADER.size
+        stale = False
+        for expected in sources:
+            name, offset = _unpack_string(data, offset)
+            mtime_ns, size, sha1 = _SOURCE_STAT.unpack_from(data, offset)
+            offset += _SOURCE_STAT.size
+            if name != expected:
+                return None
+            current = _stat_source(themes_dir, name, with_hash=False)
+            if (current.mtime_ns, current.size) != (mtime_ns, size):
+                # Touched but possibly unchanged - fall back to the content hash
+                if _stat_source(themes_dir, name, with_hash=True).sha1 != sha1:
+                    return None
+                stale = True
+
+        (theme_count,) = _COUNT.unpack_from(data, offset)
+        offset += _COUNT.size
+        themes = {}
+        for _ in range(theme_count):
+            key, offset = _unpack_string(data, offset)
+            name, offset = _unpack_string(data, offset)
+            packed = _PACKED_TOKENS.unpack_from(data, offset)
+            offset += _PACKED_TOKENS.size
+            themes[key] = ThemeEntry(key, name, Palette.from_packed(_theme_id(key), packed))
+    except (OSError, struct.error, UnicodeDecodeError):
+        return None
+
+    if stale:
+        stats = [_stat_source(themes_dir, name, with_hash=True) for name in sources]
+        _write_cache(cache_path, stats, themes)
+    return themes
+
+
+def _write_cache(cache_path: str, stats: List[_SourceStat], themes: Dict[str, ThemeEntry]):
+    """Atomically write the binary cache (silently skipped if not writable)"""
+    parts = [_HEADER.pack(_CACHE_MAGIC, len(stats))]
+    for stat in stats:
+        parts.append(_pack_string(stat.name))
+        parts.append(_SOURCE_STAT.pack(stat.mtime_ns, stat.size, stat.sha1))
+    parts.append(_COUNT.pack(len(themes)))
+    for entry in themes.values():
+        parts.append(_pack_string(entry.key))
+        parts.append(_pack_string(entry.name))
+        parts.append(_PACKED_TOKENS.pack(*entry.palette.packed))
+
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(tmp_path, 'wb') as f:
+            f.write(b''.join(parts))
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def _pack_string(value: str) -> bytes:
+    encoded = value.encode('utf-8')
+    return _STRING_LEN.pack(len(encoded)) + encoded
+
+
+def _unpack_string(data: bytes, offset: int) -> Tuple[str, int]:
+    (length,) = _STRING_LEN.unpack_from(data, offset)
+    start = offset + _STRING_LEN.size
+    return data[start:start + length].decode('utf-8'), start + length
+
+
+if __name__ == "__main__":
+    # Example usage: list every theme found in the web theme sources
+    for entry in load_themes().values():
+        print(f"{entry.key:<14} {entry.name:<26} accent={entry.palette['accent']}")
@@ -14,8 +14,33 @@ Usage:
 
 import tkinter as tk
 from tkinter import ttk, font
-from typing import Optional, Callable, Dict, Any
-from fine_use_core import fine_use, get_spacing, get_font, get_border_width
+from typing import Optional, Callable, Dict, Any, Iterable, Mapping
+from fine_use_core import fine_use, get_spacing, get_font, get_border_width, VariantColors
+
+
+class FineUseThemed:
+    """
+    Mixin that keeps a Tk widget in sync with fine_use theme switches
+    
+    Widgets call _subscribe_theme() with the tokens they render and
+    override _on_theme_changed(changes); the subscription is weak and
+    is dropped again when the widget is destroyed.
+    """
+    
+    def _subscribe_theme(self, tokens: Iterable[str]):
+        """Register for changes to the given color tokens"""
+        fine_use.subscribe(self._on_theme_changed, tokens)
+    
+    def _on_theme_changed(self, changes: Mapping[str, str]):
+        """Re-apply theme colors - changes holds only the changed tokens
+        
+        No-op by default; widgets that subscribe override it.
+        """
+    
+    def destroy(self):
+        """Unsubscribe from theme changes before destroying the widget"""
+        fine_use.unsubscribe(self._on_theme_changed)
+        super().destroy()
 
 
 class FineUseApp:
@@ -55,6 +80,20 @@ class FineUseApp:
         
         # Configure default fonts
         self._configure_fonts()
+        
+        # Follow theme switches until the window is destroyed
+        fine_use.subscribe(self._on_theme_changed, ('bg',))
+        self.root.bind('<Destroy>', self._on_destroy, add='+')
+    
+    def _on_destroy(self, event):
+        """Unsubscribe once the root window is gone (children fire <Destroy> here too)"""
+        if event.widget is self.root:
+            fine_use.unsubscribe(self._on_theme_changed)
+    
+    def _on_theme_changed(self, changes: Mapping[str, str]):
+        """Re-apply background after a theme switch"""
+        self.root.configure(bg=changes['bg'])
+        self.main_frame.configure(bg=changes['bg'])
     
     def _configure_fonts(self):
         """Configure default fonts for the application"""
@@ -75,7 +114,7 @@ class FineUseApp:
         self.root.mainloop()
 
 
-class FineUseButton(tk.Button):
+class FineUseButton(FineUseThemed, tk.Button):
     """
     Fine Use styled button with exact web implementation styling
     
@@ -83,6 +122,16 @@ class FineUseButton(tk.Button):
     Sizes: sm, md, lg, xl
     """
     
+    # Color tokens each variant renders with (every focus ring is accent)
+    VARIANT_TOKENS = {
+        'primary': ('accent', 'bg'),
+        'success': ('success', 'bg', 'accent'),
+        'warning': ('warning', 'bg', 'accent'),
+        'error': ('error', 'bg', 'accent'),
+        'info': ('info', 'bg', 'accent'),
+        'secondary': ('surface', 'text', 'border', 'accent')
+    }
+    
     def __init__(
         self,
         parent,
@@ -106,10 +155,10 @@ class FineUseButton(tk.Button):
             text=text.upper(),  # Fine Use uses uppercase text
             command=command,
             font=font_tuple,
-            bg=colors['bg'],
-            fg=colors['fg'],
-            activebackground=colors['hover_bg'],
-            activeforeground=colors['hover_fg'],
+            bg=colors.bg,
+            fg=colors.fg,
+            activebackground=colors.hover_bg,
+            activeforeground=colors.hover_fg,
             relief='solid',
             bd=get_border_width('thin'),
             highlightthickness=0,
@@ -120,6 +169,7 @@ class FineUseButton(tk.Button):
         )
         
         # Store original colors for hover effects
+        self.variant = variant
         self.colors = colors
         
         # Bind hover events
@@ -127,51 +177,23 @@ class FineUseButton(tk.Button):
         self.bind('<Leave>', self._on_leave)
         self.bind('<FocusIn>', self._on_focus_in)
         self.bind('<FocusOut>', self._on_focus_out)
+        
+        self._subscribe_theme(self.VARIANT_TOKENS.get(variant, self.VARIANT_TOKENS['secondary']))
+    
+    def _on_theme_changed(self, changes: Mapping[str, str]):
+        """Rebuild variant colors after a theme switch"""
+        self.colors = self._get_variant_colors(self.variant)
+        self.configure(
+            bg=self.colors.bg,
+            fg=self.colors.fg,
+            activebackground=self.colors.hover_bg,
+            activeforeground=self.colors.hover_fg,
+            highlightcolor=self.colors.focus
+        )
     
-    def _get_variant_colors(self, variant: str) -> Dict[str, str]:
-        """Get colors for button variant"""
-        if variant == "primary":
-            return {
-                'bg': fine_use.colors['accent'],
-                'fg': fine_use.colors['bg'],
-                'hover_bg': fine_use.colors['bg'],
-                'hover_fg': fine_use.colors['accent']
-            }
-        elif variant == "success":
-            return {
-                'bg': fine_use.colors['success'],
-                'fg': fine_use.colors['bg'],
-                'hover_bg': fine_use.colors['bg'],
-                'hover_fg': fine_use.colors['success']
-            }
-        elif variant == "warning":
-            return {
-                'bg': fine_use.colors['warning'],
-                'fg': fine_use.colors['bg'],
-                'hover_bg': fine_use.colors['bg'],
-                'hover_fg': fine_use.colors['warning']
-            }
-        elif variant == "error":
-            return {
-                'bg': fine_use.colors['error'],
-                'fg': fine_use.colors['bg'],
-                'hover_bg': fine_use.colors['bg'],
-                'hover_fg': fine_use.colors['error']
-            }
-        elif variant == "info":
-            return {
-                'bg': fine_use.colors['info'],
-                'fg': fine_use.colors['bg'],
-                'hover_bg': fine_use.colors['bg'],
-                'hover_fg': fine_use.colors['info']
-            }
-        else:  # secondary (default)
-            return {
-                'bg': fine_use.colors['surface'],
-                'fg': fine_use.colors['text'],
-                'hover_bg': fine_use.colors['border'],
-                'hover_fg': fine_use.colors['text']
-            }
+    def _get_variant_colors(self, variant: str) -> VariantColors:
+        """Get the shared, precomputed colors for button variant"""
+        return fine_use.get_variant_colors(variant)
     
     def _get_size_padding(self, size: str) -> Dict[str, int]:
         """Get padding for button size"""
@@ -187,27 +209,27 @@ class FineUseButton(tk.Button):
     def _on_enter(self, event):
         """Handle mouse enter (hover)"""
         self.configure(
-            bg=self.colors['hover_bg'],
-            fg=self.colors['hover_fg']
+            bg=self.colors.hover_bg,
+            fg=self.colors.hover_fg
         )
     
     def _on_leave(self, event):
         """Handle mouse leave"""
         self.configure(
-            bg=self.colors['bg'],
-            fg=self.colors['fg']
+            bg=self.colors.bg,
+            fg=self.colors.fg
         )
     
     def _on_focus_in(self, event):
         """Handle focus in (accessibility)"""
-        self.configure(highlightthickness=3, highlightcolor=fine_use.colors['accent'])
+        self.configure(highlightthickness=3, highlightcolor=self.colors.focus)
     
     def _on_focus_out(self, event):
         """Handle focus out"""
         self.configure(highlightthickness=0)
 
 
-class FineUseLabel(tk.Label):
+class FineUseLabel(FineUseThemed, tk.Label):
     """
     Fine Use styled label with typography hierarchy
     """
@@ -234,6 +256,16 @@ class FineUseLabel(tk.Label):
             bg=fine_use.colors['bg'],
             **kwargs
         )
+        
+        self.color = color
+        self._subscribe_theme((color, 'text', 'bg'))
+    
+    def _on_theme_changed(self, changes: Mapping[str, str]):
+        """Re-apply text and background colors after a theme switch"""
+        self.configure(
+            fg=fine_use.colors.get(self.color, fine_use.colors['text']),
+            bg=fine_use.colors['bg']
+        )
     
     def _get_level_font(self, level: str):
         """Get font configuration for text level"""
@@ -249,7 +281,7 @@ class FineUseLabel(tk.Label):
         return get_font(size, weight)
 
 
-class FineUseFrame(tk.Frame):
+class FineUseFrame(FineUseThemed, tk.Frame):
     """
     Fine Use styled frame with component styling
     """
@@ -272,9 +304,18 @@ class FineUseFrame(tk.Frame):
             pady=pad,
             **kwargs
         )
+        
+        self._subscribe_theme(('surface', 'border'))
+    
+    def _on_theme_changed(self, changes: Mapping[str, str]):
+        """Re-apply surface colors after a theme switch"""
+        self.configure(
+            bg=fine_use.colors['surface'],
+            highlightcolor=fine_use.colors['border']
+        )
 
 
-class FineUseEntry(tk.Entry):
+class FineUseEntry(FineUseThemed, tk.Entry):
     """
     Fine Use styled text input
     """
@@ -302,21 +343,35 @@ class FineUseEntry(tk.Entry):
             **kwargs
         )
         
+        self.palette = fine_use.colors  # focus handlers run outside any theme_context
+        self.placeholder_active = False
+        self._subscribe_theme(('surface', 'text', 'accent', 'comment'))
+        
         # Add placeholder functionality
         if placeholder:
             self.placeholder = placeholder
             self.placeholder_active = True
             self.insert(0, placeholder)
-            self.configure(fg=fine_use.colors['comment'])
+            self.configure(fg=self.palette['comment'])
             
             self.bind('<FocusIn>', self._on_focus_in)
             self.bind('<FocusOut>', self._on_focus_out)
     
+    def _on_theme_changed(self, changes: Mapping[str, str]):
+        """Re-apply input colors after a theme switch"""
+        self.palette = fine_use.colors
+        self.configure(
+            bg=self.palette['surface'],
+            fg=self.palette['comment' if self.placeholder_active else 'text'],
+            insertbackground=self.palette['accent'],
+            highlightcolor=self.palette['accent']
+        )
+    
     def _on_focus_in(self, event):
         """Handle focus in - remove placeholder"""
         if self.placeholder_active:
             self.delete(0, tk.END)
-            self.configure(fg=fine_use.colors['text'])
+            self.configure(fg=self.palette['text'])
             self.placeholder_active = False
         
         self.configure(highlightthickness=3)
@@ -325,7 +380,7 @@ class FineUseEntry(tk.Entry):
         """Handle focus out - restore placeholder if empty"""
         if not self.get() and hasattr(self, 'placeholder'):
             self.insert(0, self.placeholder)
-            self.configure(fg=fine_use.colors['comment'])
+            self.configure(fg=self.palette['comment'])
             self.placeholder_active = True
         
         self.configure(highlightthickness=0)
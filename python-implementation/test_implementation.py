@@ -8,6 +8,8 @@ import os
 
 # Add parent directory for imports
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+# and the PySide6 demo directory (widgets.log_entry has no Qt imports)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'demos-pyside6'))
 
 def test_core_system():
     """Test the core Fine Use system"""
@@ -28,6 +30,14 @@ def test_core_system():
         font_tuple = get_font('lg', 'bold')
         print(f"✅ Large bold font: {font_tuple}")
         
+        # Test interned token tables
+        assert get_font('lg', 'bold') is font_tuple
+        fine_use.set_scale(0.5)
+        assert get_spacing('lg') == 12 and get_font('lg', 'bold')[1] == 9
+        fine_use.set_scale(1.0)
+        assert get_font('lg', 'bold') is font_tuple
+        print("✅ Token tables interned and rebuilt on scale change")
+        
         # Test theme switching
         original_theme = fine_use.current_theme
         fine_use.set_theme(FineUseTheme.AMBER)
@@ -50,7 +60,13 @@ def test_tkinter_implementation():
     print("Testing Tkinter Implementation...")
     
     try:
-        from fine_use_tkinter import FineUseApp, FineUseButton, FineUseLabel
+        from fine_use_tkinter import FineUseApp, FineUseButton, FineUseLabel, FineUseThemed
+        
+        # The mixin's theme callback is a no-op until a widget overrides it
+        assert FineUseThemed()._on_theme_changed({'accent': '#ffffff'}) is None
+        
+        # Every variant's focus ring is accent, so every variant must follow it
+        assert all('accent' in tokens for tokens in FineUseButton.VARIANT_TOKENS.values())
         
         # Test app creation (don't show window)
         app = FineUseApp(title="Test App")
@@ -72,8 +88,16 @@ def test_tkinter_implementation():
         )
         print("✅ FineUseLabel created successfully")
         
-        # Destroy app
+        # Destroying a child keeps the app subscribed, destroying the root does not
+        from fine_use_core import fine_use, FineUseTheme
+        label.destroy()
+        fine_use.set_theme(FineUseTheme.AMBER)
+        assert app.root.cget('bg') == fine_use.colors['bg']
+        
+        # Destroy app - later theme switches must not reach the dead window
         app.root.destroy()
+        fine_use.set_theme(FineUseTheme.GITHUB_DARK)
+        print("✅ Theme switches stop at a destroyed app")
         
         print("✅ Tkinter implementation test PASSED\n")
         return True
@@ -146,6 +170,1235 @@ def test_all_themes():
         print(f"❌ Themes test FAILED: {e}\n")
         return False
 
+def test_palette_registry():
+    """Test the frozen theme palette registry"""
+    print("Testing Palette Registry...")
+    
+    try:
+        from fine_use_core import (
+            FineUse, FineUseTheme, FineUseColors, THEME_PALETTES, TOKEN_INDEX
+        )
+        
+        core = FineUse()
+        for theme in FineUseTheme:
+            palette = THEME_PALETTES[theme]
+            assert core.get_theme_colors(theme) is palette
+            assert dict(palette) == getattr(FineUseColors, theme.name)
+            for token, index in TOKEN_INDEX.items():
+                assert palette.hex[index] == palette[token]
+                assert palette.rgb[index] == core.hex_to_rgb(palette[token])
+                assert palette.packed[index] == int(palette[token][1:], 16)
+        print(f"✅ {len(THEME_PALETTES)} palettes match FineUseColors")
+        
+        from fine_use_core import fine_use, get_variant_table
+        for palette in THEME_PALETTES.values():
+            table = get_variant_table(palette)
+            assert table is get_variant_table(palette)
+            assert table['primary'].bg == palette['accent']
+            assert table['secondary'].hover_bg == palette['border']
+        fine_use.set_theme(FineUseTheme.AMBER)
+        assert fine_use.get_variant_colors('primary') is get_variant_table(THEME_PALETTES[FineUseTheme.AMBER])['primary']
+        assert fine_use.get_variant_colors('unknown') is fine_use.variants['secondary']
+        fine_use.set_theme(FineUseTheme.GITHUB_DARK)
+        print("✅ Button variant tables shared per palette")
+        
+        from fine_use_core import Palette
+        twin = Palette('custom', dict(palette))
+        assert twin == palette and hash(twin) == hash(palette) and len({twin, palette}) == 1
+        print("✅ Equal palettes hash equal")
+        
+        try:
+            palette.hex = ()
+            print("❌ Palette accepted attribute assignment")
+            return False
+        except AttributeError:
+            print("✅ Palettes are immutable")
+        
+        print("✅ Palette registry test PASSED\n")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Palette registry test FAILED: {e}\n")
+        return False
+
+def test_batch_color_math():
+    """Test the vectorized color math engine"""
+    print("Testing Batch Color Math...")
+    
+    try:
+        from fine_use_core import fine_use, THEME_PALETTES, TOKEN_NAMES
+        from fine_use_colormath import (
+            hex_to_rgb, rgb_to_hex, token_matrix, contrast_ratio, derive_state_colors
+        )
+        
+        hexes = [p[token] for p in THEME_PALETTES.values() for token in TOKEN_NAMES]
+        rgb = hex_to_rgb(hexes)
+        assert [tuple(c) for c in rgb] == [fine_use.hex_to_rgb(h) for h in hexes]
+        assert list(rgb_to_hex(rgb)) == hexes
+        assert (token_matrix().reshape(-1, 3) == rgb).all()
+        print(f"✅ {len(hexes)} colors round-trip hex <-> RGB")
+        
+        assert hex_to_rgb([]).shape == (0, 3) and hex_to_rgb(['#A0b1C2']).tolist() == [[160, 177, 194]]
+        for bad in ('#58a6ff', ['#58a6ff0'], ['#58a6f'], ['#58a6fg'], ['58a6ff0'], ['#58a6f\u0130'], ['#58a6ff', '#fff']):
+            try:
+                hex_to_rgb(bad)
+                raise AssertionError(f"hex_to_rgb accepted {bad!r}")
+            except ValueError:
+                pass
+        print("✅ Malformed hex colors rejected")
+        
+        ratio = contrast_ratio(hex_to_rgb(['#000000']), hex_to_rgb(['#ffffff']))
+        assert abs(ratio[0] - 21.0) < 1e-9
+        print("✅ WCAG contrast black/white = 21:1")
+        
+        table = derive_state_colors()
+        assert table.hover.shape == (len(table.themes), len(table.variants), 3)
+        print(f"✅ State colors derived for {table.hover.shape[0]}x{table.hover.shape[1]} theme/variants")
+        
+        print("✅ Batch color math test PASSED\n")
+        return True
+        
+    except ImportError as e:
+        if "NumPy" in str(e):
+            print("⚠️  NumPy not installed - this is optional")
+            print("✅ Batch color math test SKIPPED\n")
+            return True
+        print(f"❌ Batch color math test FAILED: {e}\n")
+        return False
+    except Exception as e:
+        print(f"❌ Batch color math test FAILED: {e}\n")
+        return False
+
+def test_theme_subscriptions():
+    """Test theme change subscriptions and token diffing"""
+    print("Testing Theme Subscriptions...")
+    
+    try:
+        import gc
+        from fine_use_core import FineUse, FineUseTheme
+        
+        core = FineUse(FineUseTheme.MONOCHROME)
+        
+        class Subscriber:
+            def __init__(self, tokens=None):
+                self.batches = []
+                core.subscribe(self.on_change, tokens)
+            
+            def on_change(self, changes):
+                self.batches.append(dict(changes))
+        
+        everything = Subscriber()
+        accent_only = Subscriber(tokens=('accent',))
+        bg_only = Subscriber(tokens=('bg',))
+        
+        core.set_theme(FineUseTheme.VT220)
+        assert len(everything.batches) == 1
+        assert 'bg' not in everything.batches[0]
+        assert everything.batches[0]['accent'] == '#00cc00'
+        assert len(accent_only.batches) == 1 and not bg_only.batches
+        print(f"✅ monochrome -> vt220 sent {len(everything.batches[0])} changed tokens")
+        
+        del everything
+        gc.collect()
+        core.set_theme(FineUseTheme.GITHUB_LIGHT)
+        assert len(core._subscribers) == 2
+        assert len(bg_only.batches) == 1
+        print("✅ Subscribers are held weakly")
+        
+        print("✅ Theme subscriptions test PASSED\n")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Theme subscriptions test FAILED: {e}\n")
+        return False
+
+def test_theme_contexts():
+    """Test context-local theme overrides across threads"""
+    print("Testing Theme Contexts...")
+    
+    try:
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+        from fine_use_core import FineUse, FineUseTheme, THEME_PALETTES
+        
+        core = FineUse(FineUseTheme.GITHUB_DARK)
+        notified = []
+        core.subscribe(notified.append)
+        
+        with core.theme_context(FineUseTheme.AMBER, scale=2.0) as palette:
+            assert core.colors is palette is THEME_PALETTES[FineUseTheme.AMBER]
+            assert core.get_font_tuple('md')[1] == 2 * core.typography.FONT_SIZES['md']
+            core.set_theme(FineUseTheme.VT220)
+            assert core.current_theme == FineUseTheme.VT220
+        assert core.current_theme == FineUseTheme.GITHUB_DARK and core.scale == 1.0
+        assert not notified
+        print("✅ Overrides are scoped and never notify subscribers")
+        
+        barrier = threading.Barrier(len(FineUseTheme))
+        
+        def render(theme):
+            with core.theme_context(theme):
+                barrier.wait()  # every thread inside its own context at once
+                return core.colors['accent'], core.get_variant_colors('primary').bg
+        
+        with ThreadPoolExecutor(len(FineUseTheme)) as pool:
+            results = dict(zip(FineUseTheme, pool.map(render, FineUseTheme)))
+        for theme, (accent, button_bg) in results.items():
+            assert accent == button_bg == THEME_PALETTES[theme]['accent']
+        assert core.current_theme == FineUseTheme.GITHUB_DARK
+        print(f"✅ {len(results)} threads rendered their own theme in parallel")
+        
+        print("✅ Theme contexts test PASSED\n")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Theme contexts test FAILED: {e}\n")
+        return False
+
+def test_stylesheet_cache():
+    """Test the compiled QSS cache"""
+    print("Testing Stylesheet Cache...")
+    
+    try:
+        import tempfile
+        from fine_use_core import fine_use, FineUseTheme
+        from fine_use_cache import LRUCache
+        from fine_use_pyqt import FineUseStyleSheet, StyleSheetCache, FineUseButton
+        
+        palette, tokens = fine_use.colors, fine_use.tokens
+        cache = StyleSheetCache(maxsize=2)
+        qss = cache.get(palette, tokens)
+        assert qss == FineUseStyleSheet.compile_stylesheet(palette, tokens)
+        assert all(f'QPushButton[buttonSize="{size}"]' in qss for size in FineUseButton.SIZES)
+        assert cache.get(palette, tokens) is qss and (cache.hits, cache.misses) == (1, 1)
+        assert isinstance(cache, LRUCache)
+        
+        with fine_use.theme_context(FineUseTheme.AMBER, scale=2.0):
+            scaled = cache.get(fine_use.colors, fine_use.tokens)
+        assert fine_use.colors['accent'] not in scaled and f"font-size: {2 * fine_use.typography.FONT_SIZES['md']}px" in scaled
+        with fine_use.theme_context(FineUseTheme.VT220):
+            cache.get(fine_use.colors, fine_use.tokens)
+        assert len(cache._entries) == 2 and cache.get(palette, tokens) is not qss
+        print("✅ LRU keyed by theme and scale")
+        
+        with tempfile.TemporaryDirectory() as disk_dir:
+            StyleSheetCache(disk_dir=disk_dir).get(palette, tokens)
+            warm = StyleSheetCache(disk_dir=disk_dir)
+            assert warm.get(palette, tokens) == qss and (warm.disk_hits, warm.misses) == (1, 0)
+        print("✅ Disk store reused across caches")
+        
+        print("✅ Stylesheet cache test PASSED\n")
+        return True
+        
+    except ImportError as e:
+        if "PyQt" in str(e):
+            print("⚠️  PyQt not installed - this is optional")
+            print("✅ Stylesheet cache test SKIPPED\n")
+            return True
+        print(f"❌ Stylesheet cache test FAILED: {e}\n")
+        return False
+    except Exception as e:
+        print(f"❌ Stylesheet cache test FAILED: {e}\n")
+        return False
+
+def test_polish_scheduler():
+    """Test coalesced deferred widget polishing"""
+    print("Testing Polish Scheduler...")
+    
+    try:
+        if not os.environ.get('DISPLAY') and sys.platform not in ('win32', 'darwin'):
+            os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+        from fine_use_pyqt import QApplication, FineUseApp, FineUseWindow, FineUseButton, polish_scheduler
+        
+        app = QApplication.instance() or FineUseApp()
+        window = FineUseWindow("Polish Test")
+        buttons = [FineUseButton(f"B{i}") for i in range(20)]
+        for button in buttons:
+            window.main_layout.addWidget(button)
+        window.show()
+        app.processEvents()
+        
+        polish_scheduler.reset_counters()
+        for button in buttons:
+            button.set_variant('error')
+            button.set_size('lg')
+            button.set_variant('success')
+        assert polish_scheduler.polished == 0 and len(polish_scheduler._dirty) == len(buttons)
+        app.processEvents()
+        assert polish_scheduler.flushes == 1
+        assert polish_scheduler.polished == len(buttons) and polish_scheduler.saved == 2 * len(buttons)
+        assert window.updatesEnabled()
+        small = FineUseButton("B0", size="sm")
+        window.main_layout.addWidget(small)
+        app.processEvents()
+        assert buttons[0].property("buttonSize") == 'lg' and small.sizeHint().height() < buttons[0].sizeHint().height()
+        print(f"✅ {polish_scheduler.requested} property changes -> {polish_scheduler.polished} polishes")
+        
+        window.close()
+        print("✅ Polish scheduler test PASSED\n")
+        return True
+        
+    except ImportError as e:
+        if "PyQt" in str(e):
+            print("⚠️  PyQt not installed - this is optional")
+            print("✅ Polish scheduler test SKIPPED\n")
+            return True
+        print(f"❌ Polish scheduler test FAILED: {e}\n")
+        return False
+    except Exception as e:
+        print(f"❌ Polish scheduler test FAILED: {e}\n")
+        return False
+
+def test_palette_render_mode():
+    """Test the QPalette + proxy style rendering mode"""
+    print("Testing Palette Render Mode...")
+    
+    try:
+        if not os.environ.get('DISPLAY') and sys.platform not in ('win32', 'darwin'):
+            os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+        from fine_use_core import fine_use, FineUseTheme
+        from fine_use_pyqt import (
+            QApplication, QPalette, QProgressBar, FineUseApp, FineUseButton,
+            FineUseProxyStyle, QSize, QStyle, BUTTON_PADDING, build_qpalette
+        )
+        from fine_use_core import get_spacing
+        
+        app = QApplication.instance() or FineUseApp(render_mode='palette')
+        palette = build_qpalette(fine_use.colors)
+        assert palette.color(QPalette.ColorRole.Window).name() == fine_use.colors['bg']
+        assert palette.color(QPalette.ColorRole.Highlight).name() == fine_use.colors['accent']
+        
+        # Earlier tests may have created a QSS-mode app - drop its stylesheet here
+        app_stylesheet = app.styleSheet()
+        app.setStyleSheet("")
+        style = FineUseProxyStyle()
+        button = FineUseButton("Deploy", "primary", "lg")
+        progress = QProgressBar()
+        for widget in (button, progress):
+            widget.setStyle(style)
+        assert progress.sizeHint().height() == FineUseProxyStyle.PROGRESS_HEIGHT
+        for size, pad in BUTTON_PADDING.items():
+            padded = style.sizeFromContents(QStyle.ContentsType.CT_PushButton, None, QSize(0, 0),
+                                            FineUseButton("Go", "primary", size))
+            assert padded.height() == 2 * get_spacing(pad) + 2 * FineUseProxyStyle.BORDER, size
+        assert BUTTON_PADDING['sm'] == 'xs'
+        button.resize(button.sizeHint())
+        assert button.grab().toImage().pixelColor(8, 8).name() == fine_use.colors['accent']
+        with fine_use.theme_context(FineUseTheme.AMBER):
+            assert button.grab().toImage().pixelColor(8, 8).name() == fine_use.colors['accent']
+        app.setStyleSheet(app_stylesheet)
+        print("✅ Buttons painted from the active variant table")
+        
+        print("✅ Palette render mode test PASSED\n")
+        return True
+        
+    except ImportError as e:
+        if "PyQt" in str(e):
+            print("⚠️  PyQt not installed - this is optional")
+            print("✅ Palette render mode test SKIPPED\n")
+            return True
+        print(f"❌ Palette render mode test FAILED: {e}\n")
+        return False
+    except Exception as e:
+        print(f"❌ Palette render mode test FAILED: {e}\n")
+        return False
+
+def test_data_table():
+    """Test the virtualized columnar data table"""
+    print("Testing Data Table...")
+    
+    try:
+        if not os.environ.get('DISPLAY') and sys.platform not in ('win32', 'darwin'):
+            os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+        from array import array
+        from fine_use_pyqt import QApplication, Qt, FineUseApp, FineUseDataTable, FineUseTableModel
+        
+        app = QApplication.instance() or FineUseApp()
+        rows = 1_000_000
+        statuses = ['online', 'degraded', 'offline', 'custom']
+        table = FineUseDataTable({
+            'service_id': range(rows),
+            'status': statuses * (rows // 4),
+            'cpu': array('d', [10.0, 75.0, 90.0, 50.0]) * (rows // 4)
+        }, color_coded_columns=('cpu',))
+        model = table.table_model
+        assert model.rowCount() == rows and model.columnCount() == 3
+        assert model.headerData(0, Qt.Orientation.Horizontal) == 'SERVICE ID'
+        assert [model.index(r, 1).data() for r in range(4)] == ['ONLINE', 'DEGRADED', 'OFFLINE', 'CUSTOM']
+        tokens = [model.index(r, c).data(FineUseTableModel.TokenRole) for c in (1, 2) for r in range(4)]
+        assert tokens == ['success', 'warning', 'error', 'info', 'success', 'warning', 'error', 'success']
+        assert model.index(0, 0).data(FineUseTableModel.TokenRole) is None
+        print(f"✅ {rows:,} rows opened without per-cell objects")
+        
+        try:
+            import numpy as np
+            cpu = np.array([2.0, 1.0, 2.0] * 7 + [0.5])
+        except ImportError:
+            cpu = [2.0, 1.0, 2.0] * 7 + [0.5]
+        layouts = []
+        mixed = FineUseTableModel({'value': [3] * 20 + ['x', 'A'], 'cpu': cpu})
+        mixed.layoutChanged.connect(lambda: layouts.append('changed'))
+        mixed.sort(0)
+        assert [mixed.value(r, 0) for r in (0, 20, 21)] == [3, 'A', 'x'] and layouts == ['changed']
+        mixed.sort(1)
+        assert [mixed.value(r, 1) for r in range(3)] == [0.5, 1.0, 1.0] and mixed._order[1] == 1
+        mixed.sort(1, Qt.SortOrder.DescendingOrder)
+        assert list(mixed._order[:3]) == [0, 2, 3] and mixed.value(21, 1) == 0.5
+        print("✅ Mixed-type and NumPy columns sort without breaking the layout")
+        
+        table.resize(600, 400)
+        table.show()
+        app.processEvents()
+        table.verticalScrollBar().setValue(table.verticalScrollBar().maximum())
+        table.viewport().repaint()
+        assert table.rowAt(0) > rows - 100
+        table.close()
+        print("✅ Scrolled to the last row")
+        
+        print("✅ Data table test PASSED\n")
+        return True
+        
+    except ImportError as e:
+        if "PyQt" in str(e):
+            print("⚠️  PyQt not installed - this is optional")
+            print("✅ Data table test SKIPPED\n")
+            return True
+        print(f"❌ Data table test FAILED: {e}\n")
+        return False
+    except Exception as e:
+        print(f"❌ Data table test FAILED: {e}\n")
+        return False
+
+def test_button_grid_bulk():
+    """Test bulk construction and relayout of the PyQt button grid"""
+    print("Testing Button Grid Bulk API...")
+    
+    try:
+        if not os.environ.get('DISPLAY') and sys.platform not in ('win32', 'darwin'):
+            os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+        from fine_use_pyqt import QApplication, FineUseApp, FineUseButtonGrid
+        
+        app = QApplication.instance() or FineUseApp()
+        grid = FineUseButtonGrid()
+        grid.show()
+        app.processEvents()
+        
+        clicks = []
+        buttons = grid.add_buttons(
+            [("start", "primary", lambda: clicks.append('start'))] + [f"B{i}" for i in range(11)]
+        )
+        app.processEvents()
+        position = lambda button: grid.grid_layout.getItemPosition(grid.grid_layout.indexOf(button))[:2]
+        assert [position(b) for b in buttons[:3]] == [(0, 0), (0, 1), (1, 0)]
+        assert buttons[0].text() == "START" and buttons[0].property("variant") == "primary"
+        
+        grid.set_layout(3, 4)
+        app.processEvents()
+        assert grid.buttons == buttons and position(buttons[5]) == (1, 1)
+        relayouts = grid.relayouts
+        assert relayouts < len(buttons)
+        print(f"✅ 12 buttons built and re-laid out as 3x4 in {relayouts} geometry passes")
+        
+        reused = grid.set_buttons([("stop", "error", lambda: clicks.append('stop')), "other"])
+        app.processEvents()
+        assert reused == buttons[:2] and grid.grid_layout.count() == 2
+        reused[0].click()
+        assert clicks == ['stop'] and reused[0].property("variant") == "error"
+        print("✅ set_buttons reuses existing buttons")
+        
+        grid.close()
+        print("✅ Button grid bulk API test PASSED\n")
+        return True
+        
+    except ImportError as e:
+        if "PyQt" in str(e):
+            print("⚠️  PyQt not installed - this is optional")
+            print("✅ Button grid bulk API test SKIPPED\n")
+            return True
+        print(f"❌ Button grid bulk API test FAILED: {e}\n")
+        return False
+    except Exception as e:
+        print(f"❌ Button grid bulk API test FAILED: {e}\n")
+        return False
+
+def test_lazy_backend_imports():
+    """Test that importing fine_use tokens stays fast and GUI-free"""
+    print("Testing Lazy Backend Imports...")
+    
+    try:
+        import compileall
+        import subprocess
+        
+        here = os.path.dirname(os.path.abspath(__file__))
+        compileall.compile_dir(os.path.join(here, 'fine_use'), quiet=1)
+        compileall.compile_file(os.path.join(here, 'fine_use_core.py'), quiet=1)
+        
+        gui_modules = ('tkinter', 'PyQt5', 'PyQt6', 'PySide6', 'numpy')
+        # Stdlib modules the token path leaves out - typing alone pulls in re
+        heavy_modules = ('typing', 're', 'contextlib')
+        # weakref (about 1 ms) is imported up front for the subscription bus
+        budget_us = 6000
+        
+        def cumulative_us(code, module):
+            """Best-of-3 cumulative import time of module, and every module the runs imported"""
+            best_us, imported = None, set()
+            for _ in range(3):
+                result = subprocess.run(
+                    [sys.executable, '-X', 'importtime', '-c', code],
+                    cwd=here, capture_output=True, text=True, check=True
+                )
+                for line in result.stderr.splitlines():
+                    if not line.startswith('import time:') or 'self [us]' in line:
+                        continue
+                    _, total, name = line[len('import time:'):].split('|')
+                    name = name.strip()
+                    imported.add(name)
+                    if name == module:
+                        best_us = int(total) if best_us is None else min(best_us, int(total))
+            return best_us, imported
+        
+        total_us, imported = cumulative_us('import fine_use; fine_use.get_spacing("lg")', 'fine_use')
+        pulled = sorted(name for name in imported if name.split('.')[0] in gui_modules + heavy_modules)
+        if pulled:
+            print(f"❌ Token import pulled in {', '.join(pulled)}")
+            return False
+        
+        # FineUseTheme is an Enum, so enum (with the functools and collections
+        # it imports) is a floor no token change can lower - it is measured
+        # on this machine and the budget covers everything on top of it
+        enum_us, _ = cumulative_us('import enum', 'enum')
+        
+        print("✅ No GUI toolkit, typing, re or contextlib imported for tokens")
+        print(f"✅ Fine Use import time: {total_us / 1000:.2f} ms cumulative, "
+              f"{(total_us - enum_us) / 1000:.2f} ms over enum (budget {budget_us / 1000:.0f} ms)")
+        assert total_us - enum_us < budget_us
+        
+        import fine_use
+        assert fine_use.fine_use.colors is fine_use.get_current_theme_colors()
+        assert 'tkinter' in dir(fine_use)
+        
+        print("✅ Lazy backend imports test PASSED\n")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Lazy backend imports test FAILED: {e}\n")
+        return False
+
+def test_theme_file_loader():
+    """Test loading palettes from themes/*.css and universal-config.json"""
+    print("Testing Theme File Loader...")
+    
+    try:
+        import tempfile
+        from fine_use_core import THEME_PALETTES
+        from fine_use_theme_loader import load_themes, DEFAULT_THEMES_DIR
+        
+        if not os.path.isdir(DEFAULT_THEMES_DIR):
+            print("⚠️  themes/ sources not found - this is optional")
+            print("✅ Theme file loader test SKIPPED\n")
+            return True
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            cache_path = os.path.join(tmp, 'themes.bin')
+            parsed = load_themes(cache_path=cache_path)
+            cached = load_themes(cache_path=cache_path)
+            assert os.path.exists(cache_path)
+            assert parsed == cached
+        print(f"✅ {len(cached)} themes round-trip through the binary cache")
+        
+        for theme, palette in THEME_PALETTES.items():
+            assert cached[theme.value].palette == palette, f"{theme.value} drifted from CSS"
+        print("✅ Built-in palettes match themes/*.css")
+        
+        for industry in ('financial', 'healthcare', 'construction', 'real-estate', 'community'):
+            assert industry in cached
+        print(f"✅ Industry themes loaded: {cached['financial'].name}, ...")
+        
+        print("✅ Theme file loader test PASSED\n")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Theme file loader test FAILED: {e}\n")
+        return False
+
+def test_pyside6_theme_registry():
+    """Test the lazily-loaded theme registry of the PySide6 demos"""
+    print("Testing PySide6 Theme Registry...")
+    
+    try:
+        import importlib.util
+        
+        package_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'demos-pyside6', 'themes')
+        spec = importlib.util.spec_from_file_location(
+            'fine_use_demo_themes', os.path.join(package_dir, '__init__.py'),
+            submodule_search_locations=[package_dir]
+        )
+        themes = importlib.util.module_from_spec(spec)
+        sys.modules[spec.name] = themes
+        spec.loader.exec_module(themes)
+        
+        assert len(themes.THEMES) == 10
+        assert list(themes.get_available_themes()) == list(themes.THEME_INDEX)
+        assert themes.THEMES.loaded == ()
+        print("✅ 10 themes registered, none imported at startup")
+        
+        themes.get_theme_qss('amber')
+        assert themes.THEMES.loaded == ('amber',)
+        print("✅ Selecting a theme imports only that theme")
+        
+        tokens = ('bg', 'surface', 'border', 'text', 'comment', 'accent', 'success', 'warning', 'error', 'info')
+        for key in themes.THEMES:
+            theme = themes.THEMES[key]
+            assert isinstance(theme, themes.FineUseTheme), key
+            assert all(token in theme.colors for token in tokens), key
+            assert themes.resolve_theme_name(key) == key
+            qss = themes.get_theme_qss(key)
+            assert theme.colors['bg'] in qss and themes.get_theme_qss(key) is qss
+        print("✅ Every theme key resolves and compiles")
+        
+        from fine_use_cache import LRUCache
+        assert isinstance(themes.THEME_CACHE, LRUCache)
+        assert themes.THEME_CACHE.hits > 0 and themes.THEME_CACHE.hit_rate > 0
+        print("✅ Compiled themes kept in the shared LRU")
+        
+        assert themes.resolve_theme_name('no-such-theme') == themes.DEFAULT_THEME
+        try:
+            themes.THEMES.register('amber', themes.THEMES['amber'])
+            raise AssertionError("duplicate theme key accepted")
+        except ValueError:
+            pass
+        print("✅ Unknown keys fall back to github-dark")
+        
+        print("✅ PySide6 theme registry test PASSED\n")
+        return True
+        
+    except Exception as e:
+        print(f"❌ PySide6 theme registry test FAILED: {e}\n")
+        return False
+
+def test_theme_prewarmer():
+    """Test background compilation of the themes not in use"""
+    print("Testing Theme Prewarmer...")
+    
+    try:
+        from fine_use_core import fine_use, FineUseTheme, THEME_PALETTES
+        from fine_use_pyqt import StyleSheetCache, ThemePrewarmer
+        
+        cache = StyleSheetCache()
+        prewarmer = ThemePrewarmer(cache)
+        prewarmer.start()
+        assert prewarmer.wait(10)
+        assert prewarmer.compiled == len(THEME_PALETTES) - 1 == cache.prewarmed
+        assert (cache.hits, cache.misses) == (0, 0)
+        print(f"✅ {prewarmer.compiled} inactive themes compiled off the UI thread")
+        
+        with fine_use.theme_context(FineUseTheme.AMBER):
+            cache.get(fine_use.colors, fine_use.tokens)
+        cache.get(fine_use.colors, fine_use.tokens)
+        assert (cache.hits, cache.misses) == (1, 1) and cache.hit_rate == 0.5
+        print("✅ Switching to a prewarmed theme is a cache hit")
+        
+        themes = sys.modules.get('fine_use_demo_themes')
+        if themes is not None:
+            demo_cache = themes.ThemeCache()
+            demo_prewarmer = themes.ThemePrewarmer(demo_cache)
+            demo_prewarmer.start(active='github-dark')
+            assert demo_prewarmer.wait(10) and demo_prewarmer.compiled == len(themes.THEMES) - 1
+            assert demo_cache.get('amber') == themes.compile_theme('amber')
+            assert (demo_cache.hits, demo_cache.misses) == (1, 0)
+            print("✅ PySide6 demo themes prewarmed into THEME_CACHE")
+        
+        print("✅ Theme prewarmer test PASSED\n")
+        return True
+        
+    except ImportError as e:
+        if "PyQt" in str(e):
+            print("⚠️  PyQt not installed - this is optional")
+            print("✅ Theme prewarmer test SKIPPED\n")
+            return True
+        print(f"❌ Theme prewarmer test FAILED: {e}\n")
+        return False
+    except Exception as e:
+        print(f"❌ Theme prewarmer test FAILED: {e}\n")
+        return False
+
+def _run_pyside6_check(script, name, *args):
+    """Run a PySide6 check script in a fresh process from demos-pyside6
+    
+    PySide6 and PyQt bundle different Qt builds, so PySide6 checks never
+    share the test process. A failing script's whole stderr is printed.
+    """
+    import subprocess
+    
+    env = dict(os.environ)
+    if not env.get('DISPLAY') and sys.platform not in ('win32', 'darwin'):
+        env.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    demo_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'demos-pyside6')
+    result = subprocess.run([sys.executable, '-c', script, *args], cwd=demo_dir, env=env, capture_output=True, text=True)
+    if result.returncode != 0:
+        print(result.stderr.rstrip())
+        raise AssertionError(f"{name} check exited with status {result.returncode}")
+
+def test_pyside6_log_terminal():
+    """Test the ring buffer of the PySide6 demo log terminal"""
+    print("Testing PySide6 Log Terminal...")
+    
+    try:
+        import importlib.util
+        
+        if importlib.util.find_spec('PySide6') is None:
+            print("⚠️  PySide6 not installed - this is optional")
+            print("✅ PySide6 log terminal test SKIPPED\n")
+            return True
+        
+        check = """
+import threading
+import time
+from PySide6.QtWidgets import QApplication
+from widgets.log_terminal import FineUseLogTerminal, LogEntry
+
+app = QApplication([])
+terminal = FineUseLogTerminal(max_lines=20)
+terminal.pause_auto_logging()
+for i in range(30):
+    terminal.add_log_entry('warn', f'line {i}')
+assert terminal.document().isEmpty() and not terminal.entries
+terminal.flush()
+lines = terminal.toPlainText().split('\\n')
+assert terminal.document().blockCount() == len(terminal.entries) == 20
+assert lines[0].endswith('WARN line 10') and terminal.entries[0].message == 'line 10'
+assert (terminal.flushes, terminal.last_batch, terminal.dropped) == (1, 30, 10) and len(terminal._pending) == 0
+
+terminal.add_log_entries([('error', f'burst {i}') for i in range(100)] + [('nope', 'tail')])
+terminal.flush()
+assert terminal.document().blockCount() == len(terminal.entries) == 20
+assert terminal.entries[-1] == LogEntry(terminal.entries[-1].ts_ns, 0, 'tail') and terminal.entries[-1].level == 'INFO'
+assert terminal.toPlainText().split('\\n')[0].endswith('ERROR burst 81')
+
+worker = threading.Thread(target=lambda: [terminal.add_log_entry('debug', f'thread {i}') for i in range(500)])
+worker.start()
+worker.join()
+deadline = time.perf_counter() + 5
+while terminal.entries[-1].message != 'thread 499' and time.perf_counter() < deadline:
+    time.sleep(0.02)
+    app.processEvents()
+assert terminal.entries[-1].message == 'thread 499' and terminal.flushes == 3 and terminal.mean_batch == 631 / 3
+assert terminal.dropped == 631 - 3 * 20
+
+terminal.max_lines = 5
+assert terminal.document().blockCount() == len(terminal.entries) == 5
+terminal.clear_logs()
+assert not terminal.entries and terminal.document().isEmpty()
+"""
+        _run_pyside6_check(check, 'log terminal')
+        
+        print("✅ Oldest lines evicted at max_lines, entries kept in step")
+        print("✅ Batches only lay out the lines that stay visible")
+        print("✅ Entries from other threads coalesced into one flush")
+        print("✅ PySide6 log terminal test PASSED\n")
+        return True
+        
+    except Exception as e:
+        print(f"❌ PySide6 log terminal test FAILED: {e}\n")
+        return False
+
+def test_pyside6_log_view():
+    """Test the columnar model behind the PySide6 demo log view"""
+    print("Testing PySide6 Log View...")
+    
+    try:
+        import importlib.util
+        
+        if importlib.util.find_spec('PySide6') is None:
+            print("⚠️  PySide6 not installed - this is optional")
+            print("✅ PySide6 log view test SKIPPED\n")
+            return True
+        
+        check = """
+from datetime import datetime
+from PySide6.QtWidgets import QApplication
+from widgets.log_entry import LogEntry
+from widgets.log_view import FineUseLogView
+
+app = QApplication([])
+view = FineUseLogView()
+model = view.log_model
+stamp = datetime(2024, 5, 1, 12, 30, 45)
+view.add_log_entries([('warn', 'disk at 91%', stamp), ('nope', 'disk at 91%'), ('ERROR', 'unique ü')])
+assert model.rowCount() == 3 and model.levels.typecode == 'B' and model.timestamps.typecode == 'q'
+assert model.entry(0) == LogEntry(int(stamp.timestamp() * 1e9), 1, 'disk at 91%') and model.level(1) == 'INFO'
+assert model.entry(0).timestamp == stamp
+assert model.message_ids[0] == model.message_ids[1] and model.message(2) == 'unique ü'
+assert model.data(model.index(0, 0)) == '[12:30:45] WARN disk at 91%'
+
+view.add_log_entries([('INFO', f'request {i} served in {i % 97} ms') for i in range(10000)])
+assert model.nbytes / model.rowCount() < 64
+model.clear()
+assert model.rowCount() == 0 and model.nbytes == 8
+"""
+        _run_pyside6_check(check, 'log view')
+        
+        print("✅ Lines stored as int64/uint8/uint32 columns, repeated messages interned")
+        print("✅ Under 64 bytes per line with unique messages")
+        print("✅ PySide6 log view test PASSED\n")
+        return True
+        
+    except Exception as e:
+        print(f"❌ PySide6 log view test FAILED: {e}\n")
+        return False
+
+def test_pyside6_log_file():
+    """Test the memory-mapped log file source of the PySide6 demo log view"""
+    print("Testing PySide6 Log File Source...")
+    
+    try:
+        import importlib.util
+        import tempfile
+        
+        if importlib.util.find_spec('PySide6') is None:
+            print("⚠️  PySide6 not installed - this is optional")
+            print("✅ PySide6 log file source test SKIPPED\n")
+            return True
+        
+        check = """
+import sys
+import time
+from PySide6.QtWidgets import QApplication
+from widgets.log_view import FineUseLogView
+
+path = sys.argv[1]
+with open(path, 'w') as f:
+    f.writelines(f"2024-05-01 12:00:{i % 60:02d},000 {('INFO', 'WARNING', 'ERROR')[i % 3]} request {i}\\n" for i in range(20000))
+
+app = QApplication([])
+view = FineUseLogView()
+model = view.open_file(path, tail_bytes=4096, poll_interval_ms=0)
+assert model.indexing and 0 < model.rowCount() < 200
+assert model.line(model.rowCount() - 1).endswith('WARNING request 19999')
+
+assert model.wait_indexed(10)
+while model.indexing:
+    time.sleep(0.01)
+    app.processEvents()
+assert model.rowCount() == 20000
+assert all(model.line(row).endswith(f' request {row}') for row in (0, 1, 4095, 12345, 19999))
+assert (model.time_text(7), model.LEVELS[model.level_id(7)], model.message(7)) == ('[12:00:07]', 'WARN', 'request 7')
+
+with open(path, 'a') as f:
+    f.write("12:30:00 ERROR appended\\npartial")
+model.poll()
+assert model.rowCount() == 20001 and model.message(20000) == 'appended'
+with open(path, 'w') as f:
+    f.write("rotated\\n")
+model.poll()
+assert model.rowCount() == 1 and model.line(0) == 'rotated'
+model.close()
+"""
+        with tempfile.TemporaryDirectory() as log_dir:
+            _run_pyside6_check(check, 'log file source', os.path.join(log_dir, 'service.log'))
+        
+        print("✅ Tail shown at once, earlier lines indexed on a worker thread")
+        print("✅ Appended lines followed, rotated file reopened")
+        print("✅ PySide6 log file source test PASSED\n")
+        return True
+        
+    except Exception as e:
+        print(f"❌ PySide6 log file source test FAILED: {e}\n")
+        return False
+
+def test_log_handler():
+    """Test the thread-safe logging handler feeding the log terminals"""
+    print("Testing Log Handler...")
+    
+    try:
+        import importlib.util
+        import logging
+        import threading
+        import time
+        from datetime import datetime
+        from fine_use_logging import FineUseLogHandler, SUCCESS
+        
+        batches = []
+        handler = FineUseLogHandler(batches.append, capacity=100, batch_size=40)
+        logger = logging.getLogger('fine_use.test.handler')
+        logger.propagate = False
+        logger.setLevel(logging.DEBUG)
+        logger.addHandler(handler)
+        
+        for level in (logging.DEBUG, logging.INFO, SUCCESS, logging.WARNING, logging.ERROR, logging.CRITICAL):
+            logger.log(level, "level %d", level)
+        assert handler.pending == 6 and not batches
+        assert handler.drain() == 6
+        assert [entry[0] for entry in batches[0]] == ['DEBUG', 'INFO', 'SUCCESS', 'WARN', 'ERROR', 'ERROR']
+        assert batches[0][3][1] == 'level 30' and isinstance(batches[0][3][2], datetime)
+        print("✅ Records drained as (level, message, timestamp) in Fine Use levels")
+        
+        for i in range(250):
+            logger.info("line %d", i)
+        assert handler.pending == 100 and handler.dropped == 150
+        assert handler.drain() == 40 and batches[-1][0][1] == 'line 150'
+        while handler.drain():
+            pass
+        assert batches[-1][-1][1] == 'line 249'
+        assert (handler.emitted, handler.drained, handler.drains, handler.max_batch, handler.high_water) == (256, 106, 4, 40, 100)
+        
+        handler.drop_policy = 'drop-newest'
+        for i in range(150):
+            logger.info("line %d", i)
+        handler.drain(1000)
+        assert handler.dropped == 200 and batches[-1][0][1] == 'line 0' and batches[-1][-1][1] == 'line 99'
+        try:
+            FineUseLogHandler(batches.append, drop_policy='drop-random')
+            raise AssertionError("unknown drop policy accepted")
+        except ValueError:
+            pass
+        print("✅ Queue bounded: drop-oldest keeps the newest, drop-newest the oldest")
+        
+        # Racing evictions and drains count only records actually dropped
+        handler.drop_policy = 'drop-oldest'
+        handler.reset_counters()
+        del batches[:]
+        racers = [threading.Thread(target=lambda: [logger.info("racer") for _ in range(2000)]) for _ in range(4)]
+        for thread in racers:
+            thread.start()
+        while any(thread.is_alive() for thread in racers):
+            handler.drain(7)
+        for thread in racers:
+            thread.join()
+        assert handler.pending <= 100 + len(racers)
+        assert handler.drained + handler.dropped + handler.pending == 8000 == handler.emitted
+        handler.drain(1000)
+        
+        handler.drop_policy = 'block'
+        handler.reset_counters()
+        del batches[:]
+        stop = threading.Event()
+        
+        def drainer():
+            while not stop.is_set():
+                handler.drain()
+                time.sleep(0.001)
+        
+        def producer(n):
+            for i in range(2000):
+                logger.warning("worker %d line %d", n, i)
+        
+        threads = [threading.Thread(target=producer, args=(n,)) for n in range(4)]
+        ui = threading.Thread(target=drainer)
+        ui.start()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        stop.set()
+        ui.join()
+        handler.drain(10000)
+        assert handler.dropped == 0 and handler.drained == 8000 and handler.pending == 0
+        assert sum(len(batch) for batch in batches) == 8000
+        print("✅ Blocking policy loses nothing with 4 producer threads")
+        logger.removeHandler(handler)
+        
+        if importlib.util.find_spec('PySide6') is None:
+            print("⚠️  PySide6 not installed - terminal check skipped")
+            print("✅ Log handler test PASSED\n")
+            return True
+        
+        check = """
+import logging
+import sys
+import threading
+import time
+sys.path.insert(0, '..')
+from PySide6.QtWidgets import QApplication
+from widgets.log_terminal import FineUseLogTerminal
+from fine_use_logging import FineUseLogHandler
+
+app = QApplication([])
+terminal = FineUseLogTerminal(max_lines=100)
+terminal.pause_auto_logging()
+handler = FineUseLogHandler(terminal.add_log_entries).attach_qt(terminal)
+logger = logging.getLogger('fine_use.test')
+logger.propagate = False
+logger.setLevel(logging.INFO)
+logger.addHandler(handler)
+
+worker = threading.Thread(target=lambda: [logger.warning("from worker %d", i) for i in range(500)])
+worker.start()
+worker.join()
+deadline = time.time() + 5
+while terminal.flushed < 500 and time.time() < deadline:
+    time.sleep(0.02)
+    app.processEvents()
+assert handler.drained == 500 and terminal.flushed == 500
+assert terminal.entries[-1].level == 'WARN' and terminal.entries[-1].message == 'from worker 499'
+handler.close()
+"""
+        _run_pyside6_check(check, 'log handler')
+        print("✅ Worker thread logging drained into the PySide6 terminal by a QTimer")
+        
+        print("✅ Log handler test PASSED\n")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Log handler test FAILED: {e}\n")
+        return False
+
+def test_pyside6_log_filter():
+    """Test level and text filtering of the PySide6 demo log view"""
+    print("Testing PySide6 Log Filter...")
+    
+    try:
+        import importlib.util
+        
+        if importlib.util.find_spec('PySide6') is None:
+            print("⚠️  PySide6 not installed - this is optional")
+            print("✅ PySide6 log filter test SKIPPED\n")
+            return True
+        
+        check = """
+from PySide6.QtWidgets import QApplication
+from widgets.log_view import FineUseLogView
+
+app = QApplication([])
+view = FineUseLogView()
+model = view.log_model
+levels = ('INFO', 'WARN', 'ERROR', 'SUCCESS', 'DEBUG')
+entries = [(levels[i % 5], f"request {i} served" if i % 3 else f"Worker {i % 40} TIMEOUT after {i % 7} s")
+           for i in range(50000)]
+entries += [('ERROR', 'Überlauf im Puffer'), ('INFO', 'plain')]
+for first in range(0, len(entries), 3000):
+    view.add_log_entries(entries[first:first + 3000])
+
+def expected(wanted, text):
+    return [i for i, (level, message) in enumerate(entries)
+            if (wanted is None or level in wanted) and text.lower() in message.lower()]
+
+def rows():
+    return [model.source_row(row) for row in range(model.rowCount())]
+
+for wanted, text in ((('ERROR',), ''), (None, 'timeout'), (('WARN', 'DEBUG'), 'worker 3'),
+                     (None, 'request 4999'), (None, 'ed'), (None, 'über'), (None, 'no such text')):
+    view.set_filter(wanted, text)
+    assert rows() == expected(wanted, text), (wanted, text)
+assert model.rowCount() == 0
+
+view.set_filter(['ERROR'], 'timeout')
+count = model.rowCount()
+view.add_log_entries([('ERROR', 'late timeout'), ('INFO', 'late timeout'), ('ERROR', 'late')])
+assert model.rowCount() == count + 1 and model.message(count) == 'late timeout'
+assert model.level(count) == 'ERROR' and model.entry(count).message == 'late timeout'
+view.viewport().repaint()
+
+view.set_filter()
+assert model.rowCount() == len(entries) + 3
+"""
+        _run_pyside6_check(check, 'log filter')
+        
+        print("✅ Level filters and case-insensitive text search match a full scan")
+        print("✅ Streamed lines are matched as they land")
+        print("✅ PySide6 log filter test PASSED\n")
+        return True
+        
+    except Exception as e:
+        print(f"❌ PySide6 log filter test FAILED: {e}\n")
+        return False
+
+def test_pyside6_async_sources():
+    """Test streaming async sources into the PySide6 demo widgets"""
+    print("Testing PySide6 Async Sources...")
+    
+    try:
+        import importlib.util
+        
+        if importlib.util.find_spec('PySide6') is None:
+            print("⚠️  PySide6 not installed - this is optional")
+            print("✅ PySide6 async sources test SKIPPED\n")
+            return True
+        
+        check = """
+import asyncio, os, socket, sys, tempfile, threading, time
+from PySide6.QtCore import SIGNAL, QEventLoop, QTimer
+from PySide6.QtWidgets import QApplication
+from widgets.async_source import FineUseAsyncBridge, subprocess_lines, unix_socket_lines
+from widgets.log_terminal import FineUseLogTerminalWithControls
+from widgets.metric_widget import FineUseMetricWidget
+
+app = QApplication([])
+bridge = FineUseAsyncBridge()
+finished = []
+bridge.source_finished.connect(finished.append)
+
+def wait_for(condition, timeout=10.0):
+    loop, end = QEventLoop(), time.monotonic() + timeout
+    def check():
+        if condition() or time.monotonic() > end:
+            loop.quit()
+    timer = QTimer()
+    timer.timeout.connect(check)
+    timer.start(1)
+    loop.exec()
+    timer.stop()
+    assert condition(), 'timed out'
+
+# Subprocess stdout, one level per line
+controls = FineUseLogTerminalWithControls('TEST')
+script = "for i in range(300): print('ERROR' if i % 3 == 0 else '[warning]', 'line', i)"
+subscription = controls.subscribe(bridge, subprocess_lines(sys.executable, '-u', '-c', script))
+wait_for(lambda: subscription in finished)
+controls.terminal.flush()
+assert subscription.delivered == 300 and subscription.error is None
+assert [(entry.level, entry.message) for entry in controls.terminal.entries][-2:] == [('WARN', 'line 298'), ('WARN', 'line 299')]
+assert not controls.subscriptions
+for _ in range(2):
+    subscription = controls.subscribe(bridge, subprocess_lines(sys.executable, '-c', 'print(1)'))
+    wait_for(lambda: subscription in finished)
+assert bridge.receivers(SIGNAL('source_finished(PyObject)')) == 2  # finished.append and the controls
+
+# Backpressure: an endless generator is suspended while batches are not applied
+produced = 0
+async def endless():
+    global produced
+    while True:
+        produced += 1
+        yield produced
+        if produced % 100 == 0:
+            await asyncio.sleep(0)
+applied = []
+subscription = bridge.subscribe(endless(), applied.extend, batch_size=100, capacity=500, max_batches=2)
+time.sleep(0.3)
+stalled = produced
+assert stalled <= 500 + 2 * 100 + 1, stalled
+wait_for(lambda: len(applied) >= 5000)
+assert applied == list(range(1, len(applied) + 1))
+subscription.pause()
+wait_for(lambda: subscription._held)
+held = len(applied)
+time.sleep(0.1)
+wait_for(lambda: True)
+assert len(applied) == held and produced <= held + 3 * (500 + 2 * 100 + 1)
+subscription.resume()
+wait_for(lambda: len(applied) > held)
+subscription.cancel()
+wait_for(lambda: subscription in finished)
+assert not subscription.running
+
+# Unix socket into a metric widget
+if hasattr(socket, 'AF_UNIX'):
+    path = os.path.join(tempfile.mkdtemp(), 'metrics.sock')
+    server = socket.socket(socket.AF_UNIX)
+    server.bind(path)
+    server.listen(1)
+    def serve():
+        connection, _ = server.accept()
+        connection.sendall(b'10\\n55\\n87\\n')
+        connection.close()
+    threading.Thread(target=serve, daemon=True).start()
+    metric = FineUseMetricWidget('CPU', 40)
+    subscription = metric.subscribe(bridge, unix_socket_lines(path))
+    wait_for(lambda: subscription in finished)
+    assert metric.current_value == 87
+
+# Source errors end the subscription
+async def broken():
+    yield 1
+    raise OSError('pipe closed')
+subscription = bridge.subscribe(broken(), lambda batch: None)
+wait_for(lambda: subscription in finished)
+assert isinstance(subscription.error, OSError)
+
+# A failing sink keeps its error and does not lose other batches
+async def numbers():
+    for i in range(50):
+        yield i
+def fail(batch):
+    raise ValueError('sink failed')
+kept = []
+failing = bridge.subscribe(numbers(), fail, batch_size=10)
+healthy = bridge.subscribe(numbers(), kept.extend, batch_size=10)
+wait_for(lambda: failing in finished and healthy in finished)
+assert isinstance(failing.error, ValueError) and failing.delivered == 50
+assert kept == list(range(50)) and healthy.error is None
+
+# ... also when the batches were held by pause() and applied by resume()
+def fail_first(batch):
+    if batch[0] == 0:
+        failed.extend(batch)
+        raise ValueError('sink failed')
+    resumed.extend(batch)
+failed, resumed = [], []
+paused = bridge.subscribe(numbers(), fail_first, batch_size=10, max_batches=3)
+paused.pause()
+wait_for(lambda: len(paused._held) == 3)
+paused.resume()
+assert isinstance(paused.error, ValueError) and failed and len(resumed) == paused.delivered - len(failed)
+wait_for(lambda: paused in finished)
+assert failed + resumed == list(range(50))
+bridge.stop()
+"""
+        _run_pyside6_check(check, 'async sources')
+        
+        print("✅ Subprocess, Unix socket and async generator sources reach the widgets")
+        print("✅ A stalled UI suspends the producer")
+        print("✅ PySide6 async sources test PASSED\n")
+        return True
+        
+    except Exception as e:
+        print(f"❌ PySide6 async sources test FAILED: {e}\n")
+        return False
+
+def test_log_entry():
+    """Test LogEntry records, line parsing and timestamp formatting"""
+    print("Testing Log Entry Parsing...")
+    
+    try:
+        import time
+        from datetime import datetime
+        from widgets.log_entry import LEVELS, LogEntry, format_line, format_lines, parse_line, parse_lines
+        
+        entry = LogEntry(1_714_564_800_123_000_000, 2, 'disk full')
+        assert not hasattr(entry, '__dict__') and entry.level == 'ERROR'
+        assert entry == LogEntry(1_714_564_800_123_000_000, 2, 'disk full') and entry != LogEntry(0, 2, 'disk full')
+        assert LogEntry.from_record('warning', 'x', datetime(2024, 5, 1, 12, 0, 0)).timestamp == datetime(2024, 5, 1, 12, 0, 0)
+        
+        second = int(time.mktime((2024, 5, 1, 12, 0, 7, 0, 0, -1))) * 10 ** 9
+        parsed = parse_lines([
+            '2024-05-01 12:00:07,123 WARNING request 7',
+            '[2024-05-01T12:00:07.5] error: boom',
+            '12:00:07 SUCCESS done',
+            '[debug] trace',
+            'fatal: disk failure',
+            'Success rate 99%',
+            'worker 7 ERROR not at the start',
+            '',
+        ])
+        assert [(p.level, p.message) for p in parsed] == [
+            ('WARN', 'request 7'), ('ERROR', 'boom'), ('SUCCESS', 'done'), ('DEBUG', 'trace'),
+            ('ERROR', 'disk failure'), ('INFO', 'Success rate 99%'), ('INFO', 'worker 7 ERROR not at the start'),
+            ('INFO', ''),
+        ]
+        assert parsed[0].ts_ns == second + 123_000_000 and parsed[1].ts_ns == second + 500_000_000
+        assert abs(parsed[3].ts_ns - time.time_ns()) < 10 ** 9
+        assert parse_line('2024-05-01 12:00:07 INFO x') == LogEntry(second, 0, 'x')
+        
+        assert format_line(parsed[0]) == '[12:00:07] WARN request 7'
+        assert format_lines(parsed[:2]) == ['[12:00:07] WARN request 7', '[12:00:07] ERROR boom']
+        assert LEVELS[parsed[4].level_id] == 'ERROR' and parse_line('Fatal disk failure').message == 'Fatal disk failure'
+        
+        bad = parse_lines(['2024-02-30 10:00:00 INFO bad date', '99:99:99 weird', '12:00:07 INFO fine'])
+        assert [(b.level, b.message) for b in bad] == [
+            ('INFO', '2024-02-30 10:00:00 INFO bad date'), ('INFO', '99:99:99 weird'), ('INFO', 'fine'),
+        ]
+        assert abs(bad[0].ts_ns - time.time_ns()) < 10 ** 9 and abs(bad[1].ts_ns - time.time_ns()) < 10 ** 9
+        
+        print("✅ Slotted LogEntry records compare by value")
+        print("✅ Stamps, levels and messages parsed from common line layouts")
+        print("✅ Log entry test PASSED\n")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Log entry test FAILED: {e}\n")
+        return False
+
 def main():
     """Run all tests"""
     print("Fine Use Design System - Python Implementation Test")
@@ -156,7 +1409,27 @@ def main():
         test_core_system,
         test_tkinter_implementation,
         test_pyqt_implementation,
-        test_all_themes
+        test_all_themes,
+        test_palette_registry,
+        test_batch_color_math,
+        test_theme_subscriptions,
+        test_theme_contexts,
+        test_stylesheet_cache,
+        test_polish_scheduler,
+        test_palette_render_mode,
+        test_data_table,
+        test_button_grid_bulk,
+        test_lazy_backend_imports,
+        test_theme_file_loader,
+        test_pyside6_theme_registry,
+        test_theme_prewarmer,
+        test_pyside6_log_terminal,
+        test_pyside6_log_view,
+        test_pyside6_log_file,
+        test_log_handler,
+        test_pyside6_log_filter,
+        test_pyside6_async_sources,
+        test_log_entry
     ]
     
     passed = 0